@@ -12,11 +12,15 @@
 */
 #pragma once
 #include "./algorithm/reduce.hpp"
-#include "./centroid.hpp"
 #include "./coordinate_type.hpp"
+#include "./point.hpp"
 #include "./points.hpp"
 #include "./views/zip.hpp"
 
+#include <array>
+#include <tuple>
+#include <type_traits>
+
 namespace tf {
 
 /// @ingroup core_properties
@@ -25,6 +29,10 @@ namespace tf {
 /// Computes H = Σ (x_i - centroid_x) ⊗ (y_i - centroid_y)^T
 /// This is useful for point cloud registration (Procrustes/Kabsch algorithm).
 ///
+/// The centroids and H are accumulated in a single pass over the point
+/// pairs, as sums relative to the first pair. H is then recovered as
+/// Σxy/n - (Σx/n)(Σy/n).
+///
 /// @tparam Policy0 The policy type for the first point set.
 /// @tparam Policy1 The policy type for the second point set.
 /// @param X The source point set.
@@ -38,42 +46,66 @@ auto cross_covariance_of(const tf::points<Policy0> &X,
   static_assert(Dims == tf::coordinate_dims_v<Policy1>,
                 "Point sets must have the same dimensionality");
 
-  auto cx = tf::centroid(X);
-  auto cy = tf::centroid(Y);
+  // Accumulate in double: subtracting the product of means at the end
+  // would otherwise lose digits for float inputs. The pivots keep the sums
+  // small for point sets far from the origin.
+  using S = std::common_type_t<T, double>;
 
-  std::array<std::array<T, Dims>, Dims> H{};
-  for (std::size_t i = 0; i < Dims; ++i)
-    for (std::size_t j = 0; j < Dims; ++j)
-      H[i][j] = T(0);
+  struct sums_t {
+    std::array<S, Dims> x{};
+    std::array<S, Dims> y{};
+    std::array<std::array<S, Dims>, Dims> xy{};
+  };
 
-  H = tf::reduce(
-      tf::zip(X, Y),
-      [&cx, &cy](auto acc, const auto &element) {
-        constexpr std::size_t Dims = tf::coordinate_dims_v<Policy0>;
-        using ElementType = std::decay_t<decltype(element)>;
-        using AccType = std::decay_t<decltype(acc)>;
+  const auto n = X.size();
+  tf::point<tf::coordinate_type<Policy0>, Dims> cx = tf::zero;
+  tf::point<tf::coordinate_type<Policy1>, Dims> cy = tf::zero;
+  if (n > 0) {
+    cx = X[0];
+    cy = Y[0];
+  }
 
-        if constexpr (std::is_same_v<ElementType, AccType>) {
-          // Merging two partial matrices
-          for (std::size_t i = 0; i < Dims; ++i)
+  auto sums = tf::reduce(
+      tf::zip(X, Y),
+      [&cx, &cy](sums_t acc, const auto &element) {
+        if constexpr (std::is_same_v<std::decay_t<decltype(element)>,
+                                     sums_t>) {
+          // Merging two partial sums
+          for (std::size_t i = 0; i < Dims; ++i) {
+            acc.x[i] += element.x[i];
+            acc.y[i] += element.y[i];
             for (std::size_t j = 0; j < Dims; ++j)
-              acc[i][j] += element[i][j];
+              acc.xy[i][j] += element.xy[i][j];
+          }
         } else {
           // Adding a point pair's contribution
           const auto &[x, y] = element;
-          for (std::size_t i = 0; i < Dims; ++i)
+          std::array<S, Dims> dx, dy;
+          for (std::size_t i = 0; i < Dims; ++i) {
+            dx[i] = S(x[i] - cx[i]);
+            dy[i] = S(y[i] - cy[i]);
+          }
+          for (std::size_t i = 0; i < Dims; ++i) {
+            acc.x[i] += dx[i];
+            acc.y[i] += dy[i];
             for (std::size_t j = 0; j < Dims; ++j)
-              acc[i][j] += (x[i] - cx[i]) * (y[j] - cy[j]);
+              acc.xy[i][j] += dx[i] * dy[j];
+          }
         }
-
         return acc;
       },
-      H, tf::checked);
+      sums_t{}, tf::checked);
 
-  auto n = X.size();
+  const S inv_n = S(1) / S(n + (n == 0));
+  std::array<std::array<T, Dims>, Dims> H{};
   for (std::size_t i = 0; i < Dims; ++i)
     for (std::size_t j = 0; j < Dims; ++j)
-      H[i][j] /= n + (n == 0);
+      H[i][j] = T(sums.xy[i][j] * inv_n -
+                  (sums.x[i] * inv_n) * (sums.y[j] * inv_n));
+  for (std::size_t i = 0; i < Dims; ++i) {
+    cx[i] += tf::coordinate_type<Policy0>(sums.x[i] * inv_n);
+    cy[i] += tf::coordinate_type<Policy1>(sums.y[i] * inv_n);
+  }
 
   return std::make_tuple(cx, cy, H);
 }
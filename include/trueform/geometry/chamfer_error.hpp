@@ -12,6 +12,7 @@
  */
 #pragma once
 
+#include "../core/algorithm/parallel_for_each.hpp"
 #include "../core/algorithm/parallel_transform.hpp"
 #include "../core/algorithm/reduce.hpp"
 #include "../core/coordinate_type.hpp"
@@ -19,15 +20,36 @@
 #include "../core/sqrt.hpp"
 #include "../core/transformed.hpp"
 #include "../core/views/take.hpp"
+#include "../core/views/zip.hpp"
 #include "../spatial/neighbor_search.hpp"
+#include "../spatial/partitioning.hpp"
 #include "../spatial/policy/tree.hpp"
-#include "tbb/parallel_sort.h"
+#include "./impl/hinted_neighbor_search.hpp"
 
+#include <cstdint>
 #include <type_traits>
 
 namespace tf {
 
 namespace geometry {
+/// @brief Mean of the distances in buffer, leaving out the largest
+/// outlier_proportion of them.
+///
+/// The selection is skipped when there is nothing to trim; the order of the
+/// buffer is not preserved otherwise.
+template <typename T>
+auto trimmed_mean(tf::buffer<T> &buffer, float outlier_proportion) -> T {
+  auto size = buffer.size();
+  if (outlier_proportion > 0 && outlier_proportion < 1) {
+    size -= std::size_t(size * outlier_proportion);
+    // Only the set of the smallest distances matters, not their order
+    miniselect::pdqselect_branchless(buffer.begin(), buffer.begin() + size,
+                                     buffer.end());
+  }
+  return tf::reduce(tf::take(buffer, size), std::plus<>{}, T(0), tf::checked) /
+         T(size);
+}
+
 template <typename Policy0, typename Policy1>
 auto chamfer_error(const tf::points<Policy0> &A, const tf::points<Policy1> &B,
                    float outlier_proportion,
@@ -35,20 +57,44 @@ auto chamfer_error(const tf::points<Policy0> &A, const tf::points<Policy1> &B,
   static_assert(tf::has_tree_policy<Policy1>,
                 "Target point set B must have a tree policy attached");
 
-  using T = tf::coordinate_type<Policy0, Policy1>;
   buffer.allocate(A.size());
+  // Per-element tree queries: no tf::checked (see hinted_neighbor_search)
   tf::parallel_transform(
       A, buffer,
       [&](const auto &arg) {
         auto query = tf::transformed(arg, tf::frame_of(A));
         auto [id, cpt] = tf::neighbor_search(B, query);
         return tf::sqrt(cpt.metric);
-      },
-      tf::checked);
-  tbb::parallel_sort(buffer);
-  auto size = buffer.size() - std::size_t(buffer.size() * outlier_proportion);
-  return tf::reduce(tf::take(buffer, size), std::plus<>{}, T(0), tf::checked) /
-         size;
+      });
+  return trimmed_mean(buffer, outlier_proportion);
+}
+
+/// @brief Chamfer error with nearest-neighbor searches seeded by hints.
+///
+/// For repeated evaluation on the same samples while A moves slowly, as in
+/// the ICP convergence check. The hints hold the nearest id of each sample
+/// from the previous call and are updated in place; the result is the same
+/// as without them.
+template <typename Policy0, typename Policy1>
+auto chamfer_error(const tf::points<Policy0> &A, const tf::points<Policy1> &B,
+                   float outlier_proportion,
+                   tf::buffer<tf::coordinate_type<Policy0, Policy1>> &buffer,
+                   tf::buffer<std::int64_t> &hints) {
+  static_assert(tf::has_tree_policy<Policy1>,
+                "Target point set B must have a tree policy attached");
+
+  buffer.allocate(A.size());
+  prepare_nearest_hints(hints, A.size());
+  // Per-element tree queries: no tf::checked (see hinted_neighbor_search)
+  tf::parallel_for_each(
+      tf::zip(A, hints, buffer),
+      [&](auto tup) {
+        auto &&[a, hint, out] = tup;
+        auto query = tf::transformed(a, tf::frame_of(A));
+        auto [id, cpt] = hinted_neighbor_search(B, query, hint);
+        out = tf::sqrt(cpt.metric);
+      });
+  return trimmed_mean(buffer, outlier_proportion);
 }
 } // namespace geometry
 
@@ -74,6 +120,7 @@ auto chamfer_error(const tf::points<Policy0> &A, const tf::points<Policy1> &B,
 
   if (outlier_proportion <= 0 || outlier_proportion >= 1) {
     using T = tf::coordinate_type<Policy0, Policy1>;
+    // Per-element tree queries: no tf::checked (see hinted_neighbor_search)
     auto sum = tf::reduce(
         A,
         [&](T acc, const auto &arg) {
@@ -85,7 +132,7 @@ auto chamfer_error(const tf::points<Policy0> &A, const tf::points<Policy1> &B,
             return acc + tf::sqrt(cpt.metric);
           }
         },
-        T(0), tf::checked);
+        T(0));
 
     return sum / T(A.size());
   } else {
@@ -22,6 +22,8 @@
 #include "./icp_config.hpp"
 #include "./icp_state.hpp"
 
+#include <cstdint>
+
 namespace tf {
 
 /// @ingroup geometry_registration
@@ -86,6 +88,11 @@ auto fit_icp_alignment(const tf::points<Policy0> &X,
   T ema = 0;
   T ema_prev = 0;
 
+  // Workspace for the convergence check, reused across iterations. The
+  // hints keep each sample's nearest target id to seed the next search
+  tf::buffer<T> eval_distances;
+  tf::buffer<std::int64_t> eval_hints;
+
   for (std::size_t iter = 0; iter < config.max_iterations; ++iter) {
     std::size_t align_offset = (iter * 17) % stride;
     auto align_ids = make_cyclic_sequence_range(n_samples, n, align_offset);
@@ -117,7 +124,9 @@ auto fit_icp_alignment(const tf::points<Policy0> &X,
           tf::make_points(tf::make_indirect_range(eval_ids, X_plain)) |
           tf::tag(T_total);
 
-      T error = tf::chamfer_error(eval_sample, Y, config.outlier_proportion);
+      T error = geometry::chamfer_error(eval_sample, Y,
+                                        config.outlier_proportion,
+                                        eval_distances, eval_hints);
 
       ema_prev = ema;
       ema = (iter == 0)
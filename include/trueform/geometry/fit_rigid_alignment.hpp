@@ -26,7 +26,8 @@ namespace tf {
 ///
 /// If Y has normals attached (via `tf::tag_normals`), uses point-to-plane
 /// minimization which converges faster in ICP loops. Otherwise uses
-/// point-to-point (Kabsch/SVD) which is optimal for exact correspondences.
+/// point-to-point (Horn in 3D, Kabsch in 2D) which is optimal for exact
+/// correspondences.
 ///
 /// If the point sets have frames attached, the alignment is computed
 /// in world space (i.e., with frames applied).
@@ -22,11 +22,13 @@
 #include "../../spatial/nearest_neighbor.hpp"
 #include "../../spatial/nearest_neighbors.hpp"
 #include "../../spatial/neighbor_search.hpp"
+#include "../../spatial/partitioning.hpp"
 #include "../../spatial/policy/tree.hpp"
 #include "../knn_alignment_config.hpp"
 #include "../knn_alignment_state.hpp"
 #include "./fit_rigid_alignment_point_to_plane.hpp"
-#include "tbb/parallel_sort.h"
+#include "./hinted_neighbor_search.hpp"
+#include "./knn_kernel.hpp"
 
 #include <cmath>
 
@@ -67,17 +69,20 @@ auto fit_knn_alignment_point_to_plane(
   state.target_normals.allocate(X.size());
 
   if (k == 1) {
+    prepare_nearest_hints(state.nearest_hints, X.size());
+    // Per-element tree queries: no tf::checked (see hinted_neighbor_search)
     tf::parallel_for_each(
-        tf::zip(X, state.target_points, state.target_normals),
+        tf::zip(X, state.target_points, state.target_normals,
+                state.nearest_hints),
         [&](auto tup) {
-          auto &&[x, out_pt, out_n] = tup;
-          auto [id, cpt] =
-              tf::neighbor_search(Y, tf::transformed(x, tf::frame_of(X)));
+          auto &&[x, out_pt, out_n, hint] = tup;
+          auto [id, cpt] = hinted_neighbor_search(
+              Y, tf::transformed(x, tf::frame_of(X)), hint);
           out_pt = cpt.point;
           out_n = tf::transformed_normal(Y_normals[id], tf::frame_of(Y));
-        },
-        tf::checked);
+        });
   } else {
+    // Per-element tree queries: no tf::checked (see hinted_neighbor_search)
     tf::parallel_for_each(
         tf::zip(X, state.target_points, state.target_normals),
         [&](auto tup) {
@@ -91,13 +96,13 @@ auto fit_knn_alignment_point_to_plane(
                                                 std::min(k, std::size_t(10)));
           tf::neighbor_search(Y, tf::transformed(x, tf::frame_of(X)), knn);
 
-          auto sig = sigma < 0 ? knn.metric() : sigma * sigma;
+          auto kernel = make_knn_kernel<T>(knn, sigma);
           out_pt = tf::zero;
           tf::vector<T, Dims> normal_sum = tf::zero;
           T w = 0;
 
           for (const auto &neighbor : knn) {
-            auto l_w = std::exp(-neighbor.metric() / (T(2) * sig));
+            auto l_w = kernel(neighbor);
             w += l_w;
             out_pt += neighbor.info.point.as_vector_view() * l_w;
             normal_sum += Y_normals[neighbor.element] * l_w;
@@ -106,8 +111,7 @@ auto fit_knn_alignment_point_to_plane(
           out_pt.as_vector_view() /= w;
           out_n = tf::transformed_normal(tf::make_unit_vector(normal_sum),
                                          tf::frame_of(Y));
-        },
-        tf::checked);
+        });
   }
 
   auto Y_with_normals = state.target_points.points() |
@@ -130,9 +134,9 @@ auto fit_knn_alignment_point_to_plane(
 
 /// @brief Fit rigid transformation with outlier rejection (point-to-plane).
 ///
-/// Computes correspondences, sorts by distance, and fits using only the best
-/// (1 - outlier_proportion) correspondences. Uses indices to preserve source
-/// policies through filtering.
+/// Computes correspondences, selects the (1 - outlier_proportion) closest
+/// ones without fully sorting, and fits using only those. Uses indices to
+/// preserve source policies through filtering.
 ///
 /// @param X Source point set.
 /// @param Y Target point set with tree and normals.
@@ -175,18 +179,21 @@ auto fit_knn_alignment_point_to_plane(
   tf::parallel_iota(state.src_indices, 0);
 
   if (k == 1) {
+    prepare_nearest_hints(state.nearest_hints, n);
+    // Per-element tree queries: no tf::checked (see hinted_neighbor_search)
     tf::parallel_for_each(
-        tf::zip(X, state.target_points, state.target_normals, state.distances),
+        tf::zip(X, state.target_points, state.target_normals, state.distances,
+                state.nearest_hints),
         [&](auto tup) {
-          auto &&[x, tgt_out, n_out, dist_out] = tup;
+          auto &&[x, tgt_out, n_out, dist_out, hint] = tup;
           auto query = tf::transformed(x, tf::frame_of(X));
-          auto [id, cpt] = tf::neighbor_search(Y, query);
+          auto [id, cpt] = hinted_neighbor_search(Y, query, hint);
           tgt_out = cpt.point;
           n_out = tf::transformed_normal(Y_normals[id], tf::frame_of(Y));
           dist_out = cpt.metric;
-        },
-        tf::checked);
+        });
   } else {
+    // Per-element tree queries: no tf::checked (see hinted_neighbor_search)
     tf::parallel_for_each(
         tf::zip(X, state.target_points, state.target_normals, state.distances),
         [&](auto tup) {
@@ -200,13 +207,13 @@ auto fit_knn_alignment_point_to_plane(
           auto query = tf::transformed(x, tf::frame_of(X));
           tf::neighbor_search(Y, query, knn);
 
-          auto sig = sigma < 0 ? knn.metric() : sigma * sigma;
+          auto kernel = make_knn_kernel<T>(knn, sigma);
           tf::point<T, Dims> weighted_pt = tf::zero;
           tf::vector<T, Dims> normal_sum = tf::zero;
           T w = 0;
 
           for (const auto &neighbor : knn) {
-            auto l_w = std::exp(-neighbor.metric() / (T(2) * sig));
+            auto l_w = kernel(neighbor);
             w += l_w;
             weighted_pt += neighbor.info.point.as_vector_view() * l_w;
             normal_sum += Y_normals[neighbor.element] * l_w;
@@ -217,15 +224,15 @@ auto fit_knn_alignment_point_to_plane(
           n_out = tf::transformed_normal(tf::make_unit_vector(normal_sum),
                                          tf::frame_of(Y));
           dist_out = knn_buffer.front().metric();
-        },
-        tf::checked);
+        });
   }
 
-  tbb::parallel_sort(
-      state.src_indices.begin(), state.src_indices.end(),
-      [&](int a, int b) { return state.distances[a] < state.distances[b]; });
-
+  // Select the keep_n closest correspondences; their order is irrelevant
   auto keep_n = n - std::size_t(n * config.outlier_proportion);
+  miniselect::pdqselect_branchless(
+      state.src_indices.begin(), state.src_indices.begin() + keep_n,
+      state.src_indices.end(),
+      [&](int a, int b) { return state.distances[a] < state.distances[b]; });
   auto kept_indices = tf::take(state.src_indices, keep_n);
 
   auto filtered_target =
@@ -13,6 +13,7 @@
 #pragma once
 
 #include "../../core/algorithm/parallel_iota.hpp"
+#include "../../core/algorithm/reduce.hpp"
 #include "../../core/coordinate_type.hpp"
 #include "../../core/frame_of.hpp"
 #include "../../core/views/indirect_range.hpp"
@@ -21,16 +22,110 @@
 #include "../../spatial/nearest_neighbor.hpp"
 #include "../../spatial/nearest_neighbors.hpp"
 #include "../../spatial/neighbor_search.hpp"
+#include "../../spatial/partitioning.hpp"
 #include "../../spatial/policy/tree.hpp"
 #include "../knn_alignment_config.hpp"
 #include "../knn_alignment_state.hpp"
 #include "./fit_rigid_alignment_point_to_point.hpp"
-#include "tbb/parallel_sort.h"
+#include "./hinted_neighbor_search.hpp"
+#include "./knn_kernel.hpp"
 
+#include <array>
 #include <cmath>
+#include <type_traits>
 
 namespace tf::geometry {
 
+/// @brief Fit rigid transformation using nearest-neighbor correspondences
+/// (point-to-point, k = 1).
+///
+/// Specialization of the k-NN fit for classic ICP. The correspondence search
+/// and the cross-covariance accumulation run in one pass, so no
+/// correspondence buffer is written and no kernel weights are evaluated.
+/// Sums are taken relative to the first source point, which keeps the
+/// single-pass covariance well conditioned for data far from the origin.
+///
+/// @param X Source point set.
+/// @param Y Target point set with tree (searched for neighbors).
+/// @param hints Nearest target ids from a previous call; updated in place.
+/// @return Rigid transform mapping X -> Y.
+template <typename Policy0, typename Policy1>
+auto fit_nearest_alignment_point_to_point(const tf::points<Policy0> &X,
+                                          const tf::points<Policy1> &Y,
+                                          tf::buffer<std::int64_t> &hints) {
+  using T = tf::coordinate_type<Policy0, Policy1>;
+  constexpr std::size_t Dims = tf::coordinate_dims_v<Policy0>;
+  static_assert(Dims == tf::coordinate_dims_v<Policy1>,
+                "Point sets must have the same dimensionality");
+  static_assert(tf::has_tree_policy<Policy1>,
+                "Target point set Y must have a tree policy attached");
+
+  // Accumulate in double: the single-pass form subtracts the product of
+  // means at the end and would otherwise lose digits for float inputs.
+  using S = std::common_type_t<T, double>;
+
+  struct sums_t {
+    std::array<S, Dims> x{};
+    std::array<S, Dims> y{};
+    std::array<std::array<S, Dims>, Dims> xy{};
+  };
+
+  const auto n = X.size();
+  tf::point<T, Dims> pivot = tf::zero;
+  if (n > 0)
+    pivot = tf::transformed(X[0], tf::frame_of(X));
+  prepare_nearest_hints(hints, n);
+
+  // Per-element tree queries: no tf::checked (see hinted_neighbor_search)
+  auto sums = tf::reduce(
+      tf::zip(X, hints),
+      [&](sums_t acc, const auto &element) {
+        if constexpr (std::is_same_v<std::decay_t<decltype(element)>,
+                                     sums_t>) {
+          // Merging two partial sums
+          for (std::size_t i = 0; i < Dims; ++i) {
+            acc.x[i] += element.x[i];
+            acc.y[i] += element.y[i];
+            for (std::size_t j = 0; j < Dims; ++j)
+              acc.xy[i][j] += element.xy[i][j];
+          }
+        } else {
+          // Adding a correspondence's contribution
+          auto &&[x, hint] = element;
+          auto query = tf::transformed(x, tf::frame_of(X));
+          auto [id, cpt] = hinted_neighbor_search(Y, query, hint);
+          std::array<S, Dims> dx, dy;
+          for (std::size_t i = 0; i < Dims; ++i) {
+            dx[i] = S(query[i] - pivot[i]);
+            dy[i] = S(cpt.point[i] - pivot[i]);
+          }
+          for (std::size_t i = 0; i < Dims; ++i) {
+            acc.x[i] += dx[i];
+            acc.y[i] += dy[i];
+            for (std::size_t j = 0; j < Dims; ++j)
+              acc.xy[i][j] += dx[i] * dy[j];
+          }
+        }
+        return acc;
+      },
+      sums_t{});
+
+  const S inv_n = S(1) / S(n + (n == 0));
+  tf::point<T, Dims> cx = pivot;
+  tf::point<T, Dims> cy = pivot;
+  std::array<std::array<T, Dims>, Dims> H{};
+  for (std::size_t i = 0; i < Dims; ++i) {
+    cx[i] += T(sums.x[i] * inv_n);
+    cy[i] += T(sums.y[i] * inv_n);
+  }
+  for (std::size_t i = 0; i < Dims; ++i)
+    for (std::size_t j = 0; j < Dims; ++j)
+      H[i][j] = T(sums.xy[i][j] * inv_n -
+                  (sums.x[i] * inv_n) * (sums.y[j] * inv_n));
+
+  return tf::geometry::rigid_alignment_from_cross_covariance(cx, cy, H);
+}
+
 /// @brief Fit rigid transformation using k-NN correspondences (point-to-point).
 ///
 /// For each point in X, finds the k nearest neighbors in Y and computes a
@@ -57,45 +152,36 @@ auto fit_knn_alignment_point_to_point(
   static_assert(tf::has_tree_policy<Policy1>,
                 "Target point set Y must have a tree policy attached");
 
+  if (k == 1)
+    return fit_nearest_alignment_point_to_point(X, Y, state.nearest_hints);
+
   state.target_points.allocate(X.size());
 
-  if (k == 1) {
-    tf::parallel_for_each(
-        tf::zip(X, state.target_points),
-        [&](auto tup) {
-          auto &&[x, out] = tup;
-          auto [id, cpt] =
-              tf::neighbor_search(Y, tf::transformed(x, tf::frame_of(X)));
-          out = cpt.point;
-        },
-        tf::checked);
-  } else {
-    tf::parallel_for_each(
-        tf::zip(X, state.target_points),
-        [&](auto tup) {
-          constexpr std::size_t Dims = tf::coordinate_dims_v<Policy0>;
-          auto &&[x, out] = tup;
-          std::array<tf::nearest_neighbor<typename Policy1::index_type,
-                                          tf::coordinate_type<Policy1>, Dims>,
-                     10>
-              knn_buffer;
-          auto knn = tf::make_nearest_neighbors(knn_buffer.begin(),
-                                                std::min(k, std::size_t(10)));
-          tf::neighbor_search(Y, tf::transformed(x, tf::frame_of(X)), knn);
+  // Per-element tree queries: no tf::checked (see hinted_neighbor_search)
+  tf::parallel_for_each(
+      tf::zip(X, state.target_points),
+      [&](auto tup) {
+        constexpr std::size_t Dims = tf::coordinate_dims_v<Policy0>;
+        auto &&[x, out] = tup;
+        std::array<tf::nearest_neighbor<typename Policy1::index_type,
+                                        tf::coordinate_type<Policy1>, Dims>,
+                   10>
+            knn_buffer;
+        auto knn = tf::make_nearest_neighbors(knn_buffer.begin(),
+                                              std::min(k, std::size_t(10)));
+        tf::neighbor_search(Y, tf::transformed(x, tf::frame_of(X)), knn);
 
-          auto sig = sigma < 0 ? knn.metric() : sigma * sigma;
-          out = tf::zero;
-          T w = 0;
+        auto kernel = make_knn_kernel<T>(knn, sigma);
+        out = tf::zero;
+        T w = 0;
 
-          for (const auto &neighbor : knn) {
-            auto l_w = std::exp(-neighbor.metric() / (T(2) * sig));
-            w += l_w;
-            out += neighbor.info.point.as_vector_view() * l_w;
-          }
-          out.as_vector_view() /= w;
-        },
-        tf::checked);
-  }
+        for (const auto &neighbor : knn) {
+          auto l_w = kernel(neighbor);
+          w += l_w;
+          out += neighbor.info.point.as_vector_view() * l_w;
+        }
+        out.as_vector_view() /= w;
+      });
 
   return tf::geometry::fit_rigid_alignment_point_to_point(
       X, state.target_points.points());
@@ -115,9 +201,9 @@ auto fit_knn_alignment_point_to_point(
 
 /// @brief Fit rigid transformation with outlier rejection (point-to-point).
 ///
-/// Computes correspondences, sorts by distance, and fits using only the best
-/// (1 - outlier_proportion) correspondences. Uses indices to preserve source
-/// policies through filtering.
+/// Computes correspondences, selects the (1 - outlier_proportion) closest
+/// ones without fully sorting, and fits using only those. Uses indices to
+/// preserve source policies through filtering.
 ///
 /// @param X Source point set.
 /// @param Y Target point set with tree.
@@ -153,17 +239,19 @@ auto fit_knn_alignment_point_to_point(
   tf::parallel_iota(state.src_indices, 0);
 
   if (k == 1) {
+    prepare_nearest_hints(state.nearest_hints, n);
+    // Per-element tree queries: no tf::checked (see hinted_neighbor_search)
     tf::parallel_for_each(
-        tf::zip(X, state.target_points, state.distances),
+        tf::zip(X, state.target_points, state.distances, state.nearest_hints),
         [&](auto tup) {
-          auto &&[x, tgt_out, dist_out] = tup;
+          auto &&[x, tgt_out, dist_out, hint] = tup;
           auto query = tf::transformed(x, tf::frame_of(X));
-          auto [id, cpt] = tf::neighbor_search(Y, query);
+          auto [id, cpt] = hinted_neighbor_search(Y, query, hint);
           tgt_out = cpt.point;
           dist_out = cpt.metric;
-        },
-        tf::checked);
+        });
   } else {
+    // Per-element tree queries: no tf::checked (see hinted_neighbor_search)
     tf::parallel_for_each(
         tf::zip(X, state.target_points, state.distances),
         [&](auto tup) {
@@ -177,12 +265,12 @@ auto fit_knn_alignment_point_to_point(
           auto query = tf::transformed(x, tf::frame_of(X));
           tf::neighbor_search(Y, query, knn);
 
-          auto sig = sigma < 0 ? knn.metric() : sigma * sigma;
+          auto kernel = make_knn_kernel<T>(knn, sigma);
           tf::point<T, Dims> weighted_pt = tf::zero;
           T w = 0;
 
           for (const auto &neighbor : knn) {
-            auto l_w = std::exp(-neighbor.metric() / (T(2) * sig));
+            auto l_w = kernel(neighbor);
             w += l_w;
             weighted_pt += neighbor.info.point.as_vector_view() * l_w;
           }
@@ -190,15 +278,15 @@ auto fit_knn_alignment_point_to_point(
 
           tgt_out = weighted_pt;
           dist_out = knn_buffer.front().metric();
-        },
-        tf::checked);
+        });
   }
 
-  tbb::parallel_sort(
-      state.src_indices.begin(), state.src_indices.end(),
-      [&](int a, int b) { return state.distances[a] < state.distances[b]; });
-
+  // Select the keep_n closest correspondences; their order is irrelevant
   auto keep_n = n - std::size_t(n * config.outlier_proportion);
+  miniselect::pdqselect_branchless(
+      state.src_indices.begin(), state.src_indices.begin() + keep_n,
+      state.src_indices.end(),
+      [&](int a, int b) { return state.distances[a] < state.distances[b]; });
   auto kept_indices = tf::take(state.src_indices, keep_n);
 
   auto filtered_source =
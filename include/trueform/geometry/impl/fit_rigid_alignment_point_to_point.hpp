@@ -23,9 +23,192 @@
 #include "../../core/transformed_cross_covariance.hpp"
 #include "../../core/vector.hpp"
 
+#include <array>
+#include <cmath>
+#include <type_traits>
+
 namespace tf::geometry {
 
-/// @brief Point-to-point rigid alignment using Kabsch/SVD algorithm.
+/// @brief Rotation maximizing tr(R H) for a 3x3 cross-covariance (Horn).
+///
+/// The optimal rotation is the unit quaternion of the largest eigenvalue of
+/// Horn's symmetric 4x4 matrix built from H, found with cyclic Jacobi
+/// sweeps. Unlike the pseudo-inverse form of Kabsch, this always yields a
+/// proper rotation, also when H is rank deficient (planar point sets), and
+/// needs no reflection fix.
+///
+/// @param H Cross-covariance of the centered source and target points.
+/// @return Row-major rotation matrix.
+template <typename S>
+auto horn_rotation(const std::array<std::array<S, 3>, 3> &H)
+    -> std::array<std::array<S, 3>, 3> {
+  const S xx = H[0][0], xy = H[0][1], xz = H[0][2];
+  const S yx = H[1][0], yy = H[1][1], yz = H[1][2];
+  const S zx = H[2][0], zy = H[2][1], zz = H[2][2];
+
+  std::array<std::array<S, 4>, 4> N{{
+      {xx + yy + zz, yz - zy, zx - xz, xy - yx},
+      {yz - zy, xx - yy - zz, xy + yx, zx + xz},
+      {zx - xz, xy + yx, -xx + yy - zz, yz + zy},
+      {xy - yx, zx + xz, yz + zy, -xx - yy + zz},
+  }};
+  std::array<std::array<S, 4>, 4> V{};
+  for (std::size_t i = 0; i < 4; ++i)
+    V[i][i] = S(1);
+
+  S scale = 0;
+  for (const auto &row : N)
+    for (auto v : row)
+      scale += v * v;
+
+  for (int sweep = 0; sweep < 16; ++sweep) {
+    S off = 0;
+    for (std::size_t p = 0; p < 4; ++p)
+      for (std::size_t q = p + 1; q < 4; ++q)
+        off += N[p][q] * N[p][q];
+    if (off <= scale * tf::epsilon2<S>)
+      break;
+
+    for (std::size_t p = 0; p < 4; ++p) {
+      for (std::size_t q = p + 1; q < 4; ++q) {
+        if (N[p][q] == S(0))
+          continue;
+        // Rotation in the (p, q) plane that zeroes N[p][q]
+        const S theta = (N[q][q] - N[p][p]) / (S(2) * N[p][q]);
+        const S t = (theta >= S(0) ? S(1) : S(-1)) /
+                    (std::abs(theta) + tf::sqrt(theta * theta + S(1)));
+        const S c = S(1) / tf::sqrt(t * t + S(1));
+        const S sn = t * c;
+        for (std::size_t k = 0; k < 4; ++k) {
+          const S kp = N[k][p], kq = N[k][q];
+          N[k][p] = c * kp - sn * kq;
+          N[k][q] = sn * kp + c * kq;
+        }
+        for (std::size_t k = 0; k < 4; ++k) {
+          const S pk = N[p][k], qk = N[q][k];
+          N[p][k] = c * pk - sn * qk;
+          N[q][k] = sn * pk + c * qk;
+        }
+        for (std::size_t k = 0; k < 4; ++k) {
+          const S kp = V[k][p], kq = V[k][q];
+          V[k][p] = c * kp - sn * kq;
+          V[k][q] = sn * kp + c * kq;
+        }
+      }
+    }
+  }
+
+  std::size_t best = 0;
+  for (std::size_t i = 1; i < 4; ++i)
+    if (N[i][i] > N[best][best])
+      best = i;
+
+  S w = V[0][best], x = V[1][best], y = V[2][best], z = V[3][best];
+  const S inv_norm = S(1) / tf::sqrt(w * w + x * x + y * y + z * z);
+  w *= inv_norm;
+  x *= inv_norm;
+  y *= inv_norm;
+  z *= inv_norm;
+
+  return {{
+      {S(1) - S(2) * (y * y + z * z), S(2) * (x * y - w * z),
+       S(2) * (x * z + w * y)},
+      {S(2) * (x * y + w * z), S(1) - S(2) * (x * x + z * z),
+       S(2) * (y * z - w * x)},
+      {S(2) * (x * z - w * y), S(2) * (y * z + w * x),
+       S(1) - S(2) * (x * x + y * y)},
+  }};
+}
+
+/// @brief Rigid transform from world-space centroids and cross-covariance.
+///
+/// Solves for the rotation maximizing tr(R H) and the translation mapping
+/// cx_world onto cy_world. In 3D this uses Horn's quaternion method, in 2D
+/// the Kabsch solution.
+///
+/// @param cx_world Centroid of the source points.
+/// @param cy_world Centroid of the target points.
+/// @param H Cross-covariance of the centered source and target points.
+/// @return A transformation that best aligns the source to the target.
+template <typename T, std::size_t Dims, typename Point0, typename Point1>
+auto rigid_alignment_from_cross_covariance(
+    const Point0 &cx_world, const Point1 &cy_world,
+    const std::array<std::array<T, Dims>, Dims> &H) {
+  // H is reduced in the storage precision of the points; the Dims x Dims
+  // solve is promoted to double so that float inputs do not lose accuracy in
+  // the eigen decomposition (of Horn's matrix in 3D, of HtH in 2D).
+  using S = std::common_type_t<T, double>;
+
+  std::array<std::array<S, Dims>, Dims> Hs{};
+  for (std::size_t i = 0; i < Dims; ++i)
+    for (std::size_t j = 0; j < Dims; ++j)
+      Hs[i][j] = S(H[i][j]);
+
+  auto make_transformation = [&](const auto &R) {
+    tf::transformation<T, Dims> out;
+    for (std::size_t i = 0; i < Dims; ++i)
+      for (std::size_t j = 0; j < Dims; ++j)
+        out(i, j) = T(R[i][j]);
+
+    for (std::size_t i = 0; i < Dims; ++i) {
+      out(i, Dims) = cy_world[i];
+      for (std::size_t j = 0; j < Dims; ++j)
+        out(i, Dims) -= out(i, j) * cx_world[j];
+    }
+    return out;
+  };
+
+  if constexpr (Dims == 3) {
+    return make_transformation(horn_rotation(Hs));
+  } else {
+    std::array<std::array<S, Dims>, Dims> HtH{};
+    for (std::size_t i = 0; i < Dims; ++i)
+      for (std::size_t j = 0; j < Dims; ++j)
+        for (std::size_t k = 0; k < Dims; ++k)
+          HtH[i][j] += Hs[k][i] * Hs[k][j];
+
+    auto [sigma_sq, _, V] = tf::svd_of_symmetric(HtH);
+
+    std::array<S, Dims> inv_sigma{};
+    const S threshold = sigma_sq[0] * tf::epsilon2<S>;
+    for (std::size_t col = 0; col < Dims; ++col) {
+      inv_sigma[col] = (sigma_sq[col] > threshold)
+                           ? S(1) / tf::sqrt(sigma_sq[col])
+                           : S(0);
+    }
+
+    // R = sum_col flip_col * V_col (H V_col)^T / sigma_col
+    auto build_rotation = [&](bool flip_last) {
+      std::array<std::array<S, Dims>, Dims> R{};
+      for (std::size_t col = 0; col < Dims; ++col) {
+        const S flip = (flip_last && col + 1 == Dims) ? S(-1) : S(1);
+
+        std::array<S, Dims> u{};
+        for (std::size_t i = 0; i < Dims; ++i)
+          for (std::size_t k = 0; k < Dims; ++k)
+            u[i] += Hs[i][k] * V[col][k];
+
+        const S a = inv_sigma[col] * flip;
+        for (std::size_t i = 0; i < Dims; ++i)
+          for (std::size_t j = 0; j < Dims; ++j)
+            R[i][j] += V[col][i] * (a * u[j]);
+      }
+      return R;
+    };
+
+    auto R = build_rotation(false);
+
+    const S det = R[0][0] * R[1][1] - R[0][1] * R[1][0];
+
+    // Reflection fix: if det<0, flip the smallest singular direction
+    if (det < S(0))
+      R = build_rotation(true);
+
+    return make_transformation(R);
+  }
+}
+
+/// @brief Point-to-point rigid alignment (Horn in 3D, Kabsch in 2D).
 ///
 /// Computes the optimal rigid transformation T such that T(X) ≈ Y
 /// by minimizing the point-to-point distance: sum_i ||T(x_i) - y_i||².
@@ -38,7 +221,6 @@ namespace tf::geometry {
 template <typename Policy0, typename Policy1>
 auto fit_rigid_alignment_point_to_point(const tf::points<Policy0> &X_,
                                         const tf::points<Policy1> &Y_) {
-  using T = tf::coordinate_type<Policy0, Policy1>;
   constexpr std::size_t Dims = tf::coordinate_dims_v<Policy0>;
   static_assert(Dims == tf::coordinate_dims_v<Policy1>,
                 "Point sets must have the same dimensionality");
@@ -56,81 +238,7 @@ auto fit_rigid_alignment_point_to_point(const tf::points<Policy0> &X_,
   auto cx_world = tf::transformed(cx, tX);
   auto cy_world = tf::transformed(cy, tY);
 
-  std::array<std::array<T, Dims>, Dims> HtH{};
-  for (std::size_t i = 0; i < Dims; ++i)
-    for (std::size_t j = 0; j < Dims; ++j)
-      for (std::size_t k = 0; k < Dims; ++k)
-        HtH[i][j] += H[k][i] * H[k][j];
-
-  auto [sigma_sq, _, V] = tf::svd_of_symmetric(HtH);
-
-  tf::transformation<T, Dims> out;
-  for (std::size_t i = 0; i < Dims; ++i)
-    for (std::size_t j = 0; j < Dims; ++j)
-      out(i, j) = T(0);
-
-  std::array<T, Dims> inv_sigma{};
-  const T threshold = sigma_sq[0] * tf::epsilon2<T>;
-  for (std::size_t col = 0; col < Dims; ++col) {
-    inv_sigma[col] = (sigma_sq[col] > threshold)
-                         ? T(1) / tf::sqrt(sigma_sq[col])
-                         : T(0);
-  }
-
-  for (std::size_t col = 0; col < Dims; ++col) {
-    tf::vector<T, Dims> u;
-    for (std::size_t i = 0; i < Dims; ++i) {
-      u[i] = T(0);
-      for (std::size_t k = 0; k < Dims; ++k)
-        u[i] += H[i][k] * V[col][k];
-    }
-
-    const T a = inv_sigma[col];
-    for (std::size_t i = 0; i < Dims; ++i)
-      for (std::size_t j = 0; j < Dims; ++j)
-        out(i, j) += V[col][i] * (a * u[j]);
-  }
-
-  T det;
-  if constexpr (Dims == 2) {
-    det = out(0, 0) * out(1, 1) - out(0, 1) * out(1, 0);
-  } else {
-    det = out(0, 0) * (out(1, 1) * out(2, 2) - out(1, 2) * out(2, 1)) -
-          out(0, 1) * (out(1, 0) * out(2, 2) - out(1, 2) * out(2, 0)) +
-          out(0, 2) * (out(1, 0) * out(2, 1) - out(1, 1) * out(2, 0));
-  }
-
-  // Reflection fix: if det<0, flip the smallest singular direction (last col)
-  if (det < T(0)) {
-    // Rebuild R = V * U^T with a sign flip on the last column contribution
-    for (std::size_t i = 0; i < Dims; ++i)
-      for (std::size_t j = 0; j < Dims; ++j)
-        out(i, j) = T(0);
-
-    for (std::size_t col = 0; col < Dims; ++col) {
-      const T flip = (col + 1 == Dims) ? T(-1) : T(1);
-
-      tf::vector<T, Dims> u;
-      for (std::size_t i = 0; i < Dims; ++i) {
-        u[i] = T(0);
-        for (std::size_t k = 0; k < Dims; ++k)
-          u[i] += H[i][k] * V[col][k];
-      }
-
-      const T a = inv_sigma[col] * flip;
-      for (std::size_t i = 0; i < Dims; ++i)
-        for (std::size_t j = 0; j < Dims; ++j)
-          out(i, j) += V[col][i] * (a * u[j]);
-    }
-  }
-
-  for (std::size_t i = 0; i < Dims; ++i) {
-    out(i, Dims) = cy_world[i];
-    for (std::size_t j = 0; j < Dims; ++j)
-      out(i, Dims) -= out(i, j) * cx_world[j];
-  }
-
-  return out;
+  return rigid_alignment_from_cross_covariance(cx_world, cy_world, H);
 }
 
 } // namespace tf::geometry
@@ -0,0 +1,76 @@
+/*
+ * Copyright (c) 2025 XLAB
+ * All rights reserved.
+ *
+ * This file is part of trueform (trueform.polydera.com)
+ *
+ * Licensed for noncommercial use under the PolyForm Noncommercial
+ * License 1.0.0.
+ * Commercial licensing available via info@polydera.com.
+ *
+ * Author: Žiga Sajovic
+ */
+#pragma once
+
+#include "../../core/algorithm/parallel_fill.hpp"
+#include "../../core/buffer.hpp"
+#include "../../core/coordinate_type.hpp"
+#include "../../core/distance.hpp"
+#include "../../core/frame_of.hpp"
+#include "../../core/transformed.hpp"
+#include "../../spatial/neighbor_search.hpp"
+
+#include <cmath>
+#include <cstdint>
+#include <limits>
+
+namespace tf::geometry {
+
+/// @brief Size the nearest-id hints for n queries, keeping them if the size
+/// matches.
+///
+/// Hints left from a previous call are only used to bound searches, so
+/// stale ones cost speed, never correctness.
+inline auto prepare_nearest_hints(tf::buffer<std::int64_t> &hints,
+                                  std::size_t n) -> void {
+  if (hints.size() == n)
+    return;
+  hints.allocate(n);
+  tf::parallel_fill(hints, std::int64_t(-1));
+}
+
+/// @brief Nearest neighbor search seeded with a previous result.
+///
+/// In iterative alignment the nearest target point of a query rarely moves
+/// far between iterations. The distance to the previously found point
+/// bounds the search radius, so the traversal prunes every subtree farther
+/// than that; the result equals an unseeded search. The hint is updated
+/// with the new nearest id.
+///
+/// Each query is a tree traversal, so loops of them are worth running in
+/// parallel without the tf::checked cutoff, even for small samples.
+///
+/// @param Y Target point set with tree.
+/// @param query Query point in world coordinates.
+/// @param hint Previous nearest id of this query, or -1.
+/// @return The nearest neighbor, as returned by @ref tf::neighbor_search.
+template <typename Policy, typename Point>
+auto hinted_neighbor_search(const tf::points<Policy> &Y, const Point &query,
+                            std::int64_t &hint) {
+  using T = tf::coordinate_type<Policy>;
+  if (hint >= 0 && std::size_t(hint) < Y.size()) {
+    auto d2 = tf::distance2(tf::transformed(Y[hint], tf::frame_of(Y)), query);
+    // Slack keeps the hinted point itself inside the radius under rounding
+    auto radius = std::sqrt(d2) * T(1.0001) + std::numeric_limits<T>::min();
+    auto result = tf::neighbor_search(Y, query, radius);
+    if (result) {
+      hint = result.element;
+      return result;
+    }
+  }
+  auto result = tf::neighbor_search(Y, query);
+  hint = result.element;
+  return result;
+}
+
+} // namespace tf::geometry
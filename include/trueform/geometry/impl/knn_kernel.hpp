@@ -0,0 +1,37 @@
+/*
+ * Copyright (c) 2025 XLAB
+ * All rights reserved.
+ *
+ * This file is part of trueform (trueform.polydera.com)
+ *
+ * Licensed for noncommercial use under the PolyForm Noncommercial
+ * License 1.0.0.
+ * Commercial licensing available via info@polydera.com.
+ *
+ * Author: Žiga Sajovic
+ */
+#pragma once
+
+#include <cmath>
+
+namespace tf::geometry {
+
+/// @brief Gaussian kernel weighting the neighbors of one k-NN query.
+///
+/// Adaptive sigma is the k-th neighbor distance, already known from the
+/// search; the kernel denominator is folded once per query point.
+///
+/// @tparam T The coordinate type of the weights.
+/// @param knn The neighbors found for the query.
+/// @param sigma Gaussian kernel width. If negative, uses adaptive scaling.
+/// @return A callable mapping a neighbor to its (unnormalized) weight.
+template <typename T, typename KNN, typename S>
+auto make_knn_kernel(const KNN &knn, S sigma) {
+  auto sig = sigma < 0 ? knn.metric() : sigma * sigma;
+  auto neg_inv_two_sig = T(-1) / (T(2) * sig);
+  return [neg_inv_two_sig](const auto &neighbor) {
+    return std::exp(neighbor.metric() * neg_inv_two_sig);
+  };
+}
+
+} // namespace tf::geometry
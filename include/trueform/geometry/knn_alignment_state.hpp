@@ -19,6 +19,7 @@
 #include "../core/unit_vectors_buffer.hpp"
 #include "./impl/fit_rigid_alignment_point_to_plane.hpp"
 
+#include <cstdint>
 #include <type_traits>
 
 namespace tf::geometry {
@@ -31,6 +32,9 @@ template <typename T, std::size_t Dims> struct knn_alignment_point_state {
   tf::buffer<int> src_indices;
   tf::points_buffer<T, Dims> target_points;
   tf::buffer<T> distances;
+  /// Nearest target id per source point from the previous call, used to
+  /// bound the next k = 1 search.
+  tf::buffer<std::int64_t> nearest_hints;
 };
 
 /// @brief Workspace for point-to-plane kNN alignment.
@@ -43,6 +47,9 @@ template <typename T, std::size_t Dims> struct knn_alignment_plane_state {
   tf::points_buffer<T, Dims> target_points;
   tf::unit_vectors_buffer<T, Dims> target_normals;
   tf::buffer<T> distances;
+  /// Nearest target id per source point from the previous call, used to
+  /// bound the next k = 1 search.
+  tf::buffer<std::int64_t> nearest_hints;
   plane_alignment_state<T> alignment_state;
 };
 } // namespace tf::geometry
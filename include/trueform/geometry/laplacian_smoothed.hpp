@@ -12,16 +12,20 @@
  */
 #pragma once
 
-#include "../core/algorithm/parallel_for_each.hpp"
 #include "../core/algorithm/parallel_copy.hpp"
+#include "../core/algorithm/parallel_for_each.hpp"
+#include "../core/buffer.hpp"
+#include "../core/checked.hpp"
 #include "../core/coordinate_type.hpp"
 #include "../core/points_buffer.hpp"
 #include "../core/vector.hpp"
-#include "../core/views/block_indirect_range.hpp"
 #include "../core/views/zip.hpp"
 #include "../topology/policy/vertex_link.hpp"
+#include "tbb/parallel_for.h"
+#include "tbb/partitioner.h"
 
 #include <algorithm>
+#include <array>
 #include <cstddef>
 
 namespace tf {
@@ -46,6 +50,84 @@ auto laplacian_smoothed(const tf::point_like<Dims, Policy0> &pt,
   return out;
 }
 
+namespace geometry {
+
+/// @brief Reciprocal of every vertex's neighbor count.
+///
+/// Computed once per smoothing run so that each sweep scales the neighbor
+/// sum with a multiply instead of dividing by the degree again.
+/// Isolated vertices get 0.
+template <typename T, typename VertexLink>
+auto make_inverse_degrees(const VertexLink &vlink) -> tf::buffer<T> {
+  tf::buffer<T> inv_degrees;
+  inv_degrees.allocate(vlink.size());
+  tf::parallel_for_each(
+      tf::zip(vlink, inv_degrees),
+      [](auto pair) {
+        auto [neighbors, inv_degree] = pair;
+        inv_degree = neighbors.size() ? T(1) / T(neighbors.size()) : T(0);
+      },
+      tf::checked);
+  return inv_degrees;
+}
+
+/// @brief One Laplacian smoothing sweep from src into dst.
+///
+/// src and dst must not alias: every vertex reads its neighbors from src.
+/// inv_degrees holds the per-vertex reciprocal neighbor counts, see
+/// make_inverse_degrees.
+/// Passing the same affinity partitioner to every sweep of an iterative
+/// smoothing run keeps each vertex chunk on the thread that processed it in
+/// the previous sweep, so its points and neighbor lists stay in that core's
+/// cache.
+template <typename Policy, typename Range, typename VertexLink>
+auto laplacian_smoothing_pass(const tf::points<Policy> &src, Range &&dst,
+                              const VertexLink &vlink,
+                              const tf::buffer<tf::coordinate_type<Policy>>
+                                  &inv_degrees,
+                              tf::coordinate_type<Policy> weight,
+                              tbb::affinity_partitioner &partitioner)
+    -> void {
+  using T = tf::coordinate_type<Policy>;
+  constexpr auto Dims = tf::coordinate_dims_v<Policy>;
+
+  // Neighbors are summed per coordinate straight from their ids, so the
+  // inner loop is a plain indexed gather into Dims scalar accumulators.
+  auto r = tf::zip(src, dst, vlink, inv_degrees);
+  auto apply = [&src, weight](auto tup) {
+    auto [curr, out, neighbor_ids, inv_degree] = tup;
+    if (neighbor_ids.size() == 0) {
+      out = curr;
+      return;
+    }
+    std::array<T, Dims> sum{};
+    for (auto id : neighbor_ids) {
+      auto nb = src[id];
+      for (std::size_t d = 0; d < Dims; ++d)
+        sum[d] += nb[d];
+    }
+    for (std::size_t d = 0; d < Dims; ++d)
+      out[d] = curr[d] + (sum[d] * inv_degree - curr[d]) * weight;
+  };
+
+  if (r.size() < 1000) {
+    for (auto &&e : r)
+      apply(e);
+    return;
+  }
+
+  using Iterator = decltype(r.begin());
+  tbb::parallel_for(
+      tbb::blocked_range<Iterator>(r.begin(), r.end()),
+      [&apply](const tbb::blocked_range<Iterator> &range) {
+        for (Iterator it = range.begin(); it != range.end(); ++it)
+          apply(*it);
+      },
+      partitioner);
+}
+
+} // namespace geometry
+
 /// @ingroup geometry_processing
 /// @brief Apply Laplacian smoothing to a point set.
 ///
@@ -69,24 +151,117 @@ auto laplacian_smoothed(const tf::points<Policy> &pts, std::size_t iterations,
 
   tf::points_buffer<T, Dims> current;
   current.allocate(pts.size());
-  tf::parallel_copy(pts, current.points());
+  if (iterations == 0) {
+    tf::parallel_copy(pts, current.points());
+    return current;
+  }
+
+  const auto inv_degrees = geometry::make_inverse_degrees<T>(vlink);
+  tbb::affinity_partitioner partitioner;
+
+  // The first sweep reads the input directly, so it is never copied
+  geometry::laplacian_smoothing_pass(pts, current.points(), vlink,
+                                     inv_degrees, lambda, partitioner);
 
   tf::points_buffer<T, Dims> next;
-  next.allocate(pts.size());
-
-  for (std::size_t iter = 0; iter < iterations; ++iter) {
-    tf::parallel_for_each(
-        tf::zip(current.points(), next.points(),
-                tf::make_block_indirect_range(vlink, current.points())),
-        [&](auto tup) {
-          auto [curr, out, neighbors] = tup;
-          out = laplacian_smoothed(curr, tf::make_points(neighbors), lambda);
-        },
-        tf::checked);
+  if (iterations > 1)
+    next.allocate(pts.size());
+
+  for (std::size_t iter = 1; iter < iterations; ++iter) {
+    geometry::laplacian_smoothing_pass(current.points(), next.points(), vlink,
+                                       inv_degrees, lambda, partitioner);
     std::swap(current, next);
   }
 
   return current;
 }
 
+/// @ingroup geometry_processing
+/// @brief Apply alternating Laplacian smoothing passes into an output range.
+///
+/// Each iteration runs one pass with weight lambda followed by one pass with
+/// weight mu. With a negative mu this is Taubin's lambda|mu smoothing, which
+/// counteracts the shrinkage of plain Laplacian smoothing.
+///
+/// Each iteration is a single shrink/inflate step over two buffers: the
+/// lambda pass writes an internal scratch buffer and the mu pass writes the
+/// output back, so no buffers are swapped and the input is read directly by
+/// the first pass instead of being copied. The mu pass needs every
+/// neighbor's lambda update, so the two sweeps cannot be merged further
+/// without changing the result.
+///
+/// Because the input is only read by the lambda pass, which finishes before
+/// the output is written, the output may be the input itself. Smoothing in
+/// place needs a single scratch buffer and no other allocation.
+///
+/// @param pts Point set with vertex_link policy attached.
+/// @param output Output points, same size and dimensions as pts.
+/// @param iterations Number of smoothing iterations (each iteration is one
+///                   lambda pass + one mu pass).
+/// @param lambda Smoothing factor for the first pass.
+/// @param mu Smoothing factor for the second pass (negative to inflate).
+template <typename Policy, typename OutputRange>
+auto compute_laplacian_smoothed(const tf::points<Policy> &pts,
+                                OutputRange &&output, std::size_t iterations,
+                                tf::coordinate_type<Policy> lambda,
+                                tf::coordinate_type<Policy> mu) -> void {
+  static_assert(tf::has_vertex_link_policy<Policy>,
+                "Points must have vertex_link policy attached");
+
+  using T = tf::coordinate_type<Policy>;
+  constexpr auto Dims = tf::coordinate_dims_v<Policy>;
+
+  if (iterations == 0) {
+    tf::parallel_copy(pts, output);
+    return;
+  }
+
+  const auto &vlink = pts.vertex_link();
+  auto out = tf::make_points(output);
+
+  tf::points_buffer<T, Dims> scratch;
+  scratch.allocate(pts.size());
+
+  const auto inv_degrees = geometry::make_inverse_degrees<T>(vlink);
+  tbb::affinity_partitioner partitioner;
+
+  auto taubin_step = [&](const auto &src) {
+    geometry::laplacian_smoothing_pass(src, scratch.points(), vlink,
+                                       inv_degrees, lambda,
+                                       partitioner); // Shrink
+    geometry::laplacian_smoothing_pass(scratch.points(), out, vlink,
+                                       inv_degrees, mu,
+                                       partitioner); // Inflate
+  };
+
+  taubin_step(pts);
+  for (std::size_t iter = 1; iter < iterations; ++iter)
+    taubin_step(out);
+}
+
+/// @ingroup geometry_processing
+/// @brief Apply alternating Laplacian smoothing passes to a point set.
+///
+/// Convenience wrapper around compute_laplacian_smoothed that allocates the
+/// output buffer internally.
+///
+/// @param pts Point set with vertex_link policy attached.
+/// @param iterations Number of smoothing iterations (each iteration is one
+///                   lambda pass + one mu pass).
+/// @param lambda Smoothing factor for the first pass.
+/// @param mu Smoothing factor for the second pass (negative to inflate).
+/// @return New points buffer with smoothed positions.
+template <typename Policy>
+auto laplacian_smoothed(const tf::points<Policy> &pts, std::size_t iterations,
+                        tf::coordinate_type<Policy> lambda,
+                        tf::coordinate_type<Policy> mu) {
+  tf::points_buffer<tf::coordinate_type<Policy>,
+                    tf::coordinate_dims_v<Policy>>
+      result;
+  result.allocate(pts.size());
+  tf::compute_laplacian_smoothed(pts, result.points(), iterations, lambda,
+                                 mu);
+  return result;
+}
+
 } // namespace tf
@@ -16,6 +16,29 @@
 
 namespace tf {
 
+/// @ingroup geometry_processing
+/// @brief Apply Taubin smoothing to a point set, writing into an output range.
+///
+/// Same as taubin_smoothed, but the result is written into output, which may
+/// be the input points themselves to smooth in place.
+///
+/// @param pts Point set with vertex_link policy attached.
+/// @param output Output points, same size and dimensions as pts.
+/// @param iterations Number of smoothing iterations (each iteration is one
+///                   shrink + one inflate pass).
+/// @param lambda Smoothing factor for shrink pass. Default: 0.5.
+/// @param kpb Pass-band frequency. Default: 0.1.
+template <typename Policy, typename OutputRange>
+auto compute_taubin_smoothed(const tf::points<Policy> &pts,
+                             OutputRange &&output, std::size_t iterations,
+                             tf::coordinate_type<Policy> lambda = 0.5,
+                             tf::coordinate_type<Policy> kpb = 0.1) -> void {
+  using T = tf::coordinate_type<Policy>;
+  // mu = 1 / (kpb - 1/lambda)
+  T mu = T(1) / (kpb - T(1) / lambda);
+  tf::compute_laplacian_smoothed(pts, output, iterations, lambda, mu);
+}
+
 /// @ingroup geometry_processing
 /// @brief Apply Taubin smoothing to a point set.
 ///
@@ -43,39 +66,12 @@ auto taubin_smoothed(const tf::points<Policy> &pts, std::size_t iterations,
                 "Points must have vertex_link policy attached");
 
   using T = tf::coordinate_type<Policy>;
-  constexpr auto Dims = tf::coordinate_dims_v<Policy>;
 
   // Compute mu from lambda and pass-band frequency
   // mu = 1 / (kpb - 1/lambda)
   T mu = T(1) / (kpb - T(1) / lambda);
 
-  const auto &vlink = pts.vertex_link();
-
-  tf::points_buffer<T, Dims> current;
-  current.allocate(pts.size());
-  tf::parallel_copy(pts, current.points());
-
-  tf::points_buffer<T, Dims> next;
-  next.allocate(pts.size());
-
-  auto smooth_pass = [&](T weight) {
-    tf::parallel_for_each(
-        tf::zip(current.points(), next.points(),
-                tf::make_block_indirect_range(vlink, current.points())),
-        [&](auto tup) {
-          auto [curr, out, neighbors] = tup;
-          out = laplacian_smoothed(curr, tf::make_points(neighbors), weight);
-        },
-        tf::checked);
-    std::swap(current, next);
-  };
-
-  for (std::size_t iter = 0; iter < iterations; ++iter) {
-    smooth_pass(lambda); // Shrink
-    smooth_pass(mu);     // Inflate
-  }
-
-  return current;
+  return tf::laplacian_smoothed(pts, iterations, lambda, mu);
 }
 
 } // namespace tf
@@ -12,9 +12,10 @@
 */
 #pragma once
 #include "../core/epsilon.hpp"
-#include <algorithm>
+#include <cstddef>
 #include <iterator>
 #include <limits>
+#include <utility>
 
 namespace tf {
 
@@ -58,24 +59,19 @@ public:
         limit_metric{worst_metric} {}
 
   auto update(element_t element, const info_t &point) -> bool {
-    if (point.metric < limit_metric) {
-      if (count < k) {
-        out[count++] = tree_metric_info_t{element, point};
-        std::inplace_merge(out, out + count - 1, out + count,
-                           [](const auto &a, const auto &b) {
-                             return a.metric() < b.metric();
-                           });
-        if (count == k)
-          worst_metric = out[k - 1].metric();
-      } else if (point.metric < worst_metric) {
-        auto it = std::upper_bound(out, out + k - 1, point.metric,
-                                   [](const auto &value, const auto &elem) {
-                                     return value < elem.metric();
-                                   });
-        std::move_backward(it, out + k - 1, out + k);
-        *it = tree_metric_info_t{element, point};
-        worst_metric = out[k - 1].metric();
+    if (point.metric < limit_metric &&
+        (count < k || point.metric < worst_metric)) {
+      // Grow while filling, otherwise the worst entry is dropped. Then shift
+      // farther entries back one slot: k is small, so a linear scan from the
+      // end beats a binary search, and no temporary buffer is needed
+      std::size_t i = count < k ? count++ : k - 1;
+      while (i > 0 && point.metric < out[i - 1].metric()) {
+        out[i] = std::move(out[i - 1]);
+        --i;
       }
+      out[i] = tree_metric_info_t{element, point};
+      if (count == k)
+        worst_metric = out[k - 1].metric();
     }
     return count == k && metric() < tf::epsilon2<real_t>;
   }
@@ -55,6 +55,7 @@
 #include "./topology/are_oriented_faces_equal.hpp"   // IWYU pragma: export
 #include "./topology/boundary_edges.hpp"             // IWYU pragma: export
 #include "./topology/boundary_paths.hpp"             // IWYU pragma: export
+#include "./topology/check_topology.hpp"             // IWYU pragma: export
 #include "./topology/components/finder.hpp"          // IWYU pragma: export
 #include "./topology/connect_edges_to_paths.hpp"     // IWYU pragma: export
 #include "./topology/compute_unique_faces_mask.hpp"  // IWYU pragma: export
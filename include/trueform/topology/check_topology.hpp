@@ -0,0 +1,172 @@
+/*
+ * Copyright (c) 2025 XLAB
+ * All rights reserved.
+ *
+ * This file is part of trueform (trueform.polydera.com)
+ *
+ * Licensed for noncommercial use under the PolyForm Noncommercial
+ * License 1.0.0.
+ * Commercial licensing available via info@polydera.com.
+ *
+ * Author: Žiga Sajovic
+ */
+#pragma once
+#include "../core/algorithm/parallel_contains.hpp"
+#include "../core/algorithm/parallel_for.hpp"
+#include "../core/views/enumerate.hpp"
+#include "./face_edge_neighbors.hpp"
+#include "./face_membership_like.hpp"
+#include "./is_manifold.hpp"
+#include "./make_face_membership.hpp"
+#include "./manifold_edge_link_like.hpp"
+#include "./policy/face_membership.hpp"
+#include "./policy/manifold_edge_link.hpp"
+#include <atomic>
+#include <utility>
+
+namespace tf {
+namespace topology {
+enum : int {
+  boundary_edge_flag = 1,
+  non_manifold_edge_flag = 2,
+  all_edge_flags = boundary_edge_flag | non_manifold_edge_flag
+};
+
+/// OR of face_flags(e, known) over the range, where known holds the flags
+/// found so far so that face_flags can skip lookups for them. Stops once
+/// both defects are found; small ranges are scanned serially.
+template <typename Range, typename F>
+auto reduce_edge_flags(const Range &range, const F &face_flags) -> int {
+  if (range.size() < 1000) {
+    int flags = 0;
+    for (const auto &e : range) {
+      flags = face_flags(e, flags);
+      if (flags == all_edge_flags)
+        break;
+    }
+    return flags;
+  }
+
+  std::atomic<int> flags{0};
+  tf::parallel_for(range, [&](auto first, auto last) {
+    int local = 0;
+    for (auto it = first; it != last; ++it) {
+      local |= flags.load(std::memory_order_relaxed);
+      if (local == all_edge_flags)
+        return;
+      int next = face_flags(*it, local);
+      if (next != local)
+        local = flags.fetch_or(next, std::memory_order_relaxed) | next;
+    }
+  });
+  return flags.load();
+}
+
+inline auto make_topology_result(int flags) -> std::pair<bool, bool> {
+  return {!(flags & non_manifold_edge_flag), !(flags & boundary_edge_flag)};
+}
+} // namespace topology
+
+/// @ingroup topology_analysis
+/// @brief Check if a mesh is manifold and closed in a single pass.
+///
+/// Equivalent to `{tf::is_manifold(faces, fm), tf::is_closed(faces, fm)}`,
+/// but every edge is looked up at most once and classified as boundary (no
+/// neighbor) or non-manifold (2+ neighbors) in the same scan. The scan stops
+/// once both defects are found.
+///
+/// @tparam Policy The faces policy type.
+/// @tparam Policy1 The face membership policy type.
+/// @param faces The faces range.
+/// @param fm The face membership structure.
+/// @return `{is_manifold, is_closed}`.
+template <typename Policy, typename Policy1>
+auto check_topology(const tf::faces<Policy> &faces,
+                    const tf::face_membership_like<Policy1> &fm)
+    -> std::pair<bool, bool> {
+  using Index = std::decay_t<decltype(faces[0][0])>;
+
+  // Same prefilter as is_closed: a vertex in a single face makes the mesh
+  // open, and only the manifold check remains
+  if (tf::parallel_contains(
+          fm, [](const auto &vertex_faces) { return vertex_faces.size() == 1; },
+          tf::checked))
+    return {tf::is_manifold(faces, fm), false};
+
+  auto face_flags = [&](auto pair, int flags) {
+    auto [face_id, face] = pair;
+    auto size = face.size();
+    decltype(size) prev = size - 1;
+    for (decltype(size) i = 0; i < size && flags != topology::all_edge_flags;
+         prev = i++) {
+      auto v0 = face[prev];
+      auto v1 = face[i];
+      const bool find_boundary = !(flags & topology::boundary_edge_flag);
+      // An edge shared by 3+ faces needs both endpoints in 3+ faces
+      const bool find_non_manifold =
+          !(flags & topology::non_manifold_edge_flag) &&
+          fm[v0].size() >= 3 && fm[v1].size() >= 3;
+      if (!find_boundary && !find_non_manifold)
+        continue;
+      const int limit = find_non_manifold ? 2 : 1;
+      int count = 0;
+      tf::face_edge_neighbors_apply(fm, faces, Index(face_id), Index(v0),
+                                    Index(v1), [&](auto) {
+                                      ++count;
+                                      return count >= limit;
+                                    });
+      flags |= (find_boundary && count == 0) * topology::boundary_edge_flag;
+      flags |= (count > 1) * topology::non_manifold_edge_flag;
+    }
+    return flags;
+  };
+
+  return topology::make_topology_result(
+      topology::reduce_edge_flags(tf::enumerate(faces), face_flags));
+}
+
+/// @ingroup topology_analysis
+/// @brief Check if a mesh is manifold and closed in a single pass.
+///
+/// Reads the edge classification already stored in a manifold edge link.
+///
+/// @tparam Policy The manifold edge link policy type.
+/// @param mel The manifold edge link of the mesh.
+/// @return `{is_manifold, is_closed}`.
+template <typename Policy>
+auto check_topology(const tf::manifold_edge_link_like<Policy> &mel)
+    -> std::pair<bool, bool> {
+  auto face_flags = [](const auto &peers, int flags) {
+    for (const auto &peer : peers) {
+      flags |= peer.is_boundary() * topology::boundary_edge_flag;
+      flags |= !peer.is_manifold() * topology::non_manifold_edge_flag;
+    }
+    return flags;
+  };
+  return topology::make_topology_result(
+      topology::reduce_edge_flags(mel, face_flags));
+}
+
+/// @ingroup topology_analysis
+/// @brief Check if a mesh is manifold and closed in a single pass.
+///
+/// Convenience overload that uses the manifold edge link or face membership
+/// if provided via policy, and builds face membership internally otherwise.
+///
+/// @tparam Policy The polygons policy type.
+/// @param polygons The polygons range.
+/// @return `{is_manifold, is_closed}`.
+template <typename Policy>
+auto check_topology(const tf::polygons<Policy> &polygons)
+    -> std::pair<bool, bool> {
+  if constexpr (tf::has_manifold_edge_link_policy<Policy>) {
+    return tf::check_topology(polygons.manifold_edge_link());
+  } else if constexpr (tf::has_face_membership_policy<Policy>) {
+    return tf::check_topology(polygons.faces(), polygons.face_membership());
+  } else {
+    auto fm = tf::make_face_membership(polygons);
+    return check_topology(polygons | tf::tag(fm));
+  }
+}
+
+} // namespace tf
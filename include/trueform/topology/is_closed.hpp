@@ -17,7 +17,9 @@
 #include "./face_edge_neighbors.hpp"
 #include "./face_membership_like.hpp"
 #include "./make_face_membership.hpp"
+#include "./manifold_edge_link_like.hpp"
 #include "./policy/face_membership.hpp"
+#include "./policy/manifold_edge_link.hpp"
 
 namespace tf {
 
@@ -38,6 +40,14 @@ auto is_closed(const tf::faces<Policy> &faces,
                const tf::face_membership_like<Policy1> &fm) -> bool {
   using Index = std::decay_t<decltype(faces[0][0])>;
 
+  // A vertex used by a single face has both of its edges in that face
+  // only, so open meshes are usually rejected from the face counts alone,
+  // before any edge is looked up
+  if (tf::parallel_contains(
+          fm, [](const auto &vertex_faces) { return vertex_faces.size() == 1; },
+          tf::checked))
+    return false;
+
   auto has_boundary_edge = [&](auto pair) {
     auto [face_id, face] = pair;
     auto size = face.size();
@@ -64,15 +74,41 @@ auto is_closed(const tf::faces<Policy> &faces,
 /// @ingroup topology_analysis
 /// @brief Check if a mesh has no boundary edges.
 ///
-/// Convenience overload that builds face membership internally if not
-/// provided via policy.
+/// Reads the edge classification already stored in a manifold edge link,
+/// so no edge has to be looked up again.
+///
+/// @tparam Policy The manifold edge link policy type.
+/// @param mel The manifold edge link of the mesh.
+/// @return `true` if the mesh is closed (no boundary edges).
+template <typename Policy>
+auto is_closed(const tf::manifold_edge_link_like<Policy> &mel) -> bool {
+  return !tf::parallel_contains(
+      mel,
+      [](const auto &peers) {
+        // Branchless over the face's edges; faces are short, so testing
+        // every edge is cheaper than a data-dependent exit per edge
+        bool found = false;
+        for (const auto &peer : peers)
+          found |= peer.is_boundary();
+        return found;
+      },
+      tf::checked);
+}
+
+/// @ingroup topology_analysis
+/// @brief Check if a mesh has no boundary edges.
+///
+/// Convenience overload that uses the manifold edge link or face membership
+/// if provided via policy, and builds face membership internally otherwise.
 ///
 /// @tparam Policy The polygons policy type.
 /// @param polygons The polygons range.
 /// @return `true` if the mesh is closed (no boundary edges).
 template <typename Policy>
 auto is_closed(const tf::polygons<Policy> &polygons) -> bool {
-  if constexpr (tf::has_face_membership_policy<Policy>) {
+  if constexpr (tf::has_manifold_edge_link_policy<Policy>) {
+    return tf::is_closed(polygons.manifold_edge_link());
+  } else if constexpr (tf::has_face_membership_policy<Policy>) {
     return tf::is_closed(polygons.faces(), polygons.face_membership());
   } else {
     auto fm = tf::make_face_membership(polygons);
@@ -16,7 +16,9 @@
 #include "./face_edge_neighbors.hpp"
 #include "./face_membership_like.hpp"
 #include "./make_face_membership.hpp"
+#include "./manifold_edge_link_like.hpp"
 #include "./policy/face_membership.hpp"
+#include "./policy/manifold_edge_link.hpp"
 
 namespace tf {
 
@@ -44,6 +46,9 @@ auto is_manifold(const tf::faces<Policy> &faces,
     for (decltype(size) i = 0; i < size; prev = i++) {
       auto v0 = face[prev];
       auto v1 = face[i];
+      // An edge shared by 3+ faces needs both endpoints in 3+ faces
+      if (fm[v0].size() < 3 || fm[v1].size() < 3)
+        continue;
       int count = 0;
       tf::face_edge_neighbors_apply(fm, faces, Index(face_id), Index(v0),
                                     Index(v1), [&](auto) {
@@ -63,15 +68,41 @@ auto is_manifold(const tf::faces<Policy> &faces,
 /// @ingroup topology_analysis
 /// @brief Check if a mesh is manifold.
 ///
-/// Convenience overload that builds face membership internally if not
-/// provided via policy.
+/// Reads the edge classification already stored in a manifold edge link,
+/// so no edge has to be looked up again.
+///
+/// @tparam Policy The manifold edge link policy type.
+/// @param mel The manifold edge link of the mesh.
+/// @return `true` if the mesh is manifold (no edges shared by 3+ faces).
+template <typename Policy>
+auto is_manifold(const tf::manifold_edge_link_like<Policy> &mel) -> bool {
+  return !tf::parallel_contains(
+      mel,
+      [](const auto &peers) {
+        // Branchless over the face's edges; faces are short, so testing
+        // every edge is cheaper than a data-dependent exit per edge
+        bool found = false;
+        for (const auto &peer : peers)
+          found |= !peer.is_manifold();
+        return found;
+      },
+      tf::checked);
+}
+
+/// @ingroup topology_analysis
+/// @brief Check if a mesh is manifold.
+///
+/// Convenience overload that uses the manifold edge link or face membership
+/// if provided via policy, and builds face membership internally otherwise.
 ///
 /// @tparam Policy The polygons policy type.
 /// @param polygons The polygons range.
 /// @return `true` if the mesh is manifold (no edges shared by 3+ faces).
 template <typename Policy>
 auto is_manifold(const tf::polygons<Policy> &polygons) -> bool {
-  if constexpr (tf::has_face_membership_policy<Policy>) {
+  if constexpr (tf::has_manifold_edge_link_policy<Policy>) {
+    return tf::is_manifold(polygons.manifold_edge_link());
+  } else if constexpr (tf::has_face_membership_policy<Policy>) {
     return tf::is_manifold(polygons.faces(), polygons.face_membership());
   } else {
     auto fm = tf::make_face_membership(polygons);
@@ -12,12 +12,18 @@
 */
 #pragma once
 
+#include <nanobind/nanobind.h>
+#include <trueform/core/algorithm/parallel_for_each.hpp>
+#include <trueform/core/buffer.hpp>
 #include <trueform/core/frame.hpp>
 #include <trueform/core/policy/frame.hpp>
 #include <trueform/geometry/chamfer_error.hpp>
 #include <trueform/python/spatial/point_cloud.hpp>
 #include <trueform/core/form.hpp>
+#include <trueform/core/views/zip.hpp>
+#include <trueform/python/util/make_numpy_array.hpp>
 #include <trueform/spatial/policy/tree.hpp>
+#include <vector>
 
 namespace tf::py {
 
@@ -48,4 +54,27 @@ auto chamfer_error_impl(point_cloud_wrapper<RealT, Dims> &cloud0,
   }
 }
 
+// Chamfer error of each source against one target. Runs without the GIL;
+// the target tree is built once before the sources are processed in
+// parallel.
+template <typename RealT, std::size_t Dims>
+auto chamfer_errors_impl(
+    const std::vector<point_cloud_wrapper<RealT, Dims> *> &sources,
+    point_cloud_wrapper<RealT, Dims> &target) {
+  tf::buffer<RealT> errors;
+  errors.allocate(sources.size());
+  {
+    nanobind::gil_scoped_release release;
+    target.tree();
+    tf::parallel_for_each(
+        tf::zip(tf::make_range(sources), errors),
+        [&](auto tup) {
+          auto &&[source, error] = tup;
+          error = chamfer_error_impl(*source, target);
+        },
+        tf::checked);
+  }
+  return make_numpy_array(std::move(errors));
+}
+
 } // namespace tf::py
@@ -14,6 +14,7 @@
 
 #include <nanobind/ndarray.h>
 #include <optional>
+#include <utility>
 #include <trueform/core/form.hpp>
 #include <trueform/core/frame.hpp>
 #include <trueform/core/policy/frame.hpp>
@@ -66,7 +67,14 @@ auto fit_icp_alignment_impl(point_cloud_wrapper<RealT, Dims> &cloud0,
     }
   };
 
-  return make_numpy_array(compute());
+  // The whole iteration loop is native; build the tree up front so that
+  // no Python object is touched while the GIL is released.
+  cloud1.tree();
+  auto result = [&] {
+    nanobind::gil_scoped_release release;
+    return compute();
+  }();
+  return make_numpy_array(std::move(result));
 }
 
 // Point-to-plane ICP alignment (target has normals) - 3D only
@@ -114,7 +122,14 @@ auto fit_icp_alignment_p2plane_impl(
     }
   };
 
-  return make_numpy_array(compute());
+  // The whole iteration loop is native; build the tree up front so that
+  // no Python object is touched while the GIL is released.
+  cloud1.tree();
+  auto result = [&] {
+    nanobind::gil_scoped_release release;
+    return compute();
+  }();
+  return make_numpy_array(std::move(result));
 }
 
 // Point-to-plane ICP with normal weighting (both have normals) - 3D only
@@ -167,7 +182,14 @@ auto fit_icp_alignment_weighted_impl(
     }
   };
 
-  return make_numpy_array(compute());
+  // The whole iteration loop is native; build the tree up front so that
+  // no Python object is touched while the GIL is released.
+  cloud1.tree();
+  auto result = [&] {
+    nanobind::gil_scoped_release release;
+    return compute();
+  }();
+  return make_numpy_array(std::move(result));
 }
 
 } // namespace tf::py
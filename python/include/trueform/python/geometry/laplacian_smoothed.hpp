@@ -14,10 +14,12 @@
 
 #include <nanobind/nanobind.h>
 #include <nanobind/ndarray.h>
+#include <optional>
 #include <trueform/core/points.hpp>
 #include <trueform/geometry/laplacian_smoothed.hpp>
 #include <trueform/python/core/offset_blocked_array.hpp>
 #include <trueform/python/util/make_numpy_array.hpp>
+#include <trueform/python/util/visit_points_array.hpp>
 #include <trueform/topology/vertex_link_like.hpp>
 
 namespace tf::py {
@@ -26,15 +28,22 @@ template <typename Index, typename RealT, std::size_t Dims>
 auto laplacian_smoothed(
     nanobind::ndarray<nanobind::numpy, RealT, nanobind::shape<-1, Dims>> points,
     const offset_blocked_array_wrapper<Index, Index> &vertex_link,
-    std::size_t iterations, RealT lambda) {
+    std::size_t iterations, RealT lambda, std::optional<RealT> mu = {}) {
 
   auto vl = tf::make_vertex_link_like(vertex_link.make_range());
 
-  RealT *pts_data = static_cast<RealT *>(points.data());
-  auto flat_range = tf::make_range(pts_data, points.shape(0) * Dims);
-  auto pts = tf::make_points<Dims>(flat_range) | tf::tag(vl);
-
-  auto result = tf::laplacian_smoothed(pts, iterations, lambda);
+  // All iterations run in one call without the GIL. The kernel copies the
+  // input into its own buffers, so strided arrays are read in place instead
+  // of being made contiguous first
+  auto result = [&] {
+    nanobind::gil_scoped_release release;
+    return visit_points_array<RealT, Dims>(points, [&](auto pts_view) {
+      auto pts = pts_view | tf::tag(vl);
+      if (mu)
+        return tf::laplacian_smoothed(pts, iterations, lambda, *mu);
+      return tf::laplacian_smoothed(pts, iterations, lambda);
+    });
+  }();
 
   return make_numpy_array(std::move(result));
 }
@@ -18,7 +18,9 @@
 #include <trueform/geometry/taubin_smoothed.hpp>
 #include <trueform/python/core/offset_blocked_array.hpp>
 #include <trueform/python/util/make_numpy_array.hpp>
+#include <trueform/python/util/visit_points_array.hpp>
 #include <trueform/topology/vertex_link_like.hpp>
+#include <stdexcept>
 
 namespace tf::py {
 
@@ -30,13 +32,41 @@ auto taubin_smoothed(
 
   auto vl = tf::make_vertex_link_like(vertex_link.make_range());
 
-  RealT *pts_data = static_cast<RealT *>(points.data());
-  auto flat_range = tf::make_range(pts_data, points.shape(0) * Dims);
-  auto pts = tf::make_points<Dims>(flat_range) | tf::tag(vl);
-
-  auto result = tf::taubin_smoothed(pts, iterations, lambda, kpb);
+  // All iterations run in one call without the GIL. The kernel copies the
+  // input into its own buffers, so strided arrays are read in place instead
+  // of being made contiguous first
+  auto result = [&] {
+    nanobind::gil_scoped_release release;
+    return visit_points_array<RealT, Dims>(points, [&](auto pts_view) {
+      return tf::taubin_smoothed(pts_view | tf::tag(vl), iterations, lambda,
+                                 kpb);
+    });
+  }();
 
   return make_numpy_array(std::move(result));
 }
 
+// Smooths into a caller-provided contiguous array, which may be the input
+// array itself. Only one scratch buffer is allocated internally.
+template <typename Index, typename RealT, std::size_t Dims>
+auto taubin_smoothed_into(
+    nanobind::ndarray<nanobind::numpy, RealT, nanobind::shape<-1, Dims>> points,
+    const offset_blocked_array_wrapper<Index, Index> &vertex_link,
+    nanobind::ndarray<nanobind::numpy, RealT, nanobind::shape<-1, Dims>,
+                      nanobind::c_contig>
+        out,
+    std::size_t iterations, RealT lambda, RealT kpb) -> void {
+  if (out.shape(0) != points.shape(0))
+    throw std::invalid_argument("out must have the same shape as points");
+
+  auto vl = tf::make_vertex_link_like(vertex_link.make_range());
+  auto out_pts = tf::make_points<Dims>(tf::make_range(out.data(), out.size()));
+
+  nanobind::gil_scoped_release release;
+  visit_points_array<RealT, Dims>(points, [&](auto pts_view) {
+    tf::compute_taubin_smoothed(pts_view | tf::tag(vl), out_pts, iterations,
+                                lambda, kpb);
+  });
+}
+
 } // namespace tf::py
@@ -18,7 +18,10 @@
 #include <nanobind/ndarray.h>
 #include <nanobind/stl/optional.h>
 #include <optional>
+#include <trueform/core/algorithm/parallel_copy.hpp>
+#include <trueform/core/buffer.hpp>
 #include <trueform/core/transformation_view.hpp>
+#include <trueform/python/util/make_numpy_array.hpp>
 
 namespace tf::py {
 
@@ -59,6 +62,15 @@ public:
   // Has check
   auto has_tree() const -> bool { return _data->has_tree(); }
 
+  // Point ids in the order the tree leaves store them (auto-build if needed)
+  auto tree_order() {
+    auto ids = tree().ids();
+    tf::buffer<int> order;
+    order.allocate(ids.size());
+    tf::parallel_copy(ids, order);
+    return make_numpy_array(std::move(order));
+  }
+
   // Data array accessors
   auto size() const -> std::size_t { return _data->size(); }
   auto dims() const -> std::size_t { return _data->dims(); }
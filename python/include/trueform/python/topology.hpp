@@ -34,5 +34,6 @@ auto register_topology_make_k_rings(nanobind::module_ &m) -> void;
 auto register_topology_make_neighborhoods(nanobind::module_ &m) -> void;
 auto register_topology_is_closed(nanobind::module_ &m) -> void;
 auto register_topology_is_manifold(nanobind::module_ &m) -> void;
+auto register_topology_check_topology(nanobind::module_ &m) -> void;
 
 } // namespace tf::py
@@ -0,0 +1,56 @@
+/*
+ * Copyright (c) 2025 XLAB
+ * All rights reserved.
+ *
+ * This file is part of trueform (trueform.polydera.com)
+ *
+ * Licensed for noncommercial use under the PolyForm Noncommercial
+ * License 1.0.0.
+ * Commercial licensing available via info@polydera.com.
+ *
+ * Author: Žiga Sajovic
+ */
+#pragma once
+#include "../core/offset_blocked_array.hpp"
+#include <nanobind/nanobind.h>
+#include <nanobind/ndarray.h>
+#include <trueform/core/algorithm/parallel_for_each.hpp>
+#include <trueform/core/buffer.hpp>
+#include <trueform/core/checked.hpp>
+#include <trueform/core/views/sequence_range.hpp>
+#include <trueform/core/views/zip.hpp>
+#include <trueform/python/util/make_numpy_array.hpp>
+#include <stdexcept>
+#include <vector>
+
+namespace tf::py {
+
+// Runs a per-mesh topology check over many meshes in one call. The meshes
+// are processed in parallel without the GIL; cells and face memberships are
+// only accessed by reference, so no Python object is touched while it is
+// released.
+template <typename Cells, typename Index, typename F>
+auto check_meshes(
+    const std::vector<Cells> &cells,
+    const std::vector<offset_blocked_array_wrapper<Index, Index> *> &fms,
+    const F &check) {
+  if (cells.size() != fms.size())
+    throw std::invalid_argument(
+        "cells and face_memberships must have the same length");
+
+  tf::buffer<bool> results;
+  results.allocate(cells.size());
+  {
+    nanobind::gil_scoped_release release;
+    tf::parallel_for_each(
+        tf::zip(tf::make_sequence_range(cells.size()), results),
+        [&](auto pair) {
+          auto [i, result] = pair;
+          result = check(cells[i], *fms[i]);
+        },
+        tf::checked);
+  }
+  return make_numpy_array(std::move(results));
+}
+
+} // namespace tf::py
@@ -12,16 +12,19 @@
  */
 #pragma once
 #include "../core/offset_blocked_array.hpp"
+#include "./check_meshes.hpp"
 #include <nanobind/nanobind.h>
 #include <nanobind/ndarray.h>
 #include <trueform/core/views/blocked_range.hpp>
 #include <trueform/topology/is_manifold.hpp>
+#include <vector>
 
 namespace tf::py {
 
 template <typename Index, std::size_t Ngon>
 auto is_manifold(
-    nanobind::ndarray<nanobind::numpy, Index, nanobind::shape<-1, Ngon>> cells,
+    const nanobind::ndarray<nanobind::numpy, Index, nanobind::shape<-1, Ngon>>
+        &cells,
     const offset_blocked_array_wrapper<Index, Index> &fm) -> bool {
   auto faces = tf::make_faces(
       tf::make_blocked_range<Ngon>(tf::make_range(cells.data(), cells.size())));
@@ -38,4 +41,23 @@ auto is_manifold_dynamic(
   return tf::is_manifold(faces, fml);
 }
 
+template <typename Index, std::size_t Ngon>
+auto is_manifold_batch(
+    const std::vector<nanobind::ndarray<nanobind::numpy, Index,
+                                        nanobind::shape<-1, Ngon>>> &cells,
+    const std::vector<offset_blocked_array_wrapper<Index, Index> *> &fms) {
+  return check_meshes(cells, fms, [](const auto &c, const auto &fm) {
+    return is_manifold<Index, Ngon>(c, fm);
+  });
+}
+
+template <typename Index>
+auto is_manifold_dynamic_batch(
+    const std::vector<offset_blocked_array_wrapper<Index, Index> *> &cells,
+    const std::vector<offset_blocked_array_wrapper<Index, Index> *> &fms) {
+  return check_meshes(cells, fms, [](const auto *c, const auto &fm) {
+    return is_manifold_dynamic<Index>(*c, fm);
+  });
+}
+
 } // namespace tf::py
@@ -0,0 +1,54 @@
+/*
+ * Copyright (c) 2025 XLAB
+ * All rights reserved.
+ *
+ * This file is part of trueform (trueform.polydera.com)
+ *
+ * Licensed for noncommercial use under the PolyForm Noncommercial
+ * License 1.0.0.
+ * Commercial licensing available via info@polydera.com.
+ *
+ * Author: Žiga Sajovic
+ */
+#pragma once
+
+#include <cstdint>
+#include <nanobind/nanobind.h>
+#include <nanobind/ndarray.h>
+#include <trueform/core/point.hpp>
+#include <trueform/core/points.hpp>
+#include <trueform/core/range.hpp>
+#include <trueform/core/views/mapped_range.hpp>
+#include <trueform/core/views/sequence_range.hpp>
+
+namespace tf::py {
+
+/**
+ * Call f with a tf::points view over an (N, Dims) numpy array
+ * C-contiguous arrays are viewed as a flat range; any other layout
+ * (row slices, column slices of wider arrays, reversed rows) is read
+ * through its strides, so callers need not make a contiguous copy
+ */
+template <typename RealT, std::size_t Dims, typename F>
+auto visit_points_array(
+    nanobind::ndarray<nanobind::numpy, RealT, nanobind::shape<-1, Dims>> array,
+    F &&f) {
+  RealT *data = static_cast<RealT *>(array.data());
+  const std::size_t n = array.shape(0);
+  const std::int64_t row_stride = array.stride(0);
+  const std::int64_t col_stride = array.stride(1);
+
+  if (col_stride == 1 && (row_stride == std::int64_t(Dims) || n < 2))
+    return f(tf::make_points<Dims>(tf::make_range(data, n * Dims)));
+
+  return f(tf::make_points(tf::make_mapped_range(
+      tf::make_sequence_range(std::int64_t(n)),
+      [data, row_stride, col_stride](std::int64_t i) {
+        tf::point<RealT, Dims> pt;
+        for (std::size_t k = 0; k < Dims; ++k)
+          pt[k] = data[i * row_stride + std::int64_t(k) * col_stride];
+        return pt;
+      })));
+}
+
+} // namespace tf::py
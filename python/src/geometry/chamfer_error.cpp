@@ -11,6 +11,7 @@
 * Author: Žiga Sajovic
 */
 #include <nanobind/nanobind.h>
+#include <nanobind/stl/vector.h>
 #include <trueform/python/geometry/chamfer_error.hpp>
 
 namespace tf::py {
@@ -56,6 +57,46 @@ auto register_chamfer_error(nanobind::module_ &m) -> void {
         nanobind::arg("cloud0"), nanobind::arg("cloud1"),
         "Compute one-way Chamfer error from cloud0 to cloud1.\n"
         "Returns mean nearest-neighbor distance.");
+
+  // float, 2D
+  m.def("chamfer_errors_float2d",
+        [](const std::vector<point_cloud_wrapper<float, 2> *> &sources,
+           point_cloud_wrapper<float, 2> &target) {
+          return chamfer_errors_impl(sources, target);
+        },
+        nanobind::arg("sources"), nanobind::arg("target"),
+        "Compute one-way Chamfer error from each source to target.\n"
+        "Returns an array of mean nearest-neighbor distances.");
+
+  // float, 3D
+  m.def("chamfer_errors_float3d",
+        [](const std::vector<point_cloud_wrapper<float, 3> *> &sources,
+           point_cloud_wrapper<float, 3> &target) {
+          return chamfer_errors_impl(sources, target);
+        },
+        nanobind::arg("sources"), nanobind::arg("target"),
+        "Compute one-way Chamfer error from each source to target.\n"
+        "Returns an array of mean nearest-neighbor distances.");
+
+  // double, 2D
+  m.def("chamfer_errors_double2d",
+        [](const std::vector<point_cloud_wrapper<double, 2> *> &sources,
+           point_cloud_wrapper<double, 2> &target) {
+          return chamfer_errors_impl(sources, target);
+        },
+        nanobind::arg("sources"), nanobind::arg("target"),
+        "Compute one-way Chamfer error from each source to target.\n"
+        "Returns an array of mean nearest-neighbor distances.");
+
+  // double, 3D
+  m.def("chamfer_errors_double3d",
+        [](const std::vector<point_cloud_wrapper<double, 3> *> &sources,
+           point_cloud_wrapper<double, 3> &target) {
+          return chamfer_errors_impl(sources, target);
+        },
+        nanobind::arg("sources"), nanobind::arg("target"),
+        "Compute one-way Chamfer error from each source to target.\n"
+        "Returns an array of mean nearest-neighbor distances.");
 }
 
 } // namespace tf::py
@@ -14,6 +14,7 @@
 #include "trueform/python/geometry/laplacian_smoothed.hpp"
 #include <nanobind/nanobind.h>
 #include <nanobind/ndarray.h>
+#include <nanobind/stl/optional.h>
 
 namespace tf::py {
 
@@ -22,7 +23,8 @@ auto register_laplacian_smoothed(nanobind::module_ &m) -> void {
 
   // ==========================================================================
   // LAPLACIAN_SMOOTHED
-  // Takes points, vertex_link, iterations, lambda
+  // Takes points, vertex_link, iterations, lambda, optional mu
+  // (mu set: each iteration is one lambda pass + one mu pass)
   // Index types: int32, int64
   // Real types: float32, float64
   // Dims: 3
@@ -35,48 +37,52 @@ auto register_laplacian_smoothed(nanobind::module_ &m) -> void {
       "laplacian_smoothed_int_float_3",
       [](ndarray<numpy, float, shape<-1, 3>> points,
          const offset_blocked_array_wrapper<int, int> &vertex_link,
-         std::size_t iterations, float lambda) {
+         std::size_t iterations, float lambda,
+         std::optional<float> mu) {
         return laplacian_smoothed<int, float, 3>(points, vertex_link,
-                                                  iterations, lambda);
+                                                  iterations, lambda, mu);
       },
       arg("points"), arg("vertex_link"), arg("iterations"),
-      arg("lambda_") = 0.5f);
+      arg("lambda_") = 0.5f, arg("mu").none() = none());
 
   // int32, float64, 3D
   m.def(
       "laplacian_smoothed_int_double_3",
       [](ndarray<numpy, double, shape<-1, 3>> points,
          const offset_blocked_array_wrapper<int, int> &vertex_link,
-         std::size_t iterations, double lambda) {
+         std::size_t iterations, double lambda,
+         std::optional<double> mu) {
         return laplacian_smoothed<int, double, 3>(points, vertex_link,
-                                                   iterations, lambda);
+                                                   iterations, lambda, mu);
       },
       arg("points"), arg("vertex_link"), arg("iterations"),
-      arg("lambda_") = 0.5);
+      arg("lambda_") = 0.5, arg("mu").none() = none());
 
   // int64, float32, 3D
   m.def(
       "laplacian_smoothed_int64_float_3",
       [](ndarray<numpy, float, shape<-1, 3>> points,
          const offset_blocked_array_wrapper<int64_t, int64_t> &vertex_link,
-         std::size_t iterations, float lambda) {
+         std::size_t iterations, float lambda,
+         std::optional<float> mu) {
         return laplacian_smoothed<int64_t, float, 3>(points, vertex_link,
-                                                      iterations, lambda);
+                                                      iterations, lambda, mu);
       },
       arg("points"), arg("vertex_link"), arg("iterations"),
-      arg("lambda_") = 0.5f);
+      arg("lambda_") = 0.5f, arg("mu").none() = none());
 
   // int64, float64, 3D
   m.def(
       "laplacian_smoothed_int64_double_3",
       [](ndarray<numpy, double, shape<-1, 3>> points,
          const offset_blocked_array_wrapper<int64_t, int64_t> &vertex_link,
-         std::size_t iterations, double lambda) {
+         std::size_t iterations, double lambda,
+         std::optional<double> mu) {
         return laplacian_smoothed<int64_t, double, 3>(points, vertex_link,
-                                                       iterations, lambda);
+                                                       iterations, lambda, mu);
       },
       arg("points"), arg("vertex_link"), arg("iterations"),
-      arg("lambda_") = 0.5);
+      arg("lambda_") = 0.5, arg("mu").none() = none());
 }
 
 } // namespace tf::py
@@ -26,57 +26,39 @@ auto register_taubin_smoothed(nanobind::module_ &m) -> void {
   // Index types: int32, int64
   // Real types: float32, float64
   // Dims: 3
-  // Suffix pattern: {index}_{real}_{dims} (e.g., int_float_3)
-  // Total: 4 bindings
+  // Each instantiation is registered under one overloaded name; nanobind
+  // checks dtypes and shapes while selecting it, so the Python wrapper needs
+  // no suffix dispatch. points is noconvert: an overload only matches its
+  // own dtype, and any other raises TypeError instead of being cast.
+  // taubin_smoothed_into writes into a caller-provided array instead of
+  // allocating the result.
   // ==========================================================================
 
-  // int32, float32, 3D
-  m.def(
-      "taubin_smoothed_int_float_3",
-      [](ndarray<numpy, float, shape<-1, 3>> points,
-         const offset_blocked_array_wrapper<int, int> &vertex_link,
-         std::size_t iterations, float lambda, float kpb) {
-        return taubin_smoothed<int, float, 3>(points, vertex_link,
-                                               iterations, lambda, kpb);
-      },
-      arg("points"), arg("vertex_link"), arg("iterations"),
-      arg("lambda_") = 0.5f, arg("kpb") = 0.1f);
+  m.def("taubin_smoothed", &taubin_smoothed<int, float, 3>,
+        arg("points").noconvert(), arg("vertex_link"), arg("iterations"),
+        arg("lambda_"), arg("kpb"));
+  m.def("taubin_smoothed", &taubin_smoothed<int, double, 3>,
+        arg("points").noconvert(), arg("vertex_link"), arg("iterations"),
+        arg("lambda_"), arg("kpb"));
+  m.def("taubin_smoothed", &taubin_smoothed<int64_t, float, 3>,
+        arg("points").noconvert(), arg("vertex_link"), arg("iterations"),
+        arg("lambda_"), arg("kpb"));
+  m.def("taubin_smoothed", &taubin_smoothed<int64_t, double, 3>,
+        arg("points").noconvert(), arg("vertex_link"), arg("iterations"),
+        arg("lambda_"), arg("kpb"));
 
-  // int32, float64, 3D
-  m.def(
-      "taubin_smoothed_int_double_3",
-      [](ndarray<numpy, double, shape<-1, 3>> points,
-         const offset_blocked_array_wrapper<int, int> &vertex_link,
-         std::size_t iterations, double lambda, double kpb) {
-        return taubin_smoothed<int, double, 3>(points, vertex_link,
-                                                iterations, lambda, kpb);
-      },
-      arg("points"), arg("vertex_link"), arg("iterations"),
-      arg("lambda_") = 0.5, arg("kpb") = 0.1);
-
-  // int64, float32, 3D
-  m.def(
-      "taubin_smoothed_int64_float_3",
-      [](ndarray<numpy, float, shape<-1, 3>> points,
-         const offset_blocked_array_wrapper<int64_t, int64_t> &vertex_link,
-         std::size_t iterations, float lambda, float kpb) {
-        return taubin_smoothed<int64_t, float, 3>(points, vertex_link,
-                                                   iterations, lambda, kpb);
-      },
-      arg("points"), arg("vertex_link"), arg("iterations"),
-      arg("lambda_") = 0.5f, arg("kpb") = 0.1f);
-
-  // int64, float64, 3D
-  m.def(
-      "taubin_smoothed_int64_double_3",
-      [](ndarray<numpy, double, shape<-1, 3>> points,
-         const offset_blocked_array_wrapper<int64_t, int64_t> &vertex_link,
-         std::size_t iterations, double lambda, double kpb) {
-        return taubin_smoothed<int64_t, double, 3>(points, vertex_link,
-                                                    iterations, lambda, kpb);
-      },
-      arg("points"), arg("vertex_link"), arg("iterations"),
-      arg("lambda_") = 0.5, arg("kpb") = 0.1);
+  m.def("taubin_smoothed_into", &taubin_smoothed_into<int, float, 3>,
+        arg("points").noconvert(), arg("vertex_link"), arg("out").noconvert(),
+        arg("iterations"), arg("lambda_"), arg("kpb"));
+  m.def("taubin_smoothed_into", &taubin_smoothed_into<int, double, 3>,
+        arg("points").noconvert(), arg("vertex_link"), arg("out").noconvert(),
+        arg("iterations"), arg("lambda_"), arg("kpb"));
+  m.def("taubin_smoothed_into", &taubin_smoothed_into<int64_t, float, 3>,
+        arg("points").noconvert(), arg("vertex_link"), arg("out").noconvert(),
+        arg("iterations"), arg("lambda_"), arg("kpb"));
+  m.def("taubin_smoothed_into", &taubin_smoothed_into<int64_t, double, 3>,
+        arg("points").noconvert(), arg("vertex_link"), arg("out").noconvert(),
+        arg("iterations"), arg("lambda_"), arg("kpb"));
 }
 
 } // namespace tf::py
@@ -22,6 +22,7 @@ namespace tf::py {
            nanobind::ndarray<nanobind::numpy, RealT, nanobind::shape<-1, Dims>>>()) \
       .def("build_tree", &point_cloud_wrapper<RealT, Dims>::build_tree)        \
       .def("has_tree", &point_cloud_wrapper<RealT, Dims>::has_tree)            \
+      .def("tree_order", &point_cloud_wrapper<RealT, Dims>::tree_order)        \
       .def("size", &point_cloud_wrapper<RealT, Dims>::size)                    \
       .def("dims", &point_cloud_wrapper<RealT, Dims>::dims)                    \
       .def("points_array", &point_cloud_wrapper<RealT, Dims>::points_array)    \
@@ -0,0 +1,36 @@
+/*
+ * Copyright (c) 2025 XLAB
+ * All rights reserved.
+ *
+ * This file is part of trueform (trueform.polydera.com)
+ *
+ * Licensed for noncommercial use under the PolyForm Noncommercial
+ * License 1.0.0.
+ * Commercial licensing available via info@polydera.com.
+ *
+ * Author: Žiga Sajovic
+ */
+
+#include "trueform/python/topology/check_topology.hpp"
+#include <nanobind/nanobind.h>
+#include <nanobind/ndarray.h>
+#include <nanobind/stl/pair.h>
+
+namespace tf::py {
+
+auto register_topology_check_topology(nanobind::module_ &m) -> void {
+  using namespace nanobind;
+
+  // Overloaded over index dtype and face type; nanobind selects the
+  // instantiation from the argument types. Returns (is_manifold, is_closed)
+  m.def("check_topology", &check_topology<int, 3>, arg("cells"),
+        arg("face_membership"));
+  m.def("check_topology", &check_topology_dynamic<int>, arg("cells"),
+        arg("face_membership"));
+  m.def("check_topology", &check_topology<int64_t, 3>, arg("cells"),
+        arg("face_membership"));
+  m.def("check_topology", &check_topology_dynamic<int64_t>, arg("cells"),
+        arg("face_membership"));
+}
+
+} // namespace tf::py
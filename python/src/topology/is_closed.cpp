@@ -14,47 +14,58 @@
 #include "trueform/python/topology/is_closed.hpp"
 #include <nanobind/nanobind.h>
 #include <nanobind/ndarray.h>
+#include <nanobind/stl/vector.h>
 
 namespace tf::py {
 
 auto register_topology_is_closed(nanobind::module_ &m) -> void {
   using namespace nanobind;
 
-  // int32, ngon=3
+  // Index types int32, int64; fixed (ngon=3) or dynamic cells. Each
+  // instantiation is registered under one overloaded name; nanobind selects
+  // it from the argument types, so callers need no suffix dispatch
+  m.def("is_closed", &is_closed<int, 3>, arg("cells"), arg("face_membership"));
+  m.def("is_closed", &is_closed_dynamic<int>, arg("cells"), arg("face_membership"));
+  m.def("is_closed", &is_closed<int64_t, 3>, arg("cells"),
+        arg("face_membership"));
+  m.def("is_closed", &is_closed_dynamic<int64_t>, arg("cells"),
+        arg("face_membership"));
+
+  // int, ngon=3, batched
   m.def(
-      "is_closed_int_3",
-      [](ndarray<numpy, int, shape<-1, 3>> cells,
-         const offset_blocked_array_wrapper<int, int> &fm) {
-        return is_closed<int, 3>(cells, fm);
+      "is_closed_batch_int_3",
+      [](const std::vector<ndarray<numpy, int, shape<-1, 3>>> &cells,
+         const std::vector<offset_blocked_array_wrapper<int, int> *> &fms) {
+        return is_closed_batch<int, 3>(cells, fms);
       },
-      arg("cells"), arg("face_membership"));
+      arg("cells"), arg("face_memberships"));
 
-  // int32, dynamic
+  // int, dynamic, batched
   m.def(
-      "is_closed_int_dyn",
-      [](const offset_blocked_array_wrapper<int, int> &cells,
-         const offset_blocked_array_wrapper<int, int> &fm) {
-        return is_closed_dynamic<int>(cells, fm);
+      "is_closed_batch_int_dyn",
+      [](const std::vector<offset_blocked_array_wrapper<int, int> *> &cells,
+         const std::vector<offset_blocked_array_wrapper<int, int> *> &fms) {
+        return is_closed_dynamic_batch<int>(cells, fms);
       },
-      arg("cells"), arg("face_membership"));
+      arg("cells"), arg("face_memberships"));
 
-  // int64, ngon=3
+  // int64, ngon=3, batched
   m.def(
-      "is_closed_int64_3",
-      [](ndarray<numpy, int64_t, shape<-1, 3>> cells,
-         const offset_blocked_array_wrapper<int64_t, int64_t> &fm) {
-        return is_closed<int64_t, 3>(cells, fm);
+      "is_closed_batch_int64_3",
+      [](const std::vector<ndarray<numpy, int64_t, shape<-1, 3>>> &cells,
+         const std::vector<offset_blocked_array_wrapper<int64_t, int64_t> *> &fms) {
+        return is_closed_batch<int64_t, 3>(cells, fms);
       },
-      arg("cells"), arg("face_membership"));
+      arg("cells"), arg("face_memberships"));
 
-  // int64, dynamic
+  // int64, dynamic, batched
   m.def(
-      "is_closed_int64_dyn",
-      [](const offset_blocked_array_wrapper<int64_t, int64_t> &cells,
-         const offset_blocked_array_wrapper<int64_t, int64_t> &fm) {
-        return is_closed_dynamic<int64_t>(cells, fm);
+      "is_closed_batch_int64_dyn",
+      [](const std::vector<offset_blocked_array_wrapper<int64_t, int64_t> *> &cells,
+         const std::vector<offset_blocked_array_wrapper<int64_t, int64_t> *> &fms) {
+        return is_closed_dynamic_batch<int64_t>(cells, fms);
       },
-      arg("cells"), arg("face_membership"));
+      arg("cells"), arg("face_memberships"));
 }
 
 } // namespace tf::py
@@ -12,6 +12,7 @@ from .suffix import dtype_str, build_suffix, build_suffix_pair, topology_suffix,
 from .canonicalize import canonicalize_index_order
 from .ensure_mesh import ensure_mesh
 from .ensure_point_cloud import ensure_point_cloud
+from .alignment import resolve_alignment
 
 __all__ = [
     'InputMeta',
@@ -24,4 +25,5 @@ __all__ = [
     'canonicalize_index_order',
     'ensure_mesh',
     'ensure_point_cloud',
+    'resolve_alignment',
 ]
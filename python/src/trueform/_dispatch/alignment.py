@@ -0,0 +1,83 @@
+"""
+Dispatch for point cloud alignment functions.
+
+Copyright (c) 2025 Ziga Sajovic, XLAB
+Licensed for noncommercial use under the PolyForm Noncommercial License 1.0.0.
+Commercial licensing available via info@polydera.com.
+https://github.com/polydera/trueform
+"""
+
+from .. import _trueform
+from .meta import extract_meta
+from .suffix import build_suffix
+
+
+def _point_to_point_args(c0, normals0, c1, normals1):
+    return (c0._wrapper, c1._wrapper)
+
+
+def _point_to_plane_args(c0, normals0, c1, normals1):
+    return (c0._wrapper, c1._wrapper, normals1)
+
+
+def _weighted_args(c0, normals0, c1, normals1):
+    return (c0._wrapper, normals0, c1._wrapper, normals1)
+
+
+# (has source normals, has target normals) -> (name infix, argument builder).
+# Source normals alone carry no information for the fit, so they fall back
+# to point-to-point.
+_ALIGNMENT_MODES = {
+    (False, False): ("", _point_to_point_args),
+    (True, False): ("", _point_to_point_args),
+    (False, True): ("_p2plane", _point_to_plane_args),
+    (True, True): ("_weighted", _weighted_args),
+}
+
+
+def resolve_alignment(name: str, cloud0, cloud1):
+    """
+    Resolve the C++ alignment function and its leading arguments.
+
+    Parameters
+    ----------
+    name : str
+        Base name of the binding, e.g. ``"fit_icp_alignment"``.
+    cloud0 : PointCloud or (PointCloud, normals)
+        Source point cloud, optionally with normals.
+    cloud1 : PointCloud or (PointCloud, normals)
+        Target point cloud, optionally with normals.
+
+    Returns
+    -------
+    tuple
+        ``(cpp_func, args)`` where ``args`` holds the wrappers and normals in
+        the order expected by the selected binding.
+
+    Raises
+    ------
+    ValueError
+        If the clouds differ in dims or dtype, or normals are given for 2D.
+    """
+    c0, normals0 = cloud0 if isinstance(cloud0, tuple) else (cloud0, None)
+    c1, normals1 = cloud1 if isinstance(cloud1, tuple) else (cloud1, None)
+
+    if c0.dims != c1.dims:
+        raise ValueError(
+            f"Dimension mismatch: cloud0 has {c0.dims}D, cloud1 has {c1.dims}D"
+        )
+    if c0.dtype != c1.dtype:
+        raise ValueError(
+            f"Dtype mismatch: cloud0 has {c0.dtype}, cloud1 has {c1.dtype}"
+        )
+
+    mode = (normals0 is not None, normals1 is not None)
+    if mode != (False, False) and c0.dims != 3:
+        raise ValueError(
+            "Point-to-plane and normal weighting only supported for 3D point clouds"
+        )
+
+    infix, build_args = _ALIGNMENT_MODES[mode]
+    suffix = build_suffix(extract_meta(c0))
+    cpp_func = getattr(_trueform.geometry, f"{name}{infix}_{suffix}")
+    return cpp_func, build_args(c0, normals0, c1, normals1)
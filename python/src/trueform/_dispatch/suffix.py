@@ -6,6 +6,8 @@ Licensed for noncommercial use under the PolyForm Noncommercial License 1.0.0.
 Commercial licensing available via info@polydera.com.
 https://github.com/polydera/trueform
 """
+from functools import lru_cache
+
 import numpy as np
 
 
@@ -22,6 +24,7 @@ def dtype_str(dtype: np.dtype) -> str:
     return _DTYPE_MAP[dtype]
 
 
+@lru_cache(maxsize=256)
 def build_suffix(meta) -> str:
     """
     Build suffix for single-form operations.
@@ -33,6 +36,8 @@ def build_suffix(meta) -> str:
         PointCloud  -> float3d
         EdgeMesh    -> intfloat3d
         Mesh        -> int3float3d
+
+    Results are memoized; meta must be hashable (InputMeta is).
     """
     parts = []
     if meta.index_dtype is not None:
@@ -44,6 +49,7 @@ def build_suffix(meta) -> str:
     return "".join(parts)
 
 
+@lru_cache(maxsize=256)
 def build_suffix_pair(meta0, meta1) -> str:
     """
     Build suffix for form×form operations.
@@ -58,6 +64,8 @@ def build_suffix_pair(meta0, meta1) -> str:
         Mesh × PointCloud       -> int3float3d
         Mesh × EdgeMesh         -> intint3float3d
         Mesh × Mesh             -> intint33float3d
+
+    Results are memoized; metas must be hashable (InputMeta is).
     """
     parts = []
     if meta0.index_dtype is not None:
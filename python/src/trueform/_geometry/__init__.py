@@ -11,7 +11,7 @@ from .fit_rigid_alignment import fit_rigid_alignment
 from .fit_obb_alignment import fit_obb_alignment
 from .fit_knn_alignment import fit_knn_alignment
 from .fit_icp_alignment import fit_icp_alignment
-from .chamfer_error import chamfer_error
+from .chamfer_error import chamfer_error, chamfer_errors
 from .triangulated import triangulated
 from .normals import normals
 from .point_normals import point_normals
@@ -34,6 +34,7 @@ __all__ = [
     "fit_knn_alignment",
     "fit_icp_alignment",
     "chamfer_error",
+    "chamfer_errors",
     "triangulated",
     "normals",
     "point_normals",
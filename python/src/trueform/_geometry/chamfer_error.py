@@ -7,7 +7,7 @@ Commercial licensing available via info@polydera.com.
 https://github.com/polydera/trueform
 """
 
-from typing import TYPE_CHECKING, Union
+from typing import TYPE_CHECKING, Sequence, Union
 import numpy as np
 
 from .. import _trueform
@@ -79,3 +79,59 @@ def chamfer_error(
     func_name = f"chamfer_error_{build_suffix(extract_meta(source))}"
     cpp_func = getattr(_trueform.geometry, func_name)
     return cpp_func(source._wrapper, target._wrapper)
+
+
+def chamfer_errors(
+    sources: Sequence[Union["PointCloud", np.ndarray, tuple]],
+    target: "PointCloud"
+) -> np.ndarray:
+    """
+    Compute one-way Chamfer error from each of several sources to one target.
+
+    Equivalent to ``[chamfer_error(s, target) for s in sources]``, but the
+    sources are evaluated in parallel in a single call, with the GIL released
+    and the target tree built once. Useful for scoring many candidate poses
+    against the same target.
+
+    Parameters
+    ----------
+    sources : sequence of PointCloud, ndarray, or tuple
+        Source point sets, each accepted in any form supported by
+        :func:`chamfer_error`. All must share the target's dims and dtype.
+    target : PointCloud
+        Target point cloud (tree auto-built on first access)
+
+    Returns
+    -------
+    errors : ndarray of shape (len(sources),)
+        Mean nearest-neighbor distance from each source to target
+
+    Examples
+    --------
+    >>> import trueform as tf
+    >>> import numpy as np
+    >>> target = tf.PointCloud(np.random.rand(1000, 3).astype(np.float32))
+    >>> source_points = np.random.rand(500, 3).astype(np.float32)
+    >>> poses = [np.eye(4, dtype=np.float32) for _ in range(3)]
+    >>> for i, T in enumerate(poses):
+    ...     T[0, 3] = 0.1 * i  # candidate offsets along x
+    >>> candidates = []
+    >>> for T in poses:
+    ...     cloud = tf.PointCloud(source_points)
+    ...     cloud.transformation = T
+    ...     candidates.append(cloud)
+    >>> errors = tf.chamfer_errors(candidates, target)
+    >>> best = candidates[int(np.argmin(errors))]
+    """
+    target = ensure_point_cloud(target)
+    sources = [ensure_point_cloud(s, dims=target.dims) for s in sources]
+
+    for source in sources:
+        if source.dtype != target.dtype:
+            raise ValueError(
+                f"Dtype mismatch: source has {source.dtype}, target has {target.dtype}"
+            )
+
+    func_name = f"chamfer_errors_{build_suffix(extract_meta(target))}"
+    cpp_func = getattr(_trueform.geometry, func_name)
+    return cpp_func([s._wrapper for s in sources], target._wrapper)
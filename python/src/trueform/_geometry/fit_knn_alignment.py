@@ -10,8 +10,7 @@ https://github.com/polydera/trueform
 import numpy as np
 from typing import Optional, TYPE_CHECKING, Union, Tuple
 
-from .. import _trueform
-from .._dispatch import extract_meta, build_suffix
+from .._dispatch import resolve_alignment
 
 if TYPE_CHECKING:
     from .._spatial.point_cloud import PointCloud
@@ -86,46 +85,5 @@ def fit_knn_alignment(
     >>> # With outlier rejection
     >>> delta = tf.fit_knn_alignment(source, target, k=5, outlier_proportion=0.1)
     """
-    # Extract clouds and normals from tuples
-    if isinstance(cloud0, tuple):
-        c0, normals0 = cloud0
-    else:
-        c0, normals0 = cloud0, None
-
-    if isinstance(cloud1, tuple):
-        c1, normals1 = cloud1
-    else:
-        c1, normals1 = cloud1, None
-
-    if c0.dims != c1.dims:
-        raise ValueError(
-            f"Dimension mismatch: cloud0 has {c0.dims}D, cloud1 has {c1.dims}D"
-        )
-    if c0.dtype != c1.dtype:
-        raise ValueError(
-            f"Dtype mismatch: cloud0 has {c0.dtype}, cloud1 has {c1.dtype}"
-        )
-    if (normals0 is not None or normals1 is not None) and c0.dims != 3:
-        raise ValueError(
-            "Point-to-plane and normal weighting only supported for 3D point clouds"
-        )
-
-    suffix = build_suffix(extract_meta(c0))
-
-    if normals0 is not None and normals1 is not None:
-        # Normal weighting (both have normals)
-        func_name = f"fit_knn_alignment_weighted_{suffix}"
-        cpp_func = getattr(_trueform.geometry, func_name)
-        return cpp_func(c0._wrapper, normals0, c1._wrapper, normals1,
-                        k, sigma, outlier_proportion)
-    elif normals1 is not None:
-        # Point-to-plane (target has normals)
-        func_name = f"fit_knn_alignment_p2plane_{suffix}"
-        cpp_func = getattr(_trueform.geometry, func_name)
-        return cpp_func(c0._wrapper, c1._wrapper, normals1,
-                        k, sigma, outlier_proportion)
-    else:
-        # Point-to-point
-        func_name = f"fit_knn_alignment_{suffix}"
-        cpp_func = getattr(_trueform.geometry, func_name)
-        return cpp_func(c0._wrapper, c1._wrapper, k, sigma, outlier_proportion)
+    cpp_func, args = resolve_alignment("fit_knn_alignment", cloud0, cloud1)
+    return cpp_func(*args, k, sigma, outlier_proportion)
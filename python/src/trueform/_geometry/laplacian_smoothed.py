@@ -7,7 +7,8 @@ Commercial licensing available via info@polydera.com.
 https://github.com/polydera/trueform
 """
 
-from typing import Union, Tuple
+from functools import lru_cache
+from typing import Optional, Union, Tuple
 import numpy as np
 from .. import _trueform
 from .._core import OffsetBlockedArray
@@ -15,10 +16,19 @@ from .._spatial import Mesh
 from .._dispatch import topology_suffix
 
 
+@lru_cache(maxsize=None)
+def _laplacian_smoothed_func(index_dtype, real_dtype, dims: int):
+    """Resolve the laplacian_smoothed binding once per dtype/dims combination."""
+    suffix = topology_suffix(index_dtype, real_dtype=real_dtype, dims=dims)
+    return getattr(_trueform.geometry, f"laplacian_smoothed_{suffix}")
+
+
 def laplacian_smoothed(
     data: Union[Mesh, Tuple[np.ndarray, OffsetBlockedArray]],
     iterations: int = 1,
-    lambda_: float = 0.5
+    lambda_: float = 0.5,
+    *,
+    mu: Optional[float] = None
 ) -> np.ndarray:
     """
     Apply Laplacian smoothing to a point set.
@@ -40,6 +50,11 @@ def laplacian_smoothed(
         - 0: no movement (returns original points)
         - 1: full movement to neighbor centroid
 
+    mu : float, optional
+        Negative smoothing factor for an inflate pass. When given, each
+        iteration runs a lambda pass followed by a mu pass in a single call
+        (Taubin lambda|mu smoothing), which avoids shrinkage. Default is None.
+
     Returns
     -------
     points : np.ndarray of shape (num_points, dims)
@@ -58,14 +73,11 @@ def laplacian_smoothed(
     >>> # From tuple (points, vertex_link)
     >>> vl = mesh.vertex_link
     >>> smoothed = tf.laplacian_smoothed((points, vl), iterations=10)
+    >>>
+    >>> # Alternate shrink and inflate passes
+    >>> smoothed = tf.laplacian_smoothed(mesh, iterations=10, lambda_=0.5, mu=-0.53)
     """
 
-    if not isinstance(iterations, int) or iterations < 1:
-        raise ValueError(f"iterations must be a positive integer, got {iterations}")
-
-    if not 0 <= lambda_ <= 1:
-        raise ValueError(f"lambda_ must be in [0, 1], got {lambda_}")
-
     if isinstance(data, Mesh):
         points = data.points
         vertex_link = data.vertex_link
@@ -77,9 +89,59 @@ def laplacian_smoothed(
             f"got {type(data).__name__}"
         )
 
+    _validate_smoothing(points, vertex_link, iterations, lambda_, mu)
+    _validate_smoothing_points(points)
+
+    # Strided views (row or column slices) are read in place by the kernel;
+    # only layouts whose strides are not whole elements need a copy
+    if any(stride % points.itemsize for stride in points.strides):
+        points = np.ascontiguousarray(points)
+
+    dims = points.shape[-1]
+    cpp_func = _laplacian_smoothed_func(vertex_link.offsets.dtype, points.dtype, dims)
+
+    return cpp_func(points, vertex_link._wrapper, iterations, lambda_, mu)
+
+
+def _validate_smoothing(points, vertex_link, iterations, lambda_, mu=None) -> None:
+    """
+    Validate smoothing parameters and argument types.
+
+    Valid inputs pass a single combined test; the individual checks below
+    only run to produce a descriptive error.
+    """
+    if (isinstance(iterations, int) and iterations >= 1
+            and 0 <= lambda_ <= 1
+            and (mu is None or mu < 0)
+            and isinstance(points, np.ndarray)
+            and isinstance(vertex_link, OffsetBlockedArray)):
+        return
+
+    if not isinstance(iterations, int) or iterations < 1:
+        raise ValueError(f"iterations must be a positive integer, got {iterations}")
+
+    if not 0 <= lambda_ <= 1:
+        raise ValueError(f"lambda_ must be in [0, 1], got {lambda_}")
+
+    if mu is not None and not mu < 0:
+        raise ValueError(f"mu must be negative, got {mu}")
+
     if not isinstance(points, np.ndarray):
         raise TypeError(f"points must be np.ndarray, got {type(points).__name__}")
 
+    if not isinstance(vertex_link, OffsetBlockedArray):
+        raise TypeError(
+            f"vertex_link must be OffsetBlockedArray, "
+            f"got {type(vertex_link).__name__}"
+        )
+
+
+def _validate_smoothing_points(points) -> None:
+    """Validate the dtype and shape of the points to smooth."""
+    if (points.ndim == 2 and points.shape[1] == 3
+            and points.dtype.char in 'fd'):
+        return
+
     if points.ndim != 2:
         raise ValueError(
             f"points must be 2D array with shape (n, dims), "
@@ -95,22 +157,3 @@ def laplacian_smoothed(
     dims = points.shape[1]
     if dims != 3:
         raise ValueError(f"points must have 3 dimensions, got {dims}")
-
-    if not points.flags['C_CONTIGUOUS']:
-        points = np.ascontiguousarray(points)
-
-    if not isinstance(vertex_link, OffsetBlockedArray):
-        raise TypeError(
-            f"vertex_link must be OffsetBlockedArray, "
-            f"got {type(vertex_link).__name__}"
-        )
-
-    suffix = topology_suffix(
-        vertex_link.offsets.dtype,
-        real_dtype=points.dtype,
-        dims=dims
-    )
-    func_name = f"laplacian_smoothed_{suffix}"
-    cpp_func = getattr(_trueform.geometry, func_name)
-
-    return cpp_func(points, vertex_link._wrapper, iterations, lambda_)
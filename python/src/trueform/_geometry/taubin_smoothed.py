@@ -7,19 +7,21 @@ Commercial licensing available via info@polydera.com.
 https://github.com/polydera/trueform
 """
 
-from typing import Union, Tuple
+from typing import Optional, Union, Tuple
 import numpy as np
 from .. import _trueform
 from .._core import OffsetBlockedArray
 from .._spatial import Mesh
-from .._dispatch import topology_suffix
 
 
 def taubin_smoothed(
     data: Union[Mesh, Tuple[np.ndarray, OffsetBlockedArray]],
     iterations: int = 1,
     lambda_: float = 0.5,
-    kpb: float = 0.1
+    kpb: float = 0.1,
+    *,
+    reorder: bool = False,
+    out: Optional[np.ndarray] = None
 ) -> np.ndarray:
     """
     Apply Taubin smoothing to a point set.
@@ -50,10 +52,22 @@ def taubin_smoothed(
         Pass-band frequency. Controls how much high-frequency detail is preserved.
         Lower values preserve more detail. Default is 0.1.
 
+    reorder : bool, optional
+        Smooth a copy whose vertices are sorted along a Morton (Z-order)
+        curve, so that spatial neighbors are also close in memory. The result
+        is returned in the caller's vertex order and is identical to the
+        unordered run. Pays off for many iterations on large meshes whose
+        vertex order is not spatially coherent. Default is False.
+
+    out : np.ndarray, optional
+        C-contiguous array with the same shape and dtype as the points to
+        write the result into. May be the points array itself to smooth in
+        place. Default is None (a new array is returned).
+
     Returns
     -------
     points : np.ndarray of shape (num_points, dims)
-        Smoothed point positions.
+        Smoothed point positions (``out`` if given).
 
     Examples
     --------
@@ -68,10 +82,15 @@ def taubin_smoothed(
     >>> # From tuple (points, vertex_link)
     >>> vl = mesh.vertex_link
     >>> smoothed = tf.taubin_smoothed((points, vl), iterations=10)
-    """
 
-    if not isinstance(iterations, int) or iterations < 0:
-        raise ValueError(f"iterations must be a non-negative integer, got {iterations}")
+    Notes
+    -----
+    All passes run in the dtype of the input points, including the
+    intermediate buffers. Smoothing is bandwidth bound on large meshes, so
+    float32 input moves half the data of float64 per pass; converting once
+    with ``points.astype(np.float32)`` is worthwhile when single precision
+    is enough for the coordinates.
+    """
 
     if isinstance(data, Mesh):
         points = data.points
@@ -84,9 +103,122 @@ def taubin_smoothed(
             f"got {type(data).__name__}"
         )
 
+    _validate_taubin(points, vertex_link, iterations)
+    _validate_taubin_points(points)
+
+    # Strided views (row or column slices) are read in place by the kernel;
+    # only layouts whose strides are not whole elements need a copy
+    if any(stride % points.itemsize for stride in points.strides):
+        points = np.ascontiguousarray(points)
+
+    if out is not None:
+        _validate_out(out, points)
+
+    # Overloaded bindings; the dtypes of the points and the vertex link
+    # select the instantiation on the C++ side, which also checks shapes
+    cpp_func = _trueform.geometry.taubin_smoothed
+
+    if not reorder or len(points) < 2:
+        if out is None:
+            return cpp_func(points, vertex_link._wrapper, iterations, lambda_, kpb)
+        _trueform.geometry.taubin_smoothed_into(
+            points, vertex_link._wrapper, out, iterations, lambda_, kpb)
+        return out
+
+    perm = _morton_order(points)
+    vertex_link = _permuted_vertex_link(vertex_link, perm)
+    smoothed = cpp_func(points[perm], vertex_link._wrapper, iterations, lambda_, kpb)
+    result = np.empty_like(smoothed) if out is None else out
+    result[perm] = smoothed
+    return result
+
+
+def _validate_out(out, points) -> None:
+    """Validate the out array; checked always since the kernel writes into it."""
+    if not isinstance(out, np.ndarray):
+        raise TypeError(f"out must be np.ndarray, got {type(out).__name__}")
+
+    if out.dtype != points.dtype or out.shape != points.shape:
+        raise ValueError(
+            f"out must match points (shape {points.shape}, dtype {points.dtype}), "
+            f"got shape {out.shape}, dtype {out.dtype}"
+        )
+
+    if not out.flags['C_CONTIGUOUS'] or not out.flags['WRITEABLE']:
+        raise ValueError("out must be a writeable C-contiguous array")
+
+
+def _spread_bits(x: np.ndarray) -> np.ndarray:
+    """Interleave the low 21 bits of x with two zero bits each."""
+    x = x & np.uint64(0x1fffff)
+    x = (x | (x << np.uint64(32))) & np.uint64(0x1f00000000ffff)
+    x = (x | (x << np.uint64(16))) & np.uint64(0x1f0000ff0000ff)
+    x = (x | (x << np.uint64(8))) & np.uint64(0x100f00f00f00f00f)
+    x = (x | (x << np.uint64(4))) & np.uint64(0x10c30c30c30c30c3)
+    x = (x | (x << np.uint64(2))) & np.uint64(0x1249249249249249)
+    return x
+
+
+def _morton_order(points: np.ndarray) -> np.ndarray:
+    """Permutation that sorts 3D points along a 63-bit Morton curve."""
+    lo = points.min(axis=0).astype(np.float64)
+    extent = points.max(axis=0) - lo
+    scale = np.divide((1 << 21) - 1, extent,
+                      out=np.zeros_like(extent), where=extent > 0)
+    q = ((points - lo) * scale).astype(np.uint64)
+    code = (_spread_bits(q[:, 0])
+            | (_spread_bits(q[:, 1]) << np.uint64(1))
+            | (_spread_bits(q[:, 2]) << np.uint64(2)))
+    return np.argsort(code, kind='stable')
+
+
+def _permuted_vertex_link(vertex_link: OffsetBlockedArray,
+                          perm: np.ndarray) -> OffsetBlockedArray:
+    """
+    Vertex link of the points reordered by perm (new vertex i is old perm[i]).
+
+    Each neighbor list keeps its order, so the smoothing sums are evaluated
+    exactly as for the original ordering.
+    """
+    offsets = vertex_link.offsets
+    data = vertex_link.data
+    counts = np.diff(offsets)[perm]
+
+    new_offsets = np.zeros(len(offsets), dtype=offsets.dtype)
+    np.cumsum(counts, out=new_offsets[1:])
+
+    # Position in data of every entry of the reordered lists
+    src = (np.repeat(offsets[:-1][perm] - new_offsets[:-1], counts)
+           + np.arange(new_offsets[-1], dtype=offsets.dtype))
+
+    inv_perm = np.empty_like(perm)
+    inv_perm[perm] = np.arange(len(perm), dtype=perm.dtype)
+    new_data = inv_perm[data[src]].astype(data.dtype, copy=False)
+
+    return OffsetBlockedArray(new_offsets, new_data)
+
+
+def _validate_taubin(points, vertex_link, iterations) -> None:
+    """Validate taubin_smoothed parameters and argument types."""
+    if not isinstance(iterations, int) or iterations < 0:
+        raise ValueError(f"iterations must be a non-negative integer, got {iterations}")
+
     if not isinstance(points, np.ndarray):
         raise TypeError(f"points must be np.ndarray, got {type(points).__name__}")
 
+    if not isinstance(vertex_link, OffsetBlockedArray):
+        raise TypeError(
+            f"vertex_link must be OffsetBlockedArray, "
+            f"got {type(vertex_link).__name__}"
+        )
+
+
+def _validate_taubin_points(points) -> None:
+    """Validate the dtype and shape of the taubin_smoothed points."""
+    if (points.ndim == 2 and points.shape[1] == 3
+            and points.dtype.char in 'fd'):
+        return
+
     if points.ndim != 2:
         raise ValueError(
             f"points must be 2D array with shape (n, dims), "
@@ -102,22 +234,3 @@ def taubin_smoothed(
     dims = points.shape[1]
     if dims != 3:
         raise ValueError(f"points must have 3 dimensions, got {dims}")
-
-    if not points.flags['C_CONTIGUOUS']:
-        points = np.ascontiguousarray(points)
-
-    if not isinstance(vertex_link, OffsetBlockedArray):
-        raise TypeError(
-            f"vertex_link must be OffsetBlockedArray, "
-            f"got {type(vertex_link).__name__}"
-        )
-
-    suffix = topology_suffix(
-        vertex_link.offsets.dtype,
-        real_dtype=points.dtype,
-        dims=dims
-    )
-    func_name = f"taubin_smoothed_{suffix}"
-    cpp_func = getattr(_trueform.geometry, func_name)
-
-    return cpp_func(points, vertex_link._wrapper, iterations, lambda_, kpb)
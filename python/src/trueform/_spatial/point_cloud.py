@@ -55,7 +55,9 @@ class PointCloud:
         Parameters
         ----------
         points : np.ndarray
-            Array of shape (N, D) where D is 2 or 3, with dtype float32 or float64
+            Array of shape (N, D) where D is 2 or 3, with dtype float32 or float64.
+            A C-contiguous float32 or float64 array is used without copying;
+            other inputs are converted once.
         transformation : np.ndarray, optional
             Transformation matrix (3x3 for 2D, 4x4 for 3D). If provided, applies
             transformation to points during spatial queries.
@@ -150,10 +152,44 @@ class PointCloud:
         """
         Build the spatial index tree.
 
-        Call this after modifying the points array to update the spatial index.
+        The tree is built on first use and cached, so repeated queries and
+        ``fit_icp_alignment`` calls against the same cloud share it. Assigning
+        ``points`` invalidates it; changing ``transformation`` does not, as
+        the transformation is applied at query time. Call this to pay the
+        build cost up front instead of in the first query.
         """
         self._wrapper.build_tree()
 
+    def optimize_memory_layout(self) -> np.ndarray:
+        """
+        Reorder the points to match the leaf order of the spatial tree.
+
+        Points stored in the same tree leaf become adjacent in memory, so a
+        query reads each visited leaf sequentially instead of gathering
+        points from across the array. Worth doing once for a cloud that is
+        queried many times, such as the target of ``fit_icp_alignment``.
+
+        The point order changes, so ids returned by later queries refer to
+        the reordered points. Map them back with ``perm[ids]``.
+
+        Returns
+        -------
+        np.ndarray
+            Permutation ``perm`` such that the new ``points`` equal
+            ``old_points[perm]``.
+
+        Examples
+        --------
+        >>> cloud = tf.PointCloud(points)
+        >>> perm = cloud.optimize_memory_layout()
+        >>> idx, dist2, closest = tf.neighbor_search(cloud, query)
+        >>> original_idx = perm[idx]
+        """
+        perm = self._wrapper.tree_order()
+        self.points = self._points[perm]
+        self.build_tree()
+        return perm
+
     def shared_view(self) -> "PointCloud":
         """
         Create a new PointCloud instance sharing the same underlying data.
@@ -20,8 +20,9 @@ from .boundary_curves import boundary_curves
 from .non_manifold_edges import non_manifold_edges
 from .orient_faces_consistently import orient_faces_consistently
 from .connect_edges_to_paths import connect_edges_to_paths
-from .is_closed import is_closed, is_open
-from .is_manifold import is_manifold, is_non_manifold
+from .is_closed import is_closed, is_open, is_closed_batch
+from .is_manifold import is_manifold, is_non_manifold, is_manifold_batch
+from .check_topology import check_topology
 
 __all__ = [
     'label_connected_components',
@@ -42,4 +43,7 @@ __all__ = [
     'is_open',
     'is_manifold',
     'is_non_manifold',
+    'is_closed_batch',
+    'is_manifold_batch',
+    'check_topology',
 ]
@@ -0,0 +1,68 @@
+"""
+check_topology() function implementation
+
+Copyright (c) 2025 Ziga Sajovic, XLAB
+Licensed for noncommercial use under the PolyForm Noncommercial License 1.0.0.
+Commercial licensing available via info@polydera.com.
+https://github.com/polydera/trueform
+"""
+
+from typing import Tuple
+
+from .. import _trueform
+from .._spatial import Mesh
+from .is_closed import _cached_edge_peers
+
+
+def check_topology(mesh: Mesh) -> Tuple[bool, bool]:
+    """
+    Check if a mesh is manifold and closed in a single pass.
+
+    Equivalent to ``(is_manifold(mesh), is_closed(mesh))``, but every edge
+    is looked up once and classified as boundary or non-manifold in the
+    same scan.
+
+    Parameters
+    ----------
+    mesh : Mesh
+        The mesh to check.
+
+    Returns
+    -------
+    is_manifold : bool
+        True if no edge is shared by more than two faces.
+    is_closed : bool
+        True if no edge belongs to a single face.
+
+    Examples
+    --------
+    >>> import trueform as tf
+    >>> mesh = tf.Mesh(*tf.make_sphere_mesh(1.0))
+    >>> tf.check_topology(mesh)
+    (True, True)
+    """
+    if not isinstance(mesh, Mesh):
+        raise TypeError(f"mesh must be Mesh, got {type(mesh).__name__}")
+
+    if not mesh.is_dynamic and mesh.ngon != 3:
+        raise ValueError(
+            f"mesh must have triangular faces or be dynamic, got {mesh.ngon} vertices per face."
+        )
+
+    peers = _cached_edge_peers(mesh)
+    if peers is not None:
+        if peers.size == 0:
+            return True, True
+        # Boundary edges are -1 and non-manifold edges are below it, so the
+        # minimum decides manifoldness and a single mask decides closedness
+        return bool(peers.min() > -2), not bool((peers == -1).any())
+
+    fm = mesh._wrapper.face_membership_array()
+
+    # Single overloaded binding; the index dtype and face type of the
+    # arguments select the instantiation on the C++ side
+    cpp_func = _trueform.topology.check_topology
+
+    if mesh.is_dynamic:
+        return cpp_func(mesh._wrapper.faces_array(), fm)
+    return cpp_func(mesh.faces, fm)
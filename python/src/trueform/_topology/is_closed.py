@@ -1,5 +1,5 @@
 """
-is_closed() and is_open() function implementations
+is_closed(), is_open() and is_closed_batch() function implementations
 
 Copyright (c) 2025 Ziga Sajovic, XLAB
 Licensed for noncommercial use under the PolyForm Noncommercial License 1.0.0.
@@ -7,11 +7,70 @@ Commercial licensing available via info@polydera.com.
 https://github.com/polydera/trueform
 """
 
+from functools import lru_cache
+from typing import Sequence
+
+import numpy as np
+
 from .. import _trueform
 from .._spatial import Mesh
 from .._dispatch import topology_suffix
 
 
+@lru_cache(maxsize=None)
+def _batch_func(name: str, index_dtype, ngon: str):
+    """Resolve the batched binding of a mesh check once per combination."""
+    suffix = topology_suffix(index_dtype, ngon)
+    return getattr(_trueform.topology, f"{name}_batch_{suffix}")
+
+
+def _check_meshes(meshes: Sequence[Mesh], name: str) -> np.ndarray:
+    """
+    Run a batched mesh check, one native call per (index dtype, ngon) group.
+    """
+    meshes = list(meshes)
+    groups = {}
+    for i, mesh in enumerate(meshes):
+        if not isinstance(mesh, Mesh):
+            raise TypeError(
+                f"meshes[{i}] must be Mesh, got {type(mesh).__name__}"
+            )
+        if not mesh.is_dynamic and mesh.ngon != 3:
+            raise ValueError(
+                f"meshes[{i}] must have triangular faces or be dynamic, "
+                f"got {mesh.ngon} vertices per face."
+            )
+        ngon = 'dyn' if mesh.is_dynamic else '3'
+        groups.setdefault((mesh.faces.dtype, ngon), []).append(i)
+
+    result = np.empty(len(meshes), dtype=bool)
+    for (index_dtype, ngon), ids in groups.items():
+        cpp_func = _batch_func(name, index_dtype, ngon)
+        if ngon == 'dyn':
+            cells = [meshes[i]._wrapper.faces_array() for i in ids]
+        else:
+            cells = [meshes[i].faces for i in ids]
+        fms = [meshes[i]._wrapper.face_membership_array() for i in ids]
+        result[ids] = cpp_func(cells, fms)
+    return result
+
+
+def _cached_edge_peers(mesh: Mesh):
+    """
+    Flat view of the mesh's manifold edge link, or None if it is not built.
+
+    The manifold edge link already classifies every face edge as simple,
+    boundary (-1) or non-manifold (-2, -3), so once it exists closedness
+    and manifoldness are a single reduction over it.
+    """
+    if not mesh._wrapper.has_manifold_edge_link():
+        return None
+    mel = mesh._wrapper.manifold_edge_link_array()
+    if mesh.is_dynamic:
+        return mel.data_array()
+    return mel
+
+
 def is_closed(mesh: Mesh) -> bool:
     """
     Check if a mesh is closed (watertight).
@@ -56,13 +115,16 @@ def is_closed(mesh: Mesh) -> bool:
             f"mesh must have triangular faces or be dynamic, got {mesh.ngon} vertices per face."
         )
 
+    peers = _cached_edge_peers(mesh)
+    if peers is not None:
+        return not bool((peers == -1).any())
+
     faces = mesh.faces
     fm = mesh._wrapper.face_membership_array()
 
-    ngon = 'dyn' if mesh.is_dynamic else '3'
-    suffix = topology_suffix(faces.dtype, ngon)
-    func_name = f"is_closed_{suffix}"
-    cpp_func = getattr(_trueform.topology, func_name)
+    # Single overloaded binding; the index dtype and face type of the
+    # arguments select the instantiation on the C++ side
+    cpp_func = _trueform.topology.is_closed
 
     if mesh.is_dynamic:
         return cpp_func(mesh._wrapper.faces_array(), fm)
@@ -99,3 +161,32 @@ def is_open(mesh: Mesh) -> bool:
     True
     """
     return not is_closed(mesh)
+
+
+def is_closed_batch(meshes: Sequence[Mesh]) -> np.ndarray:
+    """
+    Check many meshes for closedness in one call.
+
+    Equivalent to ``[is_closed(m) for m in meshes]``, but the meshes are
+    checked in parallel by a single native call per index dtype and face
+    type, without holding the GIL.
+
+    Parameters
+    ----------
+    meshes : sequence of Mesh
+        The meshes to check.
+
+    Returns
+    -------
+    np.ndarray
+        Boolean array of shape (len(meshes),), True where the mesh is closed.
+
+    Examples
+    --------
+    >>> import trueform as tf
+    >>> meshes = [tf.Mesh(*tf.make_sphere_mesh(1.0)),
+    ...           tf.Mesh(*tf.make_plane_mesh(1.0, 1.0))]
+    >>> tf.is_closed_batch(meshes)
+    array([ True, False])
+    """
+    return _check_meshes(meshes, "is_closed")
@@ -1,5 +1,5 @@
 """
-is_manifold() and is_non_manifold() function implementations
+is_manifold(), is_non_manifold() and is_manifold_batch() function implementations
 
 Copyright (c) 2025 Ziga Sajovic, XLAB
 Licensed for noncommercial use under the PolyForm Noncommercial License 1.0.0.
@@ -7,9 +7,13 @@ Commercial licensing available via info@polydera.com.
 https://github.com/polydera/trueform
 """
 
+from typing import Sequence
+
+import numpy as np
+
 from .. import _trueform
 from .._spatial import Mesh
-from .._dispatch import topology_suffix
+from .is_closed import _cached_edge_peers, _check_meshes
 
 
 def is_manifold(mesh: Mesh) -> bool:
@@ -50,13 +54,18 @@ def is_manifold(mesh: Mesh) -> bool:
             f"mesh must have triangular faces or be dynamic, got {mesh.ngon} vertices per face."
         )
 
+    peers = _cached_edge_peers(mesh)
+    if peers is not None:
+        # Non-manifold markers are the smallest values, so a min reduction
+        # answers without materializing a mask
+        return peers.size == 0 or bool(peers.min() > -2)
+
     faces = mesh.faces
     fm = mesh._wrapper.face_membership_array()
 
-    ngon = 'dyn' if mesh.is_dynamic else '3'
-    suffix = topology_suffix(faces.dtype, ngon)
-    func_name = f"is_manifold_{suffix}"
-    cpp_func = getattr(_trueform.topology, func_name)
+    # Single overloaded binding; the index dtype and face type of the
+    # arguments select the instantiation on the C++ side
+    cpp_func = _trueform.topology.is_manifold
 
     if mesh.is_dynamic:
         return cpp_func(mesh._wrapper.faces_array(), fm)
@@ -94,3 +103,32 @@ def is_non_manifold(mesh: Mesh) -> bool:
     True
     """
     return not is_manifold(mesh)
+
+
+def is_manifold_batch(meshes: Sequence[Mesh]) -> np.ndarray:
+    """
+    Check many meshes for manifoldness in one call.
+
+    Equivalent to ``[is_manifold(m) for m in meshes]``, but the meshes are
+    checked in parallel by a single native call per index dtype and face
+    type, without holding the GIL.
+
+    Parameters
+    ----------
+    meshes : sequence of Mesh
+        The meshes to check.
+
+    Returns
+    -------
+    np.ndarray
+        Boolean array of shape (len(meshes),), True where the mesh is manifold.
+
+    Examples
+    --------
+    >>> import trueform as tf
+    >>> meshes = [tf.Mesh(*tf.make_sphere_mesh(1.0)),
+    ...           tf.Mesh(*tf.make_plane_mesh(1.0, 1.0))]
+    >>> tf.is_manifold_batch(meshes)
+    array([ True,  True])
+    """
+    return _check_meshes(meshes, "is_manifold")
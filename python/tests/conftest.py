@@ -0,0 +1,15 @@
+"""
+Shared pytest configuration for the trueform Python tests
+
+Copyright (c) 2025 Ziga Sajovic, XLAB
+"""
+
+
+def pytest_configure(config):
+    # pytest-xdist registers xdist_group itself; declare it here too so runs
+    # without xdist (plain pytest, run_tests.py) do not warn about the mark
+    config.addinivalue_line(
+        "markers",
+        "xdist_group(name): run the marked tests on one xdist worker "
+        "(--dist=loadgroup)",
+    )
@@ -199,6 +199,58 @@ def test_symmetric_chamfer_distance(dtype, dims):
     assert isinstance(symmetric_error, float)
 
 
+# ==============================================================================
+# Batched Tests
+# ==============================================================================
+
+@pytest.mark.parametrize("dtype", REAL_DTYPES)
+@pytest.mark.parametrize("dims", DIMS)
+def test_chamfer_errors_matches_chamfer_error(dtype, dims):
+    """Batched errors should match per-source chamfer_error calls."""
+    target = tf.PointCloud(np.random.rand(200, dims).astype(dtype))
+
+    sources = []
+    for offset in [0.0, 0.1, 0.5]:
+        pts = np.random.rand(50, dims).astype(dtype)
+        pts[:, 0] += offset
+        sources.append(tf.PointCloud(pts))
+
+    # Mix in a transformed source and a raw array
+    T = np.eye(dims + 1, dtype=dtype)
+    T[0, dims] = 0.25
+    sources[1].transformation = T
+    sources.append(np.random.rand(30, dims).astype(dtype))
+
+    errors = tf.chamfer_errors(sources, target)
+
+    assert errors.shape == (len(sources),)
+    assert errors.dtype == dtype
+    for source, error in zip(sources, errors):
+        expected = tf.chamfer_error(source, target)
+        assert abs(error - expected) < 1e-5
+
+
+def test_chamfer_errors_empty():
+    """No sources should give an empty array."""
+    target = tf.PointCloud(np.random.rand(10, 3).astype(np.float32))
+
+    errors = tf.chamfer_errors([], target)
+
+    assert errors.shape == (0,)
+
+
+def test_chamfer_errors_dtype_mismatch():
+    """Should raise error if any source dtype differs from target."""
+    target = tf.PointCloud(np.random.rand(10, 3).astype(np.float32))
+    sources = [
+        tf.PointCloud(np.random.rand(10, 3).astype(np.float32)),
+        tf.PointCloud(np.random.rand(10, 3).astype(np.float64)),
+    ]
+
+    with pytest.raises(ValueError, match="Dtype mismatch"):
+        tf.chamfer_errors(sources, target)
+
+
 # ==============================================================================
 # Error Handling Tests
 # ==============================================================================
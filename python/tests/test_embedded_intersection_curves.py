@@ -8,6 +8,8 @@ https://github.com/polydera/trueform
 """
 
 import sys
+from functools import lru_cache
+
 import numpy as np
 import pytest
 import trueform as tf
@@ -18,8 +20,27 @@ INDEX_DTYPES = [np.int32, np.int64]
 MESH_TYPES = ['triangle', 'dynamic']
 
 
+@lru_cache(maxsize=None)
+def sphere_mesh(radius, stacks, segments, dtype, index_dtype):
+    """Sphere (faces, points), built once per parameter set. Do not modify."""
+    return tf.make_sphere_mesh(
+        radius, stacks=stacks, segments=segments, dtype=dtype, index_dtype=index_dtype)
+
+
+@lru_cache(maxsize=None)
+def unit_box_mesh(dtype, index_dtype):
+    """Unit box (faces, points), built once per dtype pair. Do not modify."""
+    return tf.make_box_mesh(1.0, 1.0, 1.0, dtype=dtype, index_dtype=index_dtype)
+
+
 def prepare_mesh(mesh):
-    """Build required structures for operations."""
+    """
+    Build the structures embedded_intersection_curves reads.
+
+    The binding tags each mesh with its tree, face membership and manifold
+    edge link, so all three are needed; building them here only moves the
+    work out of the call under test, it does not add any.
+    """
     mesh.build_tree()
     mesh.build_face_membership()
     mesh.build_manifold_edge_link()
@@ -56,12 +77,10 @@ def test_overlapping_spheres(index_dtype, dtype, mesh_type):
     radius = dtype(1.0)
     separation = dtype(1.0)
 
-    faces1, points1 = tf.make_sphere_mesh(
-        radius, stacks=50, segments=50, dtype=dtype, index_dtype=index_dtype)
+    faces1, points1 = sphere_mesh(radius, 50, 50, dtype, index_dtype)
     sphere1 = prepare_mesh(make_mesh(faces1, points1, mesh_type))
 
-    faces2, points2 = tf.make_sphere_mesh(
-        radius, stacks=50, segments=50, dtype=dtype, index_dtype=index_dtype)
+    faces2, points2 = sphere_mesh(radius, 50, 50, dtype, index_dtype)
     points2_translated = points2.copy()
     points2_translated[:, 0] += float(separation)
     sphere2 = prepare_mesh(make_mesh(faces2, points2_translated, mesh_type))
@@ -73,8 +92,9 @@ def test_overlapping_spheres(index_dtype, dtype, mesh_type):
 
     # Topology preserved
     result_mesh = tf.Mesh(result_faces, result_points)
-    assert tf.is_manifold(result_mesh)
-    assert tf.is_closed(result_mesh)
+    is_manifold, is_closed = tf.check_topology(result_mesh)
+    assert is_manifold
+    assert is_closed
 
     # Volume preserved
     result_volume = tf.volume((result_faces, result_points))
@@ -100,12 +120,10 @@ def test_overlapping_spheres_with_curves(index_dtype, dtype, mesh_type):
     radius = dtype(1.0)
     separation = dtype(1.0)
 
-    faces1, points1 = tf.make_sphere_mesh(
-        radius, stacks=50, segments=50, dtype=dtype, index_dtype=index_dtype)
+    faces1, points1 = sphere_mesh(radius, 50, 50, dtype, index_dtype)
     sphere1 = prepare_mesh(make_mesh(faces1, points1, mesh_type))
 
-    faces2, points2 = tf.make_sphere_mesh(
-        radius, stacks=50, segments=50, dtype=dtype, index_dtype=index_dtype)
+    faces2, points2 = sphere_mesh(radius, 50, 50, dtype, index_dtype)
     points2_translated = points2.copy()
     points2_translated[:, 0] += float(separation)
     sphere2 = prepare_mesh(make_mesh(faces2, points2_translated, mesh_type))
@@ -115,8 +133,9 @@ def test_overlapping_spheres_with_curves(index_dtype, dtype, mesh_type):
 
     # Topology preserved
     result_mesh = tf.Mesh(result_faces, result_points)
-    assert tf.is_manifold(result_mesh)
-    assert tf.is_closed(result_mesh)
+    is_manifold, is_closed = tf.check_topology(result_mesh)
+    assert is_manifold
+    assert is_closed
 
     # Curves should form a closed loop (intersection circle)
     assert len(paths) == 1
@@ -136,10 +155,10 @@ def test_overlapping_spheres_with_curves(index_dtype, dtype, mesh_type):
 @pytest.mark.parametrize("mesh_type", MESH_TYPES)
 def test_non_overlapping(index_dtype, dtype, mesh_type):
     """Non-overlapping meshes return mesh unchanged."""
-    faces1, points1 = tf.make_box_mesh(1.0, 1.0, 1.0, dtype=dtype, index_dtype=index_dtype)
+    faces1, points1 = unit_box_mesh(dtype, index_dtype)
     box1 = prepare_mesh(make_mesh(faces1, points1, mesh_type))
 
-    faces2, points2 = tf.make_box_mesh(1.0, 1.0, 1.0, dtype=dtype, index_dtype=index_dtype)
+    faces2, points2 = unit_box_mesh(dtype, index_dtype)
     points2_translated = points2.copy()
     points2_translated[:, 0] += 5.0
     box2 = prepare_mesh(make_mesh(faces2, points2_translated, mesh_type))
@@ -160,18 +179,19 @@ def test_non_overlapping(index_dtype, dtype, mesh_type):
 
     # Topology preserved
     result_mesh = tf.Mesh(result_faces, result_points)
-    assert tf.is_manifold(result_mesh)
-    assert tf.is_closed(result_mesh)
+    is_manifold, is_closed = tf.check_topology(result_mesh)
+    assert is_manifold
+    assert is_closed
 
 
 @pytest.mark.parametrize("index_dtype", INDEX_DTYPES)
 @pytest.mark.parametrize("dtype", REAL_DTYPES)
 def test_non_overlapping_with_curves(index_dtype, dtype):
     """Non-overlapping meshes return no curves."""
-    faces1, points1 = tf.make_box_mesh(1.0, 1.0, 1.0, dtype=dtype, index_dtype=index_dtype)
+    faces1, points1 = unit_box_mesh(dtype, index_dtype)
     box1 = prepare_mesh(make_mesh(faces1, points1))
 
-    faces2, points2 = tf.make_box_mesh(1.0, 1.0, 1.0, dtype=dtype, index_dtype=index_dtype)
+    faces2, points2 = unit_box_mesh(dtype, index_dtype)
     points2_translated = points2.copy()
     points2_translated[:, 0] += 5.0
     box2 = prepare_mesh(make_mesh(faces2, points2_translated))
@@ -192,10 +212,10 @@ def test_non_overlapping_with_curves(index_dtype, dtype):
 @pytest.mark.parametrize("mesh_type", MESH_TYPES)
 def test_overlapping_boxes(index_dtype, dtype, mesh_type):
     """Embed intersection curves between overlapping boxes."""
-    faces1, points1 = tf.make_box_mesh(1.0, 1.0, 1.0, dtype=dtype, index_dtype=index_dtype)
+    faces1, points1 = unit_box_mesh(dtype, index_dtype)
     box1 = prepare_mesh(make_mesh(faces1, points1, mesh_type))
 
-    faces2, points2 = tf.make_box_mesh(1.0, 1.0, 1.0, dtype=dtype, index_dtype=index_dtype)
+    faces2, points2 = unit_box_mesh(dtype, index_dtype)
     points2_translated = points2.copy()
     points2_translated[:, 0] += 0.5
     box2 = prepare_mesh(make_mesh(faces2, points2_translated, mesh_type))
@@ -208,8 +228,9 @@ def test_overlapping_boxes(index_dtype, dtype, mesh_type):
 
     # Topology preserved
     result_mesh = tf.Mesh(result_faces, result_points)
-    assert tf.is_manifold(result_mesh)
-    assert tf.is_closed(result_mesh)
+    is_manifold, is_closed = tf.check_topology(result_mesh)
+    assert is_manifold
+    assert is_closed
 
     # Volume preserved
     result_volume = tf.volume((result_faces, result_points))
@@ -235,12 +256,10 @@ def test_nested_spheres(index_dtype, dtype, mesh_type):
     outer_radius = dtype(2.0)
     inner_radius = dtype(1.0)
 
-    faces1, points1 = tf.make_sphere_mesh(
-        outer_radius, stacks=40, segments=40, dtype=dtype, index_dtype=index_dtype)
+    faces1, points1 = sphere_mesh(outer_radius, 40, 40, dtype, index_dtype)
     outer = prepare_mesh(make_mesh(faces1, points1, mesh_type))
 
-    faces2, points2 = tf.make_sphere_mesh(
-        inner_radius, stacks=30, segments=30, dtype=dtype, index_dtype=index_dtype)
+    faces2, points2 = sphere_mesh(inner_radius, 30, 30, dtype, index_dtype)
     inner = prepare_mesh(make_mesh(faces2, points2, mesh_type))
 
     original_num_faces = get_num_faces(faces1)
@@ -260,8 +279,9 @@ def test_nested_spheres(index_dtype, dtype, mesh_type):
 
     # Topology preserved
     result_mesh = tf.Mesh(result_faces, result_points)
-    assert tf.is_manifold(result_mesh)
-    assert tf.is_closed(result_mesh)
+    is_manifold, is_closed = tf.check_topology(result_mesh)
+    assert is_manifold
+    assert is_closed
 
     # No intersection curves
     assert len(paths) == 0
@@ -274,35 +294,39 @@ def test_nested_spheres(index_dtype, dtype, mesh_type):
 @pytest.mark.parametrize("dtype", REAL_DTYPES)
 def test_mixed_index_types_int32_int64(dtype):
     """int32 mesh with int64 mesh works."""
-    faces1, points1 = tf.make_sphere_mesh(1.0, stacks=30, segments=30, dtype=dtype, index_dtype=np.int32)
+    faces1, points1 = sphere_mesh(1.0, 30, 30, dtype, np.int32)
     sphere1 = prepare_mesh(tf.Mesh(faces1, points1))
 
-    faces2, points2 = tf.make_sphere_mesh(1.0, stacks=30, segments=30, dtype=dtype, index_dtype=np.int64)
-    points2[:, 0] += 1.0
-    sphere2 = prepare_mesh(tf.Mesh(faces2, points2))
+    faces2, points2 = sphere_mesh(1.0, 30, 30, dtype, np.int64)
+    points2_translated = points2.copy()
+    points2_translated[:, 0] += 1.0
+    sphere2 = prepare_mesh(tf.Mesh(faces2, points2_translated))
 
     result_faces, result_points = tf.embedded_intersection_curves(sphere1, sphere2)
 
     result_mesh = tf.Mesh(result_faces, result_points)
-    assert tf.is_manifold(result_mesh)
-    assert tf.is_closed(result_mesh)
+    is_manifold, is_closed = tf.check_topology(result_mesh)
+    assert is_manifold
+    assert is_closed
 
 
 @pytest.mark.parametrize("dtype", REAL_DTYPES)
 def test_mixed_index_types_int64_int32(dtype):
     """int64 mesh with int32 mesh works (asymmetric case)."""
-    faces1, points1 = tf.make_sphere_mesh(1.0, stacks=30, segments=30, dtype=dtype, index_dtype=np.int64)
+    faces1, points1 = sphere_mesh(1.0, 30, 30, dtype, np.int64)
     sphere1 = prepare_mesh(tf.Mesh(faces1, points1))
 
-    faces2, points2 = tf.make_sphere_mesh(1.0, stacks=30, segments=30, dtype=dtype, index_dtype=np.int32)
-    points2[:, 0] += 1.0
-    sphere2 = prepare_mesh(tf.Mesh(faces2, points2))
+    faces2, points2 = sphere_mesh(1.0, 30, 30, dtype, np.int32)
+    points2_translated = points2.copy()
+    points2_translated[:, 0] += 1.0
+    sphere2 = prepare_mesh(tf.Mesh(faces2, points2_translated))
 
     result_faces, result_points = tf.embedded_intersection_curves(sphere1, sphere2)
 
     result_mesh = tf.Mesh(result_faces, result_points)
-    assert tf.is_manifold(result_mesh)
-    assert tf.is_closed(result_mesh)
+    is_manifold, is_closed = tf.check_topology(result_mesh)
+    assert is_manifold
+    assert is_closed
 
 
 # ==============================================================================
@@ -313,10 +337,10 @@ def test_mixed_index_types_int64_int32(dtype):
 @pytest.mark.parametrize("dtype", REAL_DTYPES)
 def test_mixed_mesh_types_triangle_dynamic(index_dtype, dtype):
     """Triangle mesh0 with dynamic mesh1 returns triangle result."""
-    faces1, points1 = tf.make_box_mesh(1.0, 1.0, 1.0, dtype=dtype, index_dtype=index_dtype)
+    faces1, points1 = unit_box_mesh(dtype, index_dtype)
     box1 = prepare_mesh(make_mesh(faces1, points1, 'triangle'))
 
-    faces2, points2 = tf.make_box_mesh(1.0, 1.0, 1.0, dtype=dtype, index_dtype=index_dtype)
+    faces2, points2 = unit_box_mesh(dtype, index_dtype)
     points2_translated = points2.copy()
     points2_translated[:, 0] += 0.5
     box2 = prepare_mesh(make_mesh(faces2, points2_translated, 'dynamic'))
@@ -327,18 +351,19 @@ def test_mixed_mesh_types_triangle_dynamic(index_dtype, dtype):
     assert isinstance(result_faces, np.ndarray)
 
     result_mesh = tf.Mesh(result_faces, result_points)
-    assert tf.is_manifold(result_mesh)
-    assert tf.is_closed(result_mesh)
+    is_manifold, is_closed = tf.check_topology(result_mesh)
+    assert is_manifold
+    assert is_closed
 
 
 @pytest.mark.parametrize("index_dtype", INDEX_DTYPES)
 @pytest.mark.parametrize("dtype", REAL_DTYPES)
 def test_mixed_mesh_types_dynamic_triangle(index_dtype, dtype):
     """Dynamic mesh0 with triangle mesh1 returns dynamic result."""
-    faces1, points1 = tf.make_box_mesh(1.0, 1.0, 1.0, dtype=dtype, index_dtype=index_dtype)
+    faces1, points1 = unit_box_mesh(dtype, index_dtype)
     box1 = prepare_mesh(make_mesh(faces1, points1, 'dynamic'))
 
-    faces2, points2 = tf.make_box_mesh(1.0, 1.0, 1.0, dtype=dtype, index_dtype=index_dtype)
+    faces2, points2 = unit_box_mesh(dtype, index_dtype)
     points2_translated = points2.copy()
     points2_translated[:, 0] += 0.5
     box2 = prepare_mesh(make_mesh(faces2, points2_translated, 'triangle'))
@@ -349,8 +374,9 @@ def test_mixed_mesh_types_dynamic_triangle(index_dtype, dtype):
     assert isinstance(result_faces, tf.OffsetBlockedArray)
 
     result_mesh = tf.Mesh(result_faces, result_points)
-    assert tf.is_manifold(result_mesh)
-    assert tf.is_closed(result_mesh)
+    is_manifold, is_closed = tf.check_topology(result_mesh)
+    assert is_manifold
+    assert is_closed
 
 
 # ==============================================================================
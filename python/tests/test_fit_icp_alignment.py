@@ -46,10 +46,7 @@ def create_rotation_translation_z_3d(angle_degrees, tx, ty, tz, dtype):
 
 def apply_transform_3d(points, T):
     """Apply 4x4 homogeneous transform to 3D points."""
-    n = len(points)
-    homogeneous = np.hstack([points, np.ones((n, 1), dtype=points.dtype)])
-    transformed = (T @ homogeneous.T).T
-    return transformed[:, :3]
+    return points @ T[:3, :3].T + T[:3, 3]
 
 
 def create_rotation_2d(angle_degrees, dtype):
@@ -66,10 +63,7 @@ def create_rotation_2d(angle_degrees, dtype):
 
 def apply_transform_2d(points, T):
     """Apply 3x3 homogeneous transform to 2D points."""
-    n = len(points)
-    homogeneous = np.hstack([points, np.ones((n, 1), dtype=points.dtype)])
-    transformed = (T @ homogeneous.T).T
-    return transformed[:, :2]
+    return points @ T[:2, :2].T + T[:2, 2]
 
 
 # ==============================================================================
@@ -368,6 +362,36 @@ def test_fit_icp_alignment_with_initial_transform(dtype):
     assert error < 0.05, f"ICP with initial transform should converge, got error {error}"
 
 
+@pytest.mark.parametrize("dtype", REAL_DTYPES)
+def test_fit_icp_alignment_reused_target(dtype):
+    """A target reused across calls matches a freshly built one."""
+    np.random.seed(42)
+    pts0 = np.random.rand(200, 3).astype(dtype) * 2 - 1
+    T_true = create_rotation_translation_z_3d(5, 0.05, -0.03, 0.02, dtype)
+    pts1 = apply_transform_3d(pts0, T_true).astype(dtype)
+
+    source = tf.PointCloud(pts0)
+    target = tf.PointCloud(pts1)
+    tf.fit_icp_alignment(source, target, n_samples=0, max_iterations=20)
+
+    # Changing the transformation keeps the cached tree valid
+    T_target = create_rotation_translation_z_3d(0, 0.02, 0.0, 0.0, dtype)
+    target.transformation = T_target
+    fresh = tf.PointCloud(pts1, transformation=T_target)
+    T_reused = tf.fit_icp_alignment(source, target, n_samples=0, max_iterations=20)
+    T_fresh = tf.fit_icp_alignment(source, fresh, n_samples=0, max_iterations=20)
+    np.testing.assert_allclose(T_reused, T_fresh, atol=1e-6)
+
+    # Replacing the points rebuilds it
+    target.transformation = None
+    target.points = pts0
+    T_reused = tf.fit_icp_alignment(source, target, n_samples=0, max_iterations=20)
+    T_fresh = tf.fit_icp_alignment(
+        source, tf.PointCloud(pts0), n_samples=0, max_iterations=20
+    )
+    np.testing.assert_allclose(T_reused, T_fresh, atol=1e-6)
+
+
 # ==============================================================================
 # Output Properties Tests
 # ==============================================================================
@@ -71,18 +71,12 @@ def create_rotation_translation_z_3d(angle_degrees, tx, ty, tz, dtype):
 
 def apply_transform_2d(points, T):
     """Apply 3x3 homogeneous transform to 2D points."""
-    n = len(points)
-    homogeneous = np.hstack([points, np.ones((n, 1), dtype=points.dtype)])
-    transformed = (T @ homogeneous.T).T
-    return transformed[:, :2]
+    return points @ T[:2, :2].T + T[:2, 2]
 
 
 def apply_transform_3d(points, T):
     """Apply 4x4 homogeneous transform to 3D points."""
-    n = len(points)
-    homogeneous = np.hstack([points, np.ones((n, 1), dtype=points.dtype)])
-    transformed = (T @ homogeneous.T).T
-    return transformed[:, :3]
+    return points @ T[:3, :3].T + T[:3, 3]
 
 
 # ==============================================================================
@@ -71,18 +71,12 @@ def create_rotation_translation_z_3d(angle_degrees, tx, ty, tz, dtype):
 
 def apply_transform_2d(points, T):
     """Apply 3x3 homogeneous transform to 2D points."""
-    n = len(points)
-    homogeneous = np.hstack([points, np.ones((n, 1), dtype=points.dtype)])
-    transformed = (T @ homogeneous.T).T
-    return transformed[:, :2]
+    return points @ T[:2, :2].T + T[:2, 2]
 
 
 def apply_transform_3d(points, T):
     """Apply 4x4 homogeneous transform to 3D points."""
-    n = len(points)
-    homogeneous = np.hstack([points, np.ones((n, 1), dtype=points.dtype)])
-    transformed = (T @ homogeneous.T).T
-    return transformed[:, :3]
+    return points @ T[:3, :3].T + T[:3, 3]
 
 
 # ==============================================================================
@@ -288,6 +282,22 @@ def test_fit_rigid_alignment_3d_is_rigid(dtype):
     assert np.allclose(R @ R.T, np.eye(3, dtype=dtype), atol=1e-4)
 
 
+@pytest.mark.parametrize("dtype", REAL_DTYPES)
+def test_fit_rigid_alignment_3d_planar_is_rigid(dtype):
+    """Coplanar points (rank-deficient covariance) still give a rotation."""
+    xy = np.random.default_rng(7).random((20, 2))
+    pts0 = np.column_stack([xy, np.full(20, 2.0)]).astype(dtype)
+    T_true = create_rotation_translation_z_3d(30, 1, 2, 3, dtype)
+    pts1 = apply_transform_3d(pts0, T_true)
+
+    T = tf.fit_rigid_alignment(tf.PointCloud(pts0),
+                               tf.PointCloud(pts1.astype(dtype)))
+
+    R = T[:3, :3]
+    assert abs(np.linalg.det(R) - 1.0) < 1e-4
+    assert np.allclose(T, T_true, atol=1e-4)
+
+
 # ==============================================================================
 # Edge Cases
 # ==============================================================================
@@ -468,6 +468,26 @@ def test_neighbor_search_with_scale_transformation():
     assert np.allclose(closest_pt, [2.0, 0.0, 0.0], atol=1e-5)
 
 
+
+def test_neighbor_search_after_optimize_memory_layout():
+    """Reordered cloud returns the same neighbors once ids are mapped back"""
+    rng = np.random.default_rng(0)
+    points = rng.random((2000, 3)).astype(np.float32)
+    queries = rng.random((50, 3)).astype(np.float32)
+
+    reference = tf.PointCloud(points)
+    cloud = tf.PointCloud(points.copy())
+    perm = cloud.optimize_memory_layout()
+
+    assert sorted(perm.tolist()) == list(range(len(points)))
+    assert np.array_equal(cloud.points, points[perm])
+
+    for q in queries:
+        idx0, dist0, _ = tf.neighbor_search(reference, tf.Point(q))
+        idx1, dist1, _ = tf.neighbor_search(cloud, tf.Point(q))
+        assert perm[idx1] == idx0
+        assert np.isclose(dist0, dist1)
+
 if __name__ == "__main__":
     import sys
     sys.exit(pytest.main([__file__, "-v"]))
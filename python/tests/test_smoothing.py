@@ -0,0 +1,199 @@
+"""
+Tests for laplacian_smoothed and taubin_smoothed
+
+Copyright (c) 2025 Ziga Sajovic, XLAB
+"""
+
+import sys
+
+import pytest
+import numpy as np
+import trueform as tf
+
+# Parameter sets
+INDEX_DTYPES = [np.int32, np.int64]
+REAL_DTYPES = [np.float32, np.float64]
+
+
+# ==============================================================================
+# Test data generators
+# ==============================================================================
+
+def create_noisy_sphere(index_dtype, real_dtype, seed=0):
+    """
+    Create a UV sphere with jittered points and shuffled vertex order.
+
+    The shuffle leaves the vertex order spatially incoherent, so the Morton
+    reordering of taubin_smoothed(reorder=True) actually permutes it.
+    """
+    faces, points = tf.make_sphere_mesh(
+        1.0, 24, 24, dtype=real_dtype, index_dtype=index_dtype)
+    rng = np.random.default_rng(seed)
+    points = points + rng.normal(scale=0.02, size=points.shape).astype(real_dtype)
+
+    perm = rng.permutation(len(points))
+    inv_perm = np.empty_like(perm)
+    inv_perm[perm] = np.arange(len(perm))
+    return tf.Mesh(inv_perm[faces].astype(index_dtype), points[perm])
+
+
+def taubin_mu(lambda_, kpb, real_dtype):
+    """mu = 1 / (kpb - 1/lambda), evaluated in the dtype of the points."""
+    one = real_dtype(1)
+    return float(one / (real_dtype(kpb) - one / real_dtype(lambda_)))
+
+
+# ==============================================================================
+# laplacian_smoothed Tests
+# ==============================================================================
+
+@pytest.mark.parametrize("index_dtype", INDEX_DTYPES)
+@pytest.mark.parametrize("real_dtype", REAL_DTYPES)
+def test_laplacian_smoothed_without_mu_repeats_single_passes(index_dtype, real_dtype):
+    """mu=None runs plain lambda passes, bit-identical to one pass per call."""
+    mesh = create_noisy_sphere(index_dtype, real_dtype)
+    vertex_link = mesh.vertex_link
+
+    result = tf.laplacian_smoothed(mesh, iterations=5, lambda_=0.5)
+
+    expected = mesh.points
+    for _ in range(5):
+        expected = tf.laplacian_smoothed((expected, vertex_link), iterations=1, lambda_=0.5)
+
+    np.testing.assert_array_equal(result, expected)
+    np.testing.assert_array_equal(
+        tf.laplacian_smoothed(mesh, iterations=5, lambda_=0.5, mu=None), result)
+
+
+@pytest.mark.parametrize("index_dtype", INDEX_DTYPES)
+@pytest.mark.parametrize("real_dtype", REAL_DTYPES)
+def test_laplacian_smoothed_mu_matches_taubin(index_dtype, real_dtype):
+    """Alternating lambda|mu passes are the taubin_smoothed formulation."""
+    mesh = create_noisy_sphere(index_dtype, real_dtype)
+    mu = taubin_mu(0.5, 0.1, real_dtype)
+
+    result = tf.laplacian_smoothed(mesh, iterations=5, lambda_=0.5, mu=mu)
+    expected = tf.taubin_smoothed(mesh, iterations=5, lambda_=0.5, kpb=0.1)
+
+    assert result.dtype == real_dtype
+    np.testing.assert_allclose(result, expected, rtol=1e-5, atol=1e-6)
+
+
+@pytest.mark.parametrize("real_dtype", REAL_DTYPES)
+def test_laplacian_smoothed_mu_must_be_negative(real_dtype):
+    """A non-negative mu is rejected."""
+    mesh = create_noisy_sphere(np.int32, real_dtype)
+
+    with pytest.raises(ValueError, match="mu"):
+        tf.laplacian_smoothed(mesh, iterations=1, lambda_=0.5, mu=0.5)
+
+
+# ==============================================================================
+# taubin_smoothed(out=...) Tests
+# ==============================================================================
+
+@pytest.mark.parametrize("index_dtype", INDEX_DTYPES)
+@pytest.mark.parametrize("real_dtype", REAL_DTYPES)
+def test_taubin_smoothed_out_is_returned(index_dtype, real_dtype):
+    """The result is written into out, which is returned."""
+    mesh = create_noisy_sphere(index_dtype, real_dtype)
+    out = np.empty_like(mesh.points)
+
+    result = tf.taubin_smoothed(mesh, iterations=3, out=out)
+
+    assert result is out
+    np.testing.assert_array_equal(out, tf.taubin_smoothed(mesh, iterations=3))
+
+
+@pytest.mark.parametrize("index_dtype", INDEX_DTYPES)
+@pytest.mark.parametrize("real_dtype", REAL_DTYPES)
+def test_taubin_smoothed_in_place(index_dtype, real_dtype):
+    """out may be the points array itself."""
+    mesh = create_noisy_sphere(index_dtype, real_dtype)
+    expected = tf.taubin_smoothed(mesh, iterations=3)
+
+    points = mesh.points.copy()
+    result = tf.taubin_smoothed((points, mesh.vertex_link), iterations=3, out=points)
+
+    assert result is points
+    np.testing.assert_array_equal(points, expected)
+
+
+@pytest.mark.parametrize("real_dtype", REAL_DTYPES)
+def test_taubin_smoothed_out_wrong_shape_raises(real_dtype):
+    """An out array of a different shape is rejected."""
+    mesh = create_noisy_sphere(np.int32, real_dtype)
+    out = np.empty((len(mesh.points) - 1, 3), dtype=real_dtype)
+
+    with pytest.raises(ValueError, match="out"):
+        tf.taubin_smoothed(mesh, iterations=1, out=out)
+
+
+@pytest.mark.parametrize("real_dtype", REAL_DTYPES)
+def test_taubin_smoothed_out_non_contiguous_raises(real_dtype):
+    """A non-contiguous out array is rejected."""
+    mesh = create_noisy_sphere(np.int32, real_dtype)
+    out = np.empty_like(mesh.points, order='F')
+
+    with pytest.raises(ValueError, match="C-contiguous"):
+        tf.taubin_smoothed(mesh, iterations=1, out=out)
+
+
+@pytest.mark.parametrize("index_dtype", INDEX_DTYPES)
+@pytest.mark.parametrize("real_dtype", REAL_DTYPES)
+def test_taubin_smoothed_reorder_with_out(index_dtype, real_dtype):
+    """reorder=True writes into out in the caller's vertex order."""
+    mesh = create_noisy_sphere(index_dtype, real_dtype)
+    out = np.empty_like(mesh.points)
+
+    result = tf.taubin_smoothed(mesh, iterations=3, reorder=True, out=out)
+
+    assert result is out
+    np.testing.assert_allclose(
+        out, tf.taubin_smoothed(mesh, iterations=3), rtol=1e-5, atol=1e-6)
+
+
+def test_taubin_smoothed_reorder_and_out_are_keyword_only():
+    """reorder and out cannot be passed positionally."""
+    mesh = create_noisy_sphere(np.int32, np.float32)
+    out = np.empty_like(mesh.points)
+
+    with pytest.raises(TypeError):
+        tf.taubin_smoothed(mesh, 1, 0.5, 0.1, True, out)
+
+
+# ==============================================================================
+# taubin_smoothed(reorder=True) Tests
+# ==============================================================================
+
+@pytest.mark.parametrize("index_dtype", INDEX_DTYPES)
+@pytest.mark.parametrize("real_dtype", REAL_DTYPES)
+def test_taubin_smoothed_reorder_matches_unordered(index_dtype, real_dtype):
+    """Smoothing a Morton-ordered copy gives the unordered result."""
+    mesh = create_noisy_sphere(index_dtype, real_dtype)
+
+    result = tf.taubin_smoothed(mesh, iterations=5, reorder=True)
+    expected = tf.taubin_smoothed(mesh, iterations=5, reorder=False)
+
+    assert result.dtype == real_dtype
+    np.testing.assert_allclose(result, expected, rtol=1e-5, atol=1e-6)
+
+
+@pytest.mark.parametrize("index_dtype", INDEX_DTYPES)
+def test_taubin_smoothed_reorder_permutes(index_dtype):
+    """The test mesh is large and shuffled enough for reorder to permute."""
+    from trueform._geometry.taubin_smoothed import _morton_order
+
+    mesh = create_noisy_sphere(index_dtype, np.float64)
+    perm = _morton_order(mesh.points)
+
+    assert not np.array_equal(perm, np.arange(len(perm)))
+    np.testing.assert_array_equal(np.sort(perm), np.arange(len(perm)))
+
+
+# ==============================================================================
+# Main runner
+# ==============================================================================
+
+if __name__ == "__main__":
+    sys.exit(pytest.main([__file__, "-v"]))
@@ -5,6 +5,7 @@ Copyright (c) 2025 Ziga Sajovic, XLAB
 """
 
 import sys
+from itertools import product
 
 import pytest
 import numpy as np
@@ -13,6 +14,12 @@ import trueform as tf
 # Parameter sets
 INDEX_DTYPES = [np.int32, np.int64]
 REAL_DTYPES = [np.float32, np.float64]
+DTYPE_PAIRS = list(product(INDEX_DTYPES, REAL_DTYPES))
+DTYPE_IDS = [f"{i.__name__}-{r.__name__}" for i, r in DTYPE_PAIRS]
+
+# Keep the module on one xdist worker (--dist=loadgroup) so the shared mesh
+# fixtures are built once rather than once per worker
+pytestmark = pytest.mark.xdist_group(name="topology_mesh_analysis")
 
 
 # ==============================================================================
@@ -123,39 +130,54 @@ def create_dynamic_non_manifold_mesh(index_dtype, real_dtype):
     return faces, points
 
 
+# ==============================================================================
+# Fixtures
+# ==============================================================================
+#
+# The predicates are pure queries, so each mesh is built once per dtype pair
+# and shared by every test that reads it.
+
+
+@pytest.fixture(scope="module", params=DTYPE_PAIRS, ids=DTYPE_IDS)
+def single_triangle_mesh(request):
+    return tf.Mesh(*create_single_triangle(*request.param))
+
+
+@pytest.fixture(scope="module", params=DTYPE_PAIRS, ids=DTYPE_IDS)
+def two_triangles_mesh(request):
+    return tf.Mesh(*create_two_triangles(*request.param))
+
+
+@pytest.fixture(scope="module", params=DTYPE_PAIRS, ids=DTYPE_IDS)
+def tetrahedron_mesh(request):
+    return tf.Mesh(*create_tetrahedron(*request.param))
+
+
+@pytest.fixture(scope="module", params=DTYPE_PAIRS, ids=DTYPE_IDS)
+def non_manifold_mesh(request):
+    return tf.Mesh(*create_non_manifold_mesh(*request.param))
+
+
 # ==============================================================================
 # is_closed Tests
 # ==============================================================================
 
-@pytest.mark.parametrize("index_dtype", INDEX_DTYPES)
-@pytest.mark.parametrize("real_dtype", REAL_DTYPES)
-def test_is_closed_single_triangle(index_dtype, real_dtype):
+def test_is_closed_single_triangle(single_triangle_mesh):
     """Single triangle is open (not closed)."""
-    faces, points = create_single_triangle(index_dtype, real_dtype)
-    mesh = tf.Mesh(faces, points)
-    assert tf.is_closed(mesh) is False
+    assert tf.is_closed(single_triangle_mesh) is False
 
 
-@pytest.mark.parametrize("index_dtype", INDEX_DTYPES)
-@pytest.mark.parametrize("real_dtype", REAL_DTYPES)
-def test_is_closed_two_triangles(index_dtype, real_dtype):
+def test_is_closed_two_triangles(two_triangles_mesh):
     """Two triangles sharing an edge is open."""
-    faces, points = create_two_triangles(index_dtype, real_dtype)
-    mesh = tf.Mesh(faces, points)
-    assert tf.is_closed(mesh) is False
+    assert tf.is_closed(two_triangles_mesh) is False
 
 
-@pytest.mark.parametrize("index_dtype", INDEX_DTYPES)
-@pytest.mark.parametrize("real_dtype", REAL_DTYPES)
-def test_is_closed_tetrahedron(index_dtype, real_dtype):
+def test_is_closed_tetrahedron(tetrahedron_mesh):
     """Tetrahedron is closed."""
-    faces, points = create_tetrahedron(index_dtype, real_dtype)
-    mesh = tf.Mesh(faces, points)
-    assert tf.is_closed(mesh) is True
+    assert tf.is_closed(tetrahedron_mesh) is True
 
 
-@pytest.mark.parametrize("index_dtype", INDEX_DTYPES)
-@pytest.mark.parametrize("real_dtype", REAL_DTYPES)
+@pytest.mark.parametrize("index_dtype,real_dtype", DTYPE_PAIRS, ids=DTYPE_IDS)
 def test_is_closed_dynamic_single_triangle(index_dtype, real_dtype):
     """Dynamic single triangle is open."""
     faces, points = create_dynamic_single_triangle(index_dtype, real_dtype)
@@ -163,8 +185,7 @@ def test_is_closed_dynamic_single_triangle(index_dtype, real_dtype):
     assert tf.is_closed(mesh) is False
 
 
-@pytest.mark.parametrize("index_dtype", INDEX_DTYPES)
-@pytest.mark.parametrize("real_dtype", REAL_DTYPES)
+@pytest.mark.parametrize("index_dtype,real_dtype", DTYPE_PAIRS, ids=DTYPE_IDS)
 def test_is_closed_dynamic_tetrahedron(index_dtype, real_dtype):
     """Dynamic tetrahedron is closed."""
     faces, points = create_dynamic_tetrahedron(index_dtype, real_dtype)
@@ -176,26 +197,17 @@ def test_is_closed_dynamic_tetrahedron(index_dtype, real_dtype):
 # is_open Tests
 # ==============================================================================
 
-@pytest.mark.parametrize("index_dtype", INDEX_DTYPES)
-@pytest.mark.parametrize("real_dtype", REAL_DTYPES)
-def test_is_open_single_triangle(index_dtype, real_dtype):
+def test_is_open_single_triangle(single_triangle_mesh):
     """Single triangle is open."""
-    faces, points = create_single_triangle(index_dtype, real_dtype)
-    mesh = tf.Mesh(faces, points)
-    assert tf.is_open(mesh) is True
+    assert tf.is_open(single_triangle_mesh) is True
 
 
-@pytest.mark.parametrize("index_dtype", INDEX_DTYPES)
-@pytest.mark.parametrize("real_dtype", REAL_DTYPES)
-def test_is_open_tetrahedron(index_dtype, real_dtype):
+def test_is_open_tetrahedron(tetrahedron_mesh):
     """Tetrahedron is not open (it's closed)."""
-    faces, points = create_tetrahedron(index_dtype, real_dtype)
-    mesh = tf.Mesh(faces, points)
-    assert tf.is_open(mesh) is False
+    assert tf.is_open(tetrahedron_mesh) is False
 
 
-@pytest.mark.parametrize("index_dtype", INDEX_DTYPES)
-@pytest.mark.parametrize("real_dtype", REAL_DTYPES)
+@pytest.mark.parametrize("index_dtype,real_dtype", DTYPE_PAIRS, ids=DTYPE_IDS)
 def test_is_open_dynamic_single_triangle(index_dtype, real_dtype):
     """Dynamic single triangle is open."""
     faces, points = create_dynamic_single_triangle(index_dtype, real_dtype)
@@ -207,44 +219,27 @@ def test_is_open_dynamic_single_triangle(index_dtype, real_dtype):
 # is_manifold Tests
 # ==============================================================================
 
-@pytest.mark.parametrize("index_dtype", INDEX_DTYPES)
-@pytest.mark.parametrize("real_dtype", REAL_DTYPES)
-def test_is_manifold_single_triangle(index_dtype, real_dtype):
+def test_is_manifold_single_triangle(single_triangle_mesh):
     """Single triangle is manifold."""
-    faces, points = create_single_triangle(index_dtype, real_dtype)
-    mesh = tf.Mesh(faces, points)
-    assert tf.is_manifold(mesh) is True
+    assert tf.is_manifold(single_triangle_mesh) is True
 
 
-@pytest.mark.parametrize("index_dtype", INDEX_DTYPES)
-@pytest.mark.parametrize("real_dtype", REAL_DTYPES)
-def test_is_manifold_two_triangles(index_dtype, real_dtype):
+def test_is_manifold_two_triangles(two_triangles_mesh):
     """Two triangles sharing an edge is manifold."""
-    faces, points = create_two_triangles(index_dtype, real_dtype)
-    mesh = tf.Mesh(faces, points)
-    assert tf.is_manifold(mesh) is True
+    assert tf.is_manifold(two_triangles_mesh) is True
 
 
-@pytest.mark.parametrize("index_dtype", INDEX_DTYPES)
-@pytest.mark.parametrize("real_dtype", REAL_DTYPES)
-def test_is_manifold_tetrahedron(index_dtype, real_dtype):
+def test_is_manifold_tetrahedron(tetrahedron_mesh):
     """Tetrahedron is manifold."""
-    faces, points = create_tetrahedron(index_dtype, real_dtype)
-    mesh = tf.Mesh(faces, points)
-    assert tf.is_manifold(mesh) is True
+    assert tf.is_manifold(tetrahedron_mesh) is True
 
 
-@pytest.mark.parametrize("index_dtype", INDEX_DTYPES)
-@pytest.mark.parametrize("real_dtype", REAL_DTYPES)
-def test_is_manifold_non_manifold_mesh(index_dtype, real_dtype):
+def test_is_manifold_non_manifold_mesh(non_manifold_mesh):
     """Three triangles sharing an edge is non-manifold."""
-    faces, points = create_non_manifold_mesh(index_dtype, real_dtype)
-    mesh = tf.Mesh(faces, points)
-    assert tf.is_manifold(mesh) is False
+    assert tf.is_manifold(non_manifold_mesh) is False
 
 
-@pytest.mark.parametrize("index_dtype", INDEX_DTYPES)
-@pytest.mark.parametrize("real_dtype", REAL_DTYPES)
+@pytest.mark.parametrize("index_dtype,real_dtype", DTYPE_PAIRS, ids=DTYPE_IDS)
 def test_is_manifold_dynamic_two_triangles(index_dtype, real_dtype):
     """Dynamic two triangles is manifold."""
     offsets = np.array([0, 3, 6], dtype=index_dtype)
@@ -260,8 +255,7 @@ def test_is_manifold_dynamic_two_triangles(index_dtype, real_dtype):
     assert tf.is_manifold(mesh) is True
 
 
-@pytest.mark.parametrize("index_dtype", INDEX_DTYPES)
-@pytest.mark.parametrize("real_dtype", REAL_DTYPES)
+@pytest.mark.parametrize("index_dtype,real_dtype", DTYPE_PAIRS, ids=DTYPE_IDS)
 def test_is_manifold_dynamic_non_manifold(index_dtype, real_dtype):
     """Dynamic non-manifold mesh is not manifold."""
     faces, points = create_dynamic_non_manifold_mesh(index_dtype, real_dtype)
@@ -273,35 +267,22 @@ def test_is_manifold_dynamic_non_manifold(index_dtype, real_dtype):
 # is_non_manifold Tests
 # ==============================================================================
 
-@pytest.mark.parametrize("index_dtype", INDEX_DTYPES)
-@pytest.mark.parametrize("real_dtype", REAL_DTYPES)
-def test_is_non_manifold_manifold_mesh(index_dtype, real_dtype):
+def test_is_non_manifold_manifold_mesh(two_triangles_mesh):
     """Manifold mesh is not non-manifold."""
-    faces, points = create_two_triangles(index_dtype, real_dtype)
-    mesh = tf.Mesh(faces, points)
-    assert tf.is_non_manifold(mesh) is False
+    assert tf.is_non_manifold(two_triangles_mesh) is False
 
 
-@pytest.mark.parametrize("index_dtype", INDEX_DTYPES)
-@pytest.mark.parametrize("real_dtype", REAL_DTYPES)
-def test_is_non_manifold_non_manifold_mesh(index_dtype, real_dtype):
+def test_is_non_manifold_non_manifold_mesh(non_manifold_mesh):
     """Non-manifold mesh is non-manifold."""
-    faces, points = create_non_manifold_mesh(index_dtype, real_dtype)
-    mesh = tf.Mesh(faces, points)
-    assert tf.is_non_manifold(mesh) is True
+    assert tf.is_non_manifold(non_manifold_mesh) is True
 
 
-@pytest.mark.parametrize("index_dtype", INDEX_DTYPES)
-@pytest.mark.parametrize("real_dtype", REAL_DTYPES)
-def test_is_non_manifold_tetrahedron(index_dtype, real_dtype):
+def test_is_non_manifold_tetrahedron(tetrahedron_mesh):
     """Tetrahedron is not non-manifold."""
-    faces, points = create_tetrahedron(index_dtype, real_dtype)
-    mesh = tf.Mesh(faces, points)
-    assert tf.is_non_manifold(mesh) is False
+    assert tf.is_non_manifold(tetrahedron_mesh) is False
 
 
-@pytest.mark.parametrize("index_dtype", INDEX_DTYPES)
-@pytest.mark.parametrize("real_dtype", REAL_DTYPES)
+@pytest.mark.parametrize("index_dtype,real_dtype", DTYPE_PAIRS, ids=DTYPE_IDS)
 def test_is_non_manifold_dynamic_non_manifold(index_dtype, real_dtype):
     """Dynamic non-manifold mesh is non-manifold."""
     faces, points = create_dynamic_non_manifold_mesh(index_dtype, real_dtype)
@@ -313,8 +294,7 @@ def test_is_non_manifold_dynamic_non_manifold(index_dtype, real_dtype):
 # Consistency Tests
 # ==============================================================================
 
-@pytest.mark.parametrize("index_dtype", INDEX_DTYPES)
-@pytest.mark.parametrize("real_dtype", REAL_DTYPES)
+@pytest.mark.parametrize("index_dtype,real_dtype", DTYPE_PAIRS, ids=DTYPE_IDS)
 def test_is_closed_is_open_consistency(index_dtype, real_dtype):
     """is_closed and is_open are inverses."""
     faces, points = create_tetrahedron(index_dtype, real_dtype)
@@ -326,8 +306,7 @@ def test_is_closed_is_open_consistency(index_dtype, real_dtype):
     assert tf.is_closed(mesh) != tf.is_open(mesh)
 
 
-@pytest.mark.parametrize("index_dtype", INDEX_DTYPES)
-@pytest.mark.parametrize("real_dtype", REAL_DTYPES)
+@pytest.mark.parametrize("index_dtype,real_dtype", DTYPE_PAIRS, ids=DTYPE_IDS)
 def test_is_manifold_is_non_manifold_consistency(index_dtype, real_dtype):
     """is_manifold and is_non_manifold are inverses."""
     faces, points = create_two_triangles(index_dtype, real_dtype)
@@ -339,32 +318,89 @@ def test_is_manifold_is_non_manifold_consistency(index_dtype, real_dtype):
     assert tf.is_manifold(mesh) != tf.is_non_manifold(mesh)
 
 
+@pytest.mark.parametrize("index_dtype,real_dtype", DTYPE_PAIRS, ids=DTYPE_IDS)
+def test_cached_manifold_edge_link_consistency(index_dtype, real_dtype):
+    """Results match with and without a built manifold edge link."""
+    for create in [create_single_triangle, create_two_triangles,
+                   create_tetrahedron, create_non_manifold_mesh,
+                   create_dynamic_single_triangle, create_dynamic_tetrahedron,
+                   create_dynamic_non_manifold_mesh]:
+        faces, points = create(index_dtype, real_dtype)
+        expected = (tf.is_closed(tf.Mesh(faces, points)),
+                    tf.is_manifold(tf.Mesh(faces, points)))
+        mesh = tf.Mesh(faces, points)
+        mesh.build_manifold_edge_link()
+        assert (tf.is_closed(mesh), tf.is_manifold(mesh)) == expected
+
+
+@pytest.mark.parametrize("index_dtype,real_dtype", DTYPE_PAIRS, ids=DTYPE_IDS)
+def test_check_topology_consistency(index_dtype, real_dtype):
+    """check_topology matches is_manifold and is_closed, with and without a manifold edge link."""
+    for create in [create_single_triangle, create_two_triangles,
+                   create_tetrahedron, create_non_manifold_mesh,
+                   create_dynamic_single_triangle, create_dynamic_tetrahedron,
+                   create_dynamic_non_manifold_mesh]:
+        faces, points = create(index_dtype, real_dtype)
+        mesh = tf.Mesh(faces, points)
+        expected = (tf.is_manifold(mesh), tf.is_closed(mesh))
+        assert tf.check_topology(mesh) == expected
+        mesh.build_manifold_edge_link()
+        assert tf.check_topology(mesh) == expected
+
+
 # ==============================================================================
-# Error Validation Tests
+# Batched Tests
 # ==============================================================================
 
-def test_is_closed_invalid_input():
-    """Test is_closed with invalid input."""
-    with pytest.raises(TypeError, match="mesh must be Mesh"):
-        tf.is_closed("not a mesh")
+@pytest.mark.parametrize("index_dtype,real_dtype", DTYPE_PAIRS, ids=DTYPE_IDS)
+def test_batch_matches_single(index_dtype, real_dtype):
+    """Batched checks match per-mesh checks, across static and dynamic meshes."""
+    meshes = [tf.Mesh(*create(index_dtype, real_dtype)) for create in [
+        create_single_triangle, create_two_triangles, create_tetrahedron,
+        create_non_manifold_mesh, create_dynamic_single_triangle,
+        create_dynamic_tetrahedron, create_dynamic_non_manifold_mesh]]
 
+    closed = tf.is_closed_batch(meshes)
+    manifold = tf.is_manifold_batch(meshes)
 
-def test_is_open_invalid_input():
-    """Test is_open with invalid input."""
-    with pytest.raises(TypeError, match="mesh must be Mesh"):
-        tf.is_open("not a mesh")
+    assert closed.dtype == bool and closed.shape == (len(meshes),)
+    assert closed.tolist() == [tf.is_closed(m) for m in meshes]
+    assert manifold.tolist() == [tf.is_manifold(m) for m in meshes]
 
 
-def test_is_manifold_invalid_input():
-    """Test is_manifold with invalid input."""
-    with pytest.raises(TypeError, match="mesh must be Mesh"):
-        tf.is_manifold("not a mesh")
+def test_batch_mixed_index_dtypes():
+    """Meshes with different index dtypes keep their positions."""
+    meshes = [tf.Mesh(*create_single_triangle(np.int64, np.float32)),
+              tf.Mesh(*create_tetrahedron(np.int32, np.float32)),
+              tf.Mesh(*create_non_manifold_mesh(np.int64, np.float64))]
+    assert tf.is_closed_batch(meshes).tolist() == [False, True, False]
+    assert tf.is_manifold_batch(meshes).tolist() == [True, True, False]
+
 
+def test_batch_empty():
+    """An empty batch returns an empty array."""
+    assert tf.is_closed_batch([]).shape == (0,)
+    assert tf.is_manifold_batch([]).shape == (0,)
+
+
+def test_batch_invalid_input():
+    """Non-mesh entries are rejected."""
+    with pytest.raises(TypeError):
+        tf.is_closed_batch([np.zeros((3, 3))])
+
+
+# ==============================================================================
+# Error Validation Tests
+# ==============================================================================
 
-def test_is_non_manifold_invalid_input():
-    """Test is_non_manifold with invalid input."""
+@pytest.mark.parametrize(
+    "fn", [tf.is_closed, tf.is_open, tf.is_manifold, tf.is_non_manifold],
+    ids=["is_closed", "is_open", "is_manifold", "is_non_manifold"],
+)
+def test_invalid_input(fn):
+    """Test topology predicates with invalid input."""
     with pytest.raises(TypeError, match="mesh must be Mesh"):
-        tf.is_non_manifold("not a mesh")
+        fn("not a mesh")
 
 
 def test_is_closed_edge_mesh():
@@ -3,45 +3,88 @@
 from __future__ import annotations
 
 import argparse
+import os
 import shutil
-import tempfile
+import stat
 import zipfile
 from pathlib import Path
 
+# python/ directory of this checkout, resolved once
+_PYTHON_ROOT = Path(__file__).resolve().parent.parent
 
-def _copy_tree(source: Path, destination: Path) -> None:
-    if destination.exists():
-        shutil.rmtree(destination)
-    shutil.copytree(source, destination)
+# Zip external_attr of a regular file with mode 0644
+_FILE_ATTR = (stat.S_IFREG | 0o644) << 16
 
 
-def _get_default_bpy_source() -> Path:
-    """Get default bpy source path relative to this script (python/tools/ -> python/bpy/)."""
-    return Path(__file__).resolve().parent.parent / "bpy"
+def _iter_files(root: Path, suffix: str = ""):
+    """Yield (path, relative posix path) for files under root ending in suffix.
 
+    Walks with os.scandir, whose entries cache the file type, so each
+    directory entry is classified without an extra stat call.
+    """
+    stack = [(str(root), "")]
+    while stack:
+        directory, rel_dir = stack.pop()
+        with os.scandir(directory) as entries:
+            for entry in entries:
+                rel_path = f"{rel_dir}{entry.name}"
+                if entry.is_dir(follow_symlinks=False):
+                    stack.append((entry.path, f"{rel_path}/"))
+                elif entry.name.endswith(suffix) and entry.is_file():
+                    yield entry.path, rel_path
 
-def _get_default_plugin_dir() -> Path:
-    """Get default plugin directory relative to this script."""
-    return Path(__file__).resolve().parent.parent / "examples" / "bpy-plugin"
 
+def _write_tree(zf: zipfile.ZipFile, source: Path, arc_root: str, suffix: str = "") -> None:
+    """Write files under source ending in suffix into the archive below arc_root."""
+    for path, rel_path in _iter_files(source, suffix):
+        zf.write(path, f"{arc_root}/{rel_path}")
 
-def _extract_trueform_from_wheel(wheel_path: Path, extract_dir: Path) -> Path:
-    """Extract wheel and return path to trueform package inside."""
-    with zipfile.ZipFile(wheel_path, "r") as zf:
-        zf.extractall(extract_dir)
-    trueform_dir = extract_dir / "trueform"
-    if not trueform_dir.is_dir():
-        raise FileNotFoundError(f"trueform package not found in wheel: {wheel_path}")
-    return trueform_dir
 
+def _get_default_bpy_source() -> Path:
+    """Get default bpy source path relative to this script (python/tools/ -> python/bpy/)."""
+    return _PYTHON_ROOT / "bpy"
 
-def _copy_plugin_files(plugin_dir: Path, bundle_root: Path) -> None:
-    """Copy all Python files from plugin directory to bundle root."""
-    for py_file in plugin_dir.rglob("*.py"):
-        rel_path = py_file.relative_to(plugin_dir)
-        dest = bundle_root / rel_path
-        dest.parent.mkdir(parents=True, exist_ok=True)
-        shutil.copy2(py_file, dest)
+
+def _get_default_plugin_dir() -> Path:
+    """Get default plugin directory relative to this script."""
+    return _PYTHON_ROOT / "examples" / "bpy-plugin"
+
+
+def _write_trueform_from_wheel(zf: zipfile.ZipFile, wheel_path: Path, arc_root: str) -> None:
+    """Stream the trueform package out of the wheel into the archive below arc_root.
+
+    Entries are copied one at a time without extracting the wheel to disk,
+    keeping each entry's timestamp and file mode. The bpy subpackage is
+    skipped; the bundled bpy sources replace it.
+    """
+    with zipfile.ZipFile(wheel_path, "r") as wheel_zf:
+        entries = [
+            info
+            for info in wheel_zf.infolist()
+            if info.filename.startswith("trueform/") and not info.is_dir()
+        ]
+        if not entries:
+            raise FileNotFoundError(f"trueform package not found in wheel: {wheel_path}")
+        for info in entries:
+            rel_path = info.filename[len("trueform/"):]
+            if rel_path.startswith("bpy/"):
+                continue
+            out_info = zipfile.ZipInfo(f"{arc_root}/{rel_path}", info.date_time)
+            # The wheel's mode, or 0644 like an extracted file if the entry
+            # carries no file type bits
+            if stat.S_ISREG(info.external_attr >> 16):
+                out_info.external_attr = info.external_attr
+            else:
+                out_info.external_attr = _FILE_ATTR
+            out_info.compress_type = zf.compression
+            # Set the same way ZipFile.open does for a plain name; the
+            # attribute is public as compress_level since Python 3.13
+            level_attr = (
+                "compress_level" if hasattr(out_info, "compress_level") else "_compresslevel"
+            )
+            setattr(out_info, level_attr, zf.compresslevel)
+            with wheel_zf.open(info) as src, zf.open(out_info, "w") as dst:
+                shutil.copyfileobj(src, dst)
 
 
 def package_blender_plugin(
@@ -68,31 +111,16 @@ def package_blender_plugin(
         raise FileNotFoundError(f"bpy source not found: {resolved_bpy_source}")
 
     output.parent.mkdir(parents=True, exist_ok=True)
+    zip_path = output if output.suffix == ".zip" else output.with_suffix(".zip")
 
-    with tempfile.TemporaryDirectory() as tmp_dir:
-        tmp_path = Path(tmp_dir)
-
-        resolved_trueform_root = _extract_trueform_from_wheel(wheel, tmp_path / "wheel_extract")
-
-        bundle_root = tmp_path / bundle_name
-        libs_dir = bundle_root / "libs" / "trueform"
-        libs_dir.parent.mkdir(parents=True, exist_ok=True)
-
-        _copy_plugin_files(plugin_dir, bundle_root)
-        _copy_tree(resolved_trueform_root, libs_dir)
-        _copy_tree(resolved_bpy_source, libs_dir / "bpy")
-
-        archive_base = output.with_suffix("")
-        shutil.make_archive(
-            str(archive_base),
-            "zip",
-            root_dir=tmp_path,
-            base_dir=bundle_name,
-        )
+    libs_root = f"{bundle_name}/libs/trueform"
 
-    zip_path = output if output.suffix == ".zip" else output.with_suffix(".zip")
-    if not zip_path.exists() and archive_base.with_suffix(".zip").exists():
-        shutil.move(str(archive_base.with_suffix(".zip")), zip_path)
+    # Write straight into the archive instead of staging a copy of the
+    # bundle; level 1 is nearly as small as the default and much faster
+    with zipfile.ZipFile(zip_path, "w", compression=zipfile.ZIP_DEFLATED, compresslevel=1) as zf:
+        _write_trueform_from_wheel(zf, wheel, libs_root)
+        _write_tree(zf, plugin_dir, bundle_name, ".py")
+        _write_tree(zf, resolved_bpy_source, f"{libs_root}/bpy")
 
     return zip_path
 
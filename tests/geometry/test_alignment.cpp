@@ -264,6 +264,50 @@ TEMPLATE_TEST_CASE("chamfer_error_displaced", "[geometry][alignment]",
     REQUIRE(chamfer < real_t(0.15));
 }
 
+// =============================================================================
+// chamfer_error - Buffer and hinted overloads
+// =============================================================================
+
+TEMPLATE_TEST_CASE("chamfer_error_buffer_overloads_agree", "[geometry][alignment]",
+    (tf::test::type_pair<std::int32_t, float>),
+    (tf::test::type_pair<std::int64_t, double>))
+{
+    using index_t = typename TestType::index_type;
+    using real_t = typename TestType::real_type;
+
+    auto sphere = tf::make_sphere_mesh<index_t>(real_t(1), 20, 20);
+
+    auto T_offset = tf::make_transformation_from_translation(
+        tf::vector<real_t, 3>{real_t(0.1), real_t(0.05), real_t(0)});
+
+    tf::points_buffer<real_t, 3> source;
+    source.allocate(sphere.points().size());
+    for (decltype(sphere.points().size()) i = 0; i < sphere.points().size(); ++i) {
+        source[i] = tf::transformed(sphere.points()[i], T_offset);
+    }
+
+    tf::aabb_tree<index_t, real_t, 3> tree(sphere.points(), tf::config_tree(4, 4));
+    auto target_with_tree = sphere.points() | tf::tag(tree);
+
+    tf::buffer<real_t> buffer;
+    tf::buffer<std::int64_t> hints;
+    for (float outlier_proportion : {0.f, 0.2f}) {
+        real_t plain = tf::geometry::chamfer_error(
+            source.points(), target_with_tree, outlier_proportion, buffer);
+        real_t hinted = tf::geometry::chamfer_error(
+            source.points(), target_with_tree, outlier_proportion, buffer, hints);
+
+        REQUIRE(hinted == plain);
+        if (outlier_proportion == 0.f) {
+            REQUIRE(std::abs(plain - tf::chamfer_error(source.points(),
+                                                       target_with_tree)) <
+                    real_t(1e-5));
+        } else {
+            REQUIRE(plain < tf::chamfer_error(source.points(), target_with_tree));
+        }
+    }
+}
+
 // =============================================================================
 // fit_knn_alignment - Single ICP iteration
 // =============================================================================
@@ -0,0 +1,106 @@
+/**
+ * @file test_smoothing.cpp
+ * @brief Tests for mesh smoothing functions
+ *
+ * Tests for:
+ * - compute_laplacian_smoothed
+ * - laplacian_smoothed (with and without mu)
+ *
+ * Copyright (c) 2025 Ziga Sajovic, XLAB
+ */
+
+#include <catch2/catch_test_macros.hpp>
+#include <catch2/catch_template_test_macros.hpp>
+#include <trueform/trueform.hpp>
+#include "type_traits.hpp"
+
+namespace {
+
+template <typename PointsA, typename PointsB>
+auto points_equal(const PointsA &a, const PointsB &b) -> bool {
+    if (a.size() != b.size())
+        return false;
+    for (decltype(a.size()) i = 0; i < a.size(); ++i)
+        for (std::size_t d = 0; d < 3; ++d)
+            if (a[i][d] != b[i][d])
+                return false;
+    return true;
+}
+
+} // namespace
+
+// =============================================================================
+// compute_laplacian_smoothed
+// =============================================================================
+
+TEMPLATE_TEST_CASE("compute_laplacian_smoothed_in_place", "[geometry][smoothing]",
+    (tf::test::type_pair<std::int32_t, float>),
+    (tf::test::type_pair<std::int64_t, double>))
+{
+    using index_t = typename TestType::index_type;
+    using real_t = typename TestType::real_type;
+
+    auto sphere = tf::make_sphere_mesh<index_t>(real_t(1), 20, 20);
+    auto vlink = tf::make_vertex_link(sphere.polygons());
+
+    auto expected = tf::laplacian_smoothed(sphere.points() | tf::tag(vlink), 4,
+                                           real_t(0.5), real_t(-0.53));
+
+    // Output aliases the input
+    tf::points_buffer<real_t, 3> pts;
+    pts.allocate(sphere.points().size());
+    tf::parallel_copy(sphere.points(), pts.points());
+    tf::compute_laplacian_smoothed(pts.points() | tf::tag(vlink), pts.points(),
+                                   4, real_t(0.5), real_t(-0.53));
+
+    REQUIRE(points_equal(pts.points(), expected.points()));
+    REQUIRE_FALSE(points_equal(pts.points(), sphere.points()));
+}
+
+// =============================================================================
+// laplacian_smoothed with mu
+// =============================================================================
+
+TEMPLATE_TEST_CASE("laplacian_smoothed_mu_matches_taubin", "[geometry][smoothing]",
+    (tf::test::type_pair<std::int32_t, float>),
+    (tf::test::type_pair<std::int64_t, double>))
+{
+    using index_t = typename TestType::index_type;
+    using real_t = typename TestType::real_type;
+
+    auto sphere = tf::make_sphere_mesh<index_t>(real_t(1), 20, 20);
+    auto vlink = tf::make_vertex_link(sphere.polygons());
+    auto pts = sphere.points() | tf::tag(vlink);
+
+    const real_t lambda = real_t(0.5);
+    const real_t kpb = real_t(0.1);
+    const real_t mu = real_t(1) / (kpb - real_t(1) / lambda);
+
+    auto result = tf::laplacian_smoothed(pts, 4, lambda, mu);
+    auto expected = tf::taubin_smoothed(pts, 4, lambda, kpb);
+
+    REQUIRE(points_equal(result.points(), expected.points()));
+}
+
+TEMPLATE_TEST_CASE("laplacian_smoothed_without_mu_repeats_single_passes",
+    "[geometry][smoothing]",
+    (tf::test::type_pair<std::int32_t, float>),
+    (tf::test::type_pair<std::int64_t, double>))
+{
+    using index_t = typename TestType::index_type;
+    using real_t = typename TestType::real_type;
+
+    auto sphere = tf::make_sphere_mesh<index_t>(real_t(1), 20, 20);
+    auto vlink = tf::make_vertex_link(sphere.polygons());
+
+    auto result = tf::laplacian_smoothed(sphere.points() | tf::tag(vlink), 3,
+                                         real_t(0.5));
+
+    auto expected = tf::laplacian_smoothed(sphere.points() | tf::tag(vlink), 1,
+                                           real_t(0.5));
+    for (int iter = 1; iter < 3; ++iter)
+        expected = tf::laplacian_smoothed(expected.points() | tf::tag(vlink), 1,
+                                          real_t(0.5));
+
+    REQUIRE(points_equal(result.points(), expected.points()));
+}
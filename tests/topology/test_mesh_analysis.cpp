@@ -5,6 +5,8 @@
  * Tests for:
  * - is_closed / is_open
  * - is_manifold / is_non_manifold
+ * - is_closed / is_manifold on a manifold edge link
+ * - check_topology
  * - make_non_manifold_edges
  * - orient_faces_consistently
  *
@@ -42,6 +44,53 @@ auto edges_to_set(const EdgeBuffer& edges) {
     return result;
 }
 
+/**
+ * @brief Check every check_topology overload, and the manifold edge link
+ * overloads of is_closed / is_manifold, against the expected answer
+ */
+template <typename Polygons>
+void require_topology(const Polygons& polygons, bool manifold, bool closed) {
+    REQUIRE(tf::is_manifold(polygons) == manifold);
+    REQUIRE(tf::is_closed(polygons) == closed);
+
+    const std::pair<bool, bool> expected{manifold, closed};
+    REQUIRE(tf::check_topology(polygons) == expected);
+
+    auto fm = tf::make_face_membership(polygons);
+    REQUIRE(tf::check_topology(polygons.faces(), fm) == expected);
+
+    auto mel = tf::make_manifold_edge_link(polygons);
+    REQUIRE(tf::check_topology(mel) == expected);
+    REQUIRE(tf::is_manifold(mel) == manifold);
+    REQUIRE(tf::is_closed(mel) == closed);
+}
+
+/**
+ * @brief Two tetrahedra sharing edge (0,1): closed, but that edge has four
+ * faces
+ */
+template <typename Index, typename Real>
+auto create_tetrahedra_sharing_edge_3d() -> tf::polygons_buffer<Index, Real, 3, 3> {
+    tf::polygons_buffer<Index, Real, 3, 3> result;
+
+    result.points_buffer().emplace_back(Real(0), Real(0), Real(0));
+    result.points_buffer().emplace_back(Real(1), Real(0), Real(0));
+    result.points_buffer().emplace_back(Real(0.5), Real(1), Real(0));
+    result.points_buffer().emplace_back(Real(0.5), Real(0.5), Real(1));
+    result.points_buffer().emplace_back(Real(0.5), Real(-1), Real(0));
+    result.points_buffer().emplace_back(Real(0.5), Real(-0.5), Real(-1));
+
+    for (Index o : {Index(0), Index(2)}) {
+        const Index a = Index(2) + o, b = Index(3) + o;
+        result.faces_buffer().emplace_back(Index(0), a, Index(1));
+        result.faces_buffer().emplace_back(Index(0), Index(1), b);
+        result.faces_buffer().emplace_back(Index(1), a, b);
+        result.faces_buffer().emplace_back(a, Index(0), b);
+    }
+
+    return result;
+}
+
 } // anonymous namespace
 
 // =============================================================================
@@ -478,3 +527,74 @@ TEMPLATE_TEST_CASE("is_closed_brute_force_verification", "[topology][analysis]",
     // Compare with is_closed
     REQUIRE(tf::is_closed(mesh.polygons()) == !has_boundary);
 }
+
+// =============================================================================
+// check_topology
+// =============================================================================
+
+TEMPLATE_TEST_CASE("check_topology_open_mesh", "[topology][analysis]",
+    (tf::test::type_pair<std::int32_t, float>),
+    (tf::test::type_pair<std::int64_t, double>))
+{
+    using index_t = typename TestType::index_type;
+    using real_t = typename TestType::real_type;
+
+    auto mesh = tf::test::create_two_triangles_3d<index_t, real_t>();
+    require_topology(mesh.polygons(), true, false);
+}
+
+TEMPLATE_TEST_CASE("check_topology_closed_mesh", "[topology][analysis]",
+    (tf::test::type_pair<std::int32_t, float>),
+    (tf::test::type_pair<std::int64_t, double>))
+{
+    using index_t = typename TestType::index_type;
+    using real_t = typename TestType::real_type;
+
+    auto mesh = tf::test::create_tetrahedron_3d<index_t, real_t>();
+    require_topology(mesh.polygons(), true, true);
+}
+
+TEMPLATE_TEST_CASE("check_topology_non_manifold_mesh", "[topology][analysis]",
+    (tf::test::type_pair<std::int32_t, float>),
+    (tf::test::type_pair<std::int64_t, double>))
+{
+    using index_t = typename TestType::index_type;
+    using real_t = typename TestType::real_type;
+
+    auto mesh = tf::test::create_non_manifold_mesh_3d<index_t, real_t>();
+    require_topology(mesh.polygons(), false, false);
+}
+
+TEMPLATE_TEST_CASE("check_topology_closed_non_manifold_mesh", "[topology][analysis]",
+    (tf::test::type_pair<std::int32_t, float>),
+    (tf::test::type_pair<std::int64_t, double>))
+{
+    using index_t = typename TestType::index_type;
+    using real_t = typename TestType::real_type;
+
+    auto mesh = create_tetrahedra_sharing_edge_3d<index_t, real_t>();
+    require_topology(mesh.polygons(), false, true);
+}
+
+TEMPLATE_TEST_CASE("check_topology_large_meshes", "[topology][analysis]",
+    (tf::test::type_pair<std::int32_t, float>),
+    (tf::test::type_pair<std::int64_t, double>))
+{
+    using index_t = typename TestType::index_type;
+    using real_t = typename TestType::real_type;
+
+    // Above the serial cutoff, so the parallel scan runs
+    auto grid = tf::test::create_grid_mesh_3d<index_t, real_t>(40, 40);
+    REQUIRE(grid.faces().size() >= 1000);
+    require_topology(grid.polygons(), true, false);
+
+    auto sphere = tf::make_sphere_mesh<index_t>(real_t(1), 40, 40);
+    REQUIRE(sphere.faces().size() >= 1000);
+    require_topology(sphere.polygons(), true, true);
+
+    // A duplicated face gives its edges a third face
+    const index_t a = sphere.faces()[0][0], b = sphere.faces()[0][1],
+                  c = sphere.faces()[0][2];
+    sphere.faces_buffer().emplace_back(a, b, c);
+    require_topology(sphere.polygons(), false, true);
+}
@@ -22,7 +22,7 @@ import argparse
 import sys
 from pathlib import Path
 
-from .build import run_build, run_build_cpp_only, run_build_python_only, colored, Colors, get_default_work_dir, robust_rmtree
+from .build import run_build, run_build_cpp_only, run_build_python_only, colored, Colors, get_default_work_dir, move_aside, robust_rmtree
 from .tests import run_tests
 
 
@@ -86,6 +86,11 @@ def main() -> int:
         default=None,
         help="CMake toolchain file (e.g., vcpkg.cmake)",
     )
+    parser.add_argument(
+        "--no-ccache",
+        action="store_true",
+        help="Do not wrap compilers with ccache/sccache",
+    )
 
     args = parser.parse_args()
 
@@ -108,6 +113,7 @@ def main() -> int:
             branch=args.branch,
             keep=True,
             toolchain_file=args.toolchain_file,
+            use_ccache=not args.no_ccache,
         )
         if not build_success:
             if not args.keep and work_dir.exists():
@@ -126,6 +132,7 @@ def main() -> int:
             branch=args.branch,
             keep=True,
             toolchain_file=args.toolchain_file,
+            use_ccache=not args.no_ccache,
         )
         if not build_success:
             if not args.keep and work_dir.exists():
@@ -149,6 +156,7 @@ def main() -> int:
             branch=args.branch,
             keep=True,
             toolchain_file=args.toolchain_file,
+            use_ccache=not args.no_ccache,
         )
         if not build_success:
             if not args.keep and work_dir.exists():
@@ -171,7 +179,7 @@ def main() -> int:
 def _cleanup(work_dir: Path) -> None:
     print(f"\nCleaning up {work_dir}...")
     try:
-        robust_rmtree(work_dir)
+        robust_rmtree(move_aside(work_dir))
     except Exception as e:
         print(colored(f"Warning: Could not clean up: {e}", Colors.YELLOW))
 
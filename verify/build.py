@@ -22,15 +22,19 @@ Examples:
 """
 
 import argparse
-import multiprocessing
+import glob
 import os
 import shutil
 import stat
 import subprocess
 import sys
 import tempfile
+import threading
+import uuid
+from collections import deque
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
-from typing import List, Optional, Tuple
+from typing import Callable, List, NamedTuple, Optional, Tuple
 
 
 def get_default_work_dir() -> Path:
@@ -40,15 +44,57 @@ def get_default_work_dir() -> Path:
     return Path(tempfile.gettempdir()) / "trueform-verify"
 
 
-def robust_rmtree(path: Path) -> None:
-    """Remove directory tree, handling Windows permission issues."""
+def robust_rmtree(path: Path, workers: int = 4) -> None:
+    """Remove directory tree, handling Windows permission issues.
+
+    Top-level subdirectories (clone, venv, install, ...) are removed on up to
+    workers threads; unlink releases the GIL, so the deletes overlap.
+    """
     def on_error(func, fpath, exc_info):
         os.chmod(fpath, stat.S_IWRITE)
         func(fpath)
 
+    with os.scandir(path) as entries:
+        subdirs = [entry.path for entry in entries if entry.is_dir(follow_symlinks=False)]
+    if len(subdirs) > 1:
+        with ThreadPoolExecutor(max_workers=min(workers, len(subdirs))) as pool:
+            list(pool.map(lambda d: shutil.rmtree(d, onerror=on_error), subdirs))
     shutil.rmtree(path, onerror=on_error)
 
-from .venv_utils import VenvInfo, create_venv
+
+def move_aside(path: Path) -> Path:
+    """Rename path to a unique sibling so it can be deleted off the critical path.
+
+    The rename is a single atomic operation, so path is free for reuse
+    immediately and an interrupted delete never leaves a half-removed tree
+    there. Returns the new location, or path itself if it could not be moved.
+    """
+    doomed = path.with_name(f"{path.name}.deleting-{os.getpid()}-{uuid.uuid4().hex[:8]}")
+    try:
+        path.rename(doomed)
+    except OSError:
+        return path
+    return doomed
+
+
+def stale_moved_aside(path: Path) -> List[Path]:
+    """Trees that earlier runs moved aside from path but did not finish deleting."""
+    own = f"{path.name}.deleting-{os.getpid()}-"
+    return [
+        sibling
+        for sibling in path.parent.glob(f"{glob.escape(path.name)}.deleting-*")
+        if not sibling.name.startswith(own)
+    ]
+
+
+def _rmtree_quietly(*paths: Path) -> None:
+    for path in paths:
+        try:
+            robust_rmtree(path)
+        except Exception as e:
+            print(colored(f"Warning: Could not remove {path}: {e}", Colors.YELLOW))
+
+from .venv_utils import VenvInfo, available_cpus, create_venv
 
 
 # ANSI color codes
@@ -82,28 +128,40 @@ def colored(text: str, color: str) -> str:
     return text
 
 
+# Status markers, rendered once
+_ARROW = colored("==>", Colors.BLUE)
+_PASS_TAG = colored("[PASS]", Colors.GREEN)
+_FAIL_TAG = colored("[FAIL]", Colors.RED)
+_SKIP_TAG = colored("[SKIP]", Colors.YELLOW)
+
+
 def print_step(name: str) -> None:
-    print(f"\n{colored('==>', Colors.BLUE)} {colored(name, Colors.BOLD)}")
+    print(f"\n{_ARROW} {colored(name, Colors.BOLD)}")
 
 
 def print_pass(name: str) -> None:
-    print(f"  {colored('[PASS]', Colors.GREEN)} {name}")
+    print(f"  {_PASS_TAG} {name}")
 
 
 def print_fail(name: str, error: str = "") -> None:
-    print(f"  {colored('[FAIL]', Colors.RED)} {name}")
+    print(f"  {_FAIL_TAG} {name}")
     if error:
-        for line in error.strip().split("\n")[:10]:
+        # Command output ends with the error, so show its last lines
+        for line in error.strip().split("\n")[-10:]:
             print(f"         {line}")
 
 
 def print_skip(name: str, reason: str = "") -> None:
-    msg = f"  {colored('[SKIP]', Colors.YELLOW)} {name}"
+    msg = f"  {_SKIP_TAG} {name}"
     if reason:
         msg += f" ({reason})"
     print(msg)
 
 
+# Lines of command output kept for error reports
+OUTPUT_TAIL_LINES = 200
+
+
 # Test project templates
 TEST_PROJECT_CMAKE = """\
 cmake_minimum_required(VERSION 3.16)
@@ -131,6 +189,12 @@ int main() {
 """
 
 
+class CheckResult(NamedTuple):
+    name: str
+    passed: bool
+    error: str = ""
+
+
 class BuildVerifier:
     def __init__(
         self,
@@ -139,18 +203,26 @@ class BuildVerifier:
         source_dir: Path,
         branch: Optional[str] = None,
         toolchain_file: Optional[Path] = None,
+        use_ccache: bool = True,
     ):
         self.work_dir = work_dir
         self.install_prefix = install_prefix
         self.source_dir = source_dir
         self.branch = branch
         self.toolchain_file = toolchain_file
+        self.use_ccache = use_ccache
         self.clone_dir = work_dir / "trueform"
         self.build_dir = self.clone_dir / "build"
         self.test_project_dir = work_dir / "test-project"
         self.venv_dir = work_dir / "venv"
         self.venv_info: Optional[VenvInfo] = None
-        self.results: List[Tuple[str, bool, str]] = []
+        self.results: List[CheckResult] = []
+        self.failed_count = 0
+        self._results_lock = threading.Lock()
+        # Set while the C++ and wheel builds share the machine
+        self.parallel_jobs: Optional[int] = None
+        # Per-thread result buffer used by run_concurrently
+        self._local = threading.local()
 
     def run_cmd(
         self,
@@ -160,30 +232,87 @@ class BuildVerifier:
         capture: bool = True,
         env: Optional[dict] = None,
     ) -> subprocess.CompletedProcess:
-        kwargs = {"cwd": cwd, "check": check}
+        """Run a command. With capture, stdout holds the last lines of output.
+
+        Build logs can run to megabytes, and only their tail is ever shown,
+        so output is read line by line into a bounded buffer instead of
+        being collected whole.
+        """
+        kwargs = {"cwd": cwd}
         if env:
             kwargs["env"] = env
-        if capture:
-            kwargs["stdout"] = subprocess.PIPE
-            kwargs["stderr"] = subprocess.STDOUT
-            kwargs["text"] = True
-        return subprocess.run(cmd, **kwargs)
+        if not capture:
+            return subprocess.run(cmd, check=check, **kwargs)
+
+        tail = deque(maxlen=OUTPUT_TAIL_LINES)
+        with subprocess.Popen(
+            cmd,
+            stdout=subprocess.PIPE,
+            stderr=subprocess.STDOUT,
+            text=True,
+            bufsize=65536,
+            **kwargs,
+        ) as proc:
+            for line in proc.stdout:
+                tail.append(line)
+        output = "".join(tail)
+        if check and proc.returncode != 0:
+            raise subprocess.CalledProcessError(proc.returncode, cmd, output=output)
+        return subprocess.CompletedProcess(cmd, proc.returncode, stdout=output)
 
     def record_result(self, name: str, passed: bool, error: str = "") -> bool:
-        self.results.append((name, passed, error))
+        deferred = getattr(self._local, "deferred", None)
+        if deferred is not None:
+            deferred.append((name, passed, error))
+            return passed
+        # The wheel build records from a worker thread
+        with self._results_lock:
+            self.results.append(CheckResult(name, passed, error))
+            if not passed:
+                self.failed_count += 1
         if passed:
             print_pass(name)
         else:
             print_fail(name, error)
         return passed
 
+    def _deferred(self, check: Callable[[], bool]) -> List[Tuple[str, bool, str]]:
+        self._local.deferred = []
+        try:
+            check()
+            return self._local.deferred
+        finally:
+            self._local.deferred = None
+
+    def run_concurrently(self, steps: List[Tuple[str, object]]) -> None:
+        """Run independent steps on worker threads.
+
+        Each step is (header, check), where check is a callable, or a
+        (name, reason) pair for a skipped step. Results recorded by each
+        check are held back and replayed under its header in list order
+        once all checks finished, so the report reads the same as a
+        sequential run.
+        """
+        checks = [check for _, check in steps if callable(check)]
+        with ThreadPoolExecutor(max_workers=max(1, len(checks))) as pool:
+            futures = iter([pool.submit(self._deferred, check) for check in checks])
+            for step, check in steps:
+                print_step(step)
+                if not callable(check):
+                    print_skip(*check)
+                    continue
+                for result in next(futures).result():
+                    self.record_result(*result)
+
     def _get_parallel_jobs(self) -> int:
-        return max(1, multiprocessing.cpu_count())
+        if self.parallel_jobs:
+            return self.parallel_jobs
+        return available_cpus()
 
-    def _cmake_build(self, target: str) -> subprocess.CompletedProcess:
+    def _cmake_build(self, *targets: str) -> subprocess.CompletedProcess:
         cmd = [
             "cmake", "--build", str(self.build_dir),
-            "--target", target,
+            "--target", *targets,
             "--parallel", str(self._get_parallel_jobs()),
         ]
         # Multi-config generators (MSVC) need explicit config
@@ -191,6 +320,41 @@ class BuildVerifier:
             cmd.extend(["--config", "Release"])
         return self.run_cmd(cmd, cwd=self.build_dir)
 
+    def _compiler_launcher(self) -> Optional[str]:
+        """Find ccache (or sccache) to wrap compiler calls, if enabled."""
+        if not self.use_ccache:
+            return None
+        for name in ("ccache", "sccache"):
+            if shutil.which(name):
+                return name
+        return None
+
+    def _generator_args(self) -> List[str]:
+        """Select Ninja when it is available, unless CMAKE_GENERATOR is set.
+
+        Windows keeps the default (Visual Studio) generator, which the
+        multi-config handling in _cmake_build and install_cmake relies on.
+        """
+        if sys.platform == "win32" or os.environ.get("CMAKE_GENERATOR"):
+            return []
+        if shutil.which("ninja"):
+            return ["-G", "Ninja"]
+        return []
+
+    def _launcher_args(self) -> List[str]:
+        """CMake arguments routing compiles through the compiler cache.
+
+        The cache lives outside work_dir, so objects survive the clean
+        clone of the next run.
+        """
+        launcher = self._compiler_launcher()
+        if not launcher:
+            return []
+        return [
+            f"-DCMAKE_C_COMPILER_LAUNCHER={launcher}",
+            f"-DCMAKE_CXX_COMPILER_LAUNCHER={launcher}",
+        ]
+
     def _find_test_executable(self, build_dir: Path, name: str) -> Optional[Path]:
         """Find executable portably (handles MSVC Release/ subdirectory)."""
         if sys.platform == "win32":
@@ -214,11 +378,22 @@ class BuildVerifier:
     # Setup & Clone
     # =========================================================================
     def do_setup(self) -> bool:
+        # Leftovers of interrupted or failed deletes are removed along with
+        # the old tree
+        doomed = stale_moved_aside(self.work_dir)
         if self.work_dir.exists():
-            try:
-                robust_rmtree(self.work_dir)
-            except Exception as e:
-                return self.record_result("Clean work directory", False, str(e))
+            moved = move_aside(self.work_dir)
+            if moved != self.work_dir:
+                doomed.append(moved)
+            else:
+                try:
+                    robust_rmtree(self.work_dir)
+                except Exception as e:
+                    return self.record_result("Clean work directory", False, str(e))
+        if doomed:
+            # Delete the old trees while the clone and build run; the thread
+            # is not a daemon, so exit waits for it to finish
+            threading.Thread(target=_rmtree_quietly, args=doomed).start()
         self.record_result("Clean work directory", True)
 
         try:
@@ -229,7 +404,15 @@ class BuildVerifier:
         return True
 
     def do_clone(self) -> bool:
-        clone_cmd = ["git", "clone", str(self.source_dir), str(self.clone_dir)]
+        # Only the one checkout is built, so skip other branches and tags
+        clone_cmd = ["git", "clone", "--single-branch", "--no-tags"]
+        if Path(self.source_dir).is_dir():
+            # Borrow the source's object store instead of copying it
+            # (git ignores --depth for local paths)
+            clone_cmd.extend(["--local", "--shared"])
+        else:
+            clone_cmd.append("--depth=1")
+        clone_cmd.extend([str(self.source_dir), str(self.clone_dir)])
         if self.branch:
             clone_cmd.extend(["--branch", self.branch])
 
@@ -252,6 +435,7 @@ class BuildVerifier:
             "cmake",
             "-S", str(self.clone_dir),
             "-B", str(self.build_dir),
+            *self._generator_args(),
             f"-DCMAKE_INSTALL_PREFIX={self.install_prefix}",
             "-DCMAKE_BUILD_TYPE=Release",
             "-DTF_BUILD_EXAMPLES=ON",
@@ -259,6 +443,7 @@ class BuildVerifier:
         ]
         if self.toolchain_file:
             cmake_args.append(f"-DCMAKE_TOOLCHAIN_FILE={self.toolchain_file}")
+        cmake_args.extend(self._launcher_args())
         if not skip_vtk:
             cmake_args.extend([
                 "-DTF_BUILD_VTK_INTEGRATION=ON",
@@ -312,6 +497,60 @@ class BuildVerifier:
                 "trueform_vtk_examples", False, e.stdout if e.stdout else str(e)
             )
 
+    def build_all(self, skip_vtk: bool = False, skip_examples: bool = False) -> bool:
+        """Build the enabled C++ targets. Returns whether trueform_vtk built.
+
+        All targets go to a single cmake --build, so the generator schedules
+        them as one graph instead of draining its job pool between targets.
+        If that fails, the targets are rebuilt one at a time (incrementally)
+        to find which one broke.
+        """
+        targets = ["trueform_tests"]
+        if not skip_examples:
+            targets.insert(0, "trueform_examples")
+        if not skip_vtk:
+            targets.append("trueform_vtk")
+            if not skip_examples:
+                targets.append("trueform_vtk_examples")
+
+        try:
+            self._cmake_build(*targets)
+        except subprocess.CalledProcessError:
+            return self._build_each(skip_vtk=skip_vtk, skip_examples=skip_examples)
+
+        if skip_examples:
+            print_skip("trueform_examples", "skipped by user")
+        for target in targets:
+            self.record_result(target, True)
+        if skip_vtk:
+            print_skip("trueform_vtk", "skipped by user")
+            print_skip("trueform_vtk_examples", "skipped by user")
+        elif skip_examples:
+            print_skip("trueform_vtk_examples", "skipped by user")
+        return not skip_vtk
+
+    def _build_each(self, skip_vtk: bool = False, skip_examples: bool = False) -> bool:
+        if skip_examples:
+            print_skip("trueform_examples", "skipped by user")
+        else:
+            self.build_examples()
+        self.build_tests()
+
+        vtk_ok = False
+        if skip_vtk:
+            print_skip("trueform_vtk", "skipped by user")
+            print_skip("trueform_vtk_examples", "skipped by user")
+        else:
+            vtk_ok = self.build_vtk()
+            if vtk_ok:
+                if skip_examples:
+                    print_skip("trueform_vtk_examples", "skipped by user")
+                else:
+                    self.build_vtk_examples()
+            else:
+                print_skip("trueform_vtk_examples", "VTK build failed")
+        return vtk_ok
+
     # =========================================================================
     # Install
     # =========================================================================
@@ -336,7 +575,7 @@ class BuildVerifier:
             return self.record_result("Install wheel", False, "No wheel found")
 
         try:
-            self.venv_info.run_pip(["install", str(wheels[0])], cwd=self.work_dir)
+            self.venv_info.install([str(wheels[0])], cwd=self.work_dir)
             return self.record_result("Install wheel", True)
         except subprocess.CalledProcessError as e:
             return self.record_result(
@@ -346,23 +585,37 @@ class BuildVerifier:
     # =========================================================================
     # Verify trueform
     # =========================================================================
-    def verify_trueform(self) -> bool:
-        checks = [
-            ("include/trueform/trueform.hpp", "Header files"),
-            ("lib/cmake/trueform/trueformConfig.cmake", "CMake config"),
-            ("lib/cmake/trueform/trueformTargets.cmake", "CMake targets"),
-        ]
+    def _check_installed(self, checks: List[Tuple[str, str]]) -> bool:
+        """Record whether each (path, name) exists under the install prefix.
 
+        Each parent directory is listed once and the names are looked up in
+        that listing, instead of one stat per file.
+        """
+        listings = {}
         all_passed = True
         for path, name in checks:
             full_path = self.install_prefix / path
-            if full_path.exists():
+            parent = full_path.parent
+            if parent not in listings:
+                try:
+                    listings[parent] = set(os.listdir(parent))
+                except OSError:
+                    listings[parent] = set()
+            if full_path.name in listings[parent]:
                 self.record_result(name, True)
             else:
                 self.record_result(name, False, f"Missing: {full_path}")
                 all_passed = False
         return all_passed
 
+    def verify_trueform(self) -> bool:
+        checks = [
+            ("include/trueform/trueform.hpp", "Header files"),
+            ("lib/cmake/trueform/trueformConfig.cmake", "CMake config"),
+            ("lib/cmake/trueform/trueformTargets.cmake", "CMake targets"),
+        ]
+        return self._check_installed(checks)
+
     # =========================================================================
     # Verify trueform_vtk
     # =========================================================================
@@ -371,16 +624,7 @@ class BuildVerifier:
             ("include/trueform/vtk.hpp", "VTK header"),
             ("lib/cmake/trueform_vtk/trueform_vtkConfig.cmake", "VTK CMake config"),
         ]
-
-        all_passed = True
-        for path, name in checks:
-            full_path = self.install_prefix / path
-            if full_path.exists():
-                self.record_result(name, True)
-            else:
-                self.record_result(name, False, f"Missing: {full_path}")
-                all_passed = False
-        return all_passed
+        return self._check_installed(checks)
 
     # =========================================================================
     # Verify pip
@@ -429,6 +673,7 @@ class BuildVerifier:
         ]
         if self.toolchain_file:
             cmake_args.append(f"-DCMAKE_TOOLCHAIN_FILE={self.toolchain_file}")
+        cmake_args.extend(self._launcher_args())
 
         try:
             self.run_cmd(cmake_args, cwd=test_build_dir)
@@ -440,7 +685,7 @@ class BuildVerifier:
 
         try:
             self.run_cmd(
-                ["cmake", "--build", str(test_build_dir)],
+                ["cmake", "--build", str(test_build_dir), "--parallel", str(self._get_parallel_jobs())],
                 cwd=test_build_dir,
             )
             self.record_result("Build test project", True)
@@ -510,6 +755,7 @@ int main() {
         ]
         if self.toolchain_file:
             cmake_args.append(f"-DCMAKE_TOOLCHAIN_FILE={self.toolchain_file}")
+        cmake_args.extend(self._launcher_args())
 
         try:
             self.run_cmd(cmake_args, cwd=vtk_build_dir)
@@ -579,6 +825,7 @@ int main() {
         ]
         if self.toolchain_file:
             cmake_args.append(f"-DCMAKE_TOOLCHAIN_FILE={self.toolchain_file}")
+        cmake_args.extend(self._launcher_args())
 
         try:
             self.run_cmd(cmake_args, cwd=pip_build_dir)
@@ -622,7 +869,7 @@ int main() {
     def do_create_venv(self) -> bool:
         """Create venv and store info in self.venv_info."""
         try:
-            self.venv_info = create_venv(self.venv_dir, with_pip=True, upgrade_pip=True)
+            self.venv_info = create_venv(self.venv_dir, with_pip=True)
             return self.record_result(f"Create venv ({self.venv_info.python_exe.name})", True)
         except Exception as e:
             return self.record_result("Create venv", False, str(e))
@@ -632,10 +879,20 @@ int main() {
         wheel_dir = self.work_dir / "wheelhouse"
         wheel_dir.mkdir(parents=True, exist_ok=True)
 
+        env = {}
+        if self.parallel_jobs:
+            env["CMAKE_BUILD_PARALLEL_LEVEL"] = str(self.parallel_jobs)
+        launcher = self._compiler_launcher()
+        if launcher:
+            # Read by CMake >= 3.17 when the build backend configures
+            env["CMAKE_C_COMPILER_LAUNCHER"] = launcher
+            env["CMAKE_CXX_COMPILER_LAUNCHER"] = launcher
+
         try:
             self.venv_info.run_pip(
                 ["wheel", str(self.clone_dir), "--no-deps", "--wheel-dir", str(wheel_dir)],
                 cwd=self.clone_dir,
+                env=env,
             )
             return self.record_result("Build wheel", True)
         except subprocess.CalledProcessError as e:
@@ -674,33 +931,25 @@ int main() {
             print_skip("Python", "skipped by user")
 
         print_step("Build")
-        if skip_examples:
-            print_skip("trueform_examples", "skipped by user")
-        else:
-            self.build_examples()
-        self.build_tests()
-
-        vtk_ok = False
-        if skip_vtk:
-            print_skip("trueform_vtk", "skipped by user")
-            print_skip("trueform_vtk_examples", "skipped by user")
-        else:
-            vtk_ok = self.build_vtk()
-            if vtk_ok:
-                if skip_examples:
-                    print_skip("trueform_vtk_examples", "skipped by user")
-                else:
-                    self.build_vtk_examples()
+        # The wheel builds in its own tree, so it runs next to the C++
+        # targets, with the cores split between the two
+        wheel_ok = False
+        with ThreadPoolExecutor(max_workers=1) as pool:
+            wheel_future = None
+            if skip_python:
+                print_skip("Build wheel", "skipped by user")
+            elif venv_ok:
+                self.parallel_jobs = max(1, available_cpus() // 2)
+                wheel_future = pool.submit(self.build_wheel)
             else:
-                print_skip("trueform_vtk_examples", "VTK build failed")
+                print_skip("Build wheel", "venv creation failed")
 
-        wheel_ok = False
-        if skip_python:
-            print_skip("Build wheel", "skipped by user")
-        elif venv_ok:
-            wheel_ok = self.build_wheel()
-        else:
-            print_skip("Build wheel", "venv creation failed")
+            try:
+                vtk_ok = self.build_all(skip_vtk=skip_vtk, skip_examples=skip_examples)
+                if wheel_future is not None:
+                    wheel_ok = wheel_future.result()
+            finally:
+                self.parallel_jobs = None
 
         print_step("Install")
         if not self.install_cmake():
@@ -714,55 +963,41 @@ int main() {
         else:
             print_skip("Install wheel", "wheel build failed")
 
-        print_step("Verify trueform")
-        self.verify_trueform()
-
+        # The checks and find_package projects only read the install trees
+        steps = [("Verify trueform", self.verify_trueform)]
         if skip_vtk:
-            print_step("Verify trueform_vtk")
-            print_skip("VTK verification", "skipped by user")
+            steps.append(("Verify trueform_vtk", ("VTK verification", "skipped by user")))
         elif vtk_ok:
-            print_step("Verify trueform_vtk")
-            self.verify_trueform_vtk()
-
+            steps.append(("Verify trueform_vtk", self.verify_trueform_vtk))
         if skip_python:
-            print_step("Verify pip")
-            print_skip("pip verification", "skipped by user")
+            steps.append(("Verify pip", ("pip verification", "skipped by user")))
         elif pip_ok and venv_ok:
-            print_step("Verify pip")
-            self.verify_pip()
-
-        print_step("Test find_package")
-        self.test_find_package()
-
+            steps.append(("Verify pip", self.verify_pip))
+        steps.append(("Test find_package", self.test_find_package))
         if skip_vtk:
-            print_step("Test find_package (vtk)")
-            print_skip("VTK find_package test", "skipped by user")
+            steps.append(("Test find_package (vtk)", ("VTK find_package test", "skipped by user")))
         elif vtk_ok:
-            print_step("Test find_package (vtk)")
-            self.test_find_package_vtk()
-
+            steps.append(("Test find_package (vtk)", self.test_find_package_vtk))
         if skip_python:
-            print_step("Test find_package (pip)")
-            print_skip("pip find_package test", "skipped by user")
+            steps.append(("Test find_package (pip)", ("pip find_package test", "skipped by user")))
         elif pip_ok and venv_ok:
-            print_step("Test find_package (pip)")
-            self.test_find_package_pip()
+            steps.append(("Test find_package (pip)", self.test_find_package_pip))
+        self.run_concurrently(steps)
 
         return True
 
     def print_summary(self) -> bool:
         print_step("Summary")
 
-        failed = sum(1 for _, p, _ in self.results if not p)
+        failed = self.failed_count
         total = len(self.results)
 
-        for name, success, error in self.results:
-            if success:
-                print(f"  {colored('[PASS]', Colors.GREEN)} {name}")
-            else:
-                print(f"  {colored('[FAIL]', Colors.RED)} {name}")
-
-        print()
+        # One write for the whole list rather than a print per check
+        lines = [
+            f"  {_PASS_TAG if result.passed else _FAIL_TAG} {result.name}\n"
+            for result in self.results
+        ]
+        sys.stdout.write("".join(lines) + "\n")
         if failed == 0:
             print(colored(f"All {total} checks passed!", Colors.GREEN + Colors.BOLD))
             return True
@@ -789,6 +1024,7 @@ def run_build_cpp_only(
     keep: bool = False,
     source_dir: Path = None,
     toolchain_file: Path = None,
+    use_ccache: bool = True,
 ) -> bool:
     """
     Build and verify C++ only (no Python).
@@ -818,6 +1054,7 @@ def run_build_cpp_only(
         source_dir=source_dir,
         branch=branch,
         toolchain_file=toolchain_file,
+        use_ccache=use_ccache,
     )
 
     try:
@@ -834,70 +1071,29 @@ def run_build_cpp_only(
             return False
 
         print_step("Build")
-        if skip_examples:
-            print_skip("trueform_examples", "skipped by user")
-        else:
-            verifier.build_examples()
-        verifier.build_tests()
-
-        if skip_vtk:
-            print_skip("trueform_vtk", "skipped by user")
-            print_skip("trueform_vtk_examples", "skipped by user")
-        else:
-            vtk_ok = verifier.build_vtk()
-            if vtk_ok:
-                if skip_examples:
-                    print_skip("trueform_vtk_examples", "skipped by user")
-                else:
-                    verifier.build_vtk_examples()
-            else:
-                print_skip("trueform_vtk_examples", "VTK build failed")
+        verifier.build_all(skip_vtk=skip_vtk, skip_examples=skip_examples)
 
         print_step("Install")
         if not verifier.install_cmake():
             return False
 
-        print_step("Verify trueform")
-        verifier.verify_trueform()
-
+        steps = [("Verify trueform", verifier.verify_trueform)]
         if skip_vtk:
-            print_step("Verify trueform_vtk")
-            print_skip("VTK verification", "skipped by user")
+            steps.append(("Verify trueform_vtk", ("VTK verification", "skipped by user")))
         else:
-            print_step("Verify trueform_vtk")
-            verifier.verify_trueform_vtk()
-
-        print_step("Test find_package")
-        verifier.test_find_package()
-
+            steps.append(("Verify trueform_vtk", verifier.verify_trueform_vtk))
+        steps.append(("Test find_package", verifier.test_find_package))
         if skip_vtk:
-            print_step("Test find_package (vtk)")
-            print_skip("VTK find_package test", "skipped by user")
+            steps.append(("Test find_package (vtk)", ("VTK find_package test", "skipped by user")))
         else:
-            print_step("Test find_package (vtk)")
-            verifier.test_find_package_vtk()
+            steps.append(("Test find_package (vtk)", verifier.test_find_package_vtk))
+        verifier.run_concurrently(steps)
 
     except KeyboardInterrupt:
         print(colored("\nInterrupted by user", Colors.YELLOW))
         return False
 
-    print_step("Summary")
-    failed = sum(1 for _, p, _ in verifier.results if not p)
-    total = len(verifier.results)
-
-    for name, success, _ in verifier.results:
-        if success:
-            print(f"  {colored('[PASS]', Colors.GREEN)} {name}")
-        else:
-            print(f"  {colored('[FAIL]', Colors.RED)} {name}")
-
-    print()
-    if failed == 0:
-        print(colored(f"All {total} checks passed!", Colors.GREEN + Colors.BOLD))
-        return True
-    else:
-        print(colored(f"{failed}/{total} checks failed", Colors.RED + Colors.BOLD))
-        return False
+    return verifier.print_summary()
 
 
 def run_build_python_only(
@@ -906,6 +1102,7 @@ def run_build_python_only(
     keep: bool = False,
     source_dir: Path = None,
     toolchain_file: Path = None,
+    use_ccache: bool = True,
 ) -> bool:
     """
     Build Python bindings only (for CI).
@@ -933,6 +1130,7 @@ def run_build_python_only(
         source_dir=source_dir,
         branch=branch,
         toolchain_file=toolchain_file,
+        use_ccache=use_ccache,
     )
 
     try:
@@ -963,23 +1161,7 @@ def run_build_python_only(
         print(colored("\nInterrupted by user", Colors.YELLOW))
         return False
 
-    print_step("Summary")
-    failed = sum(1 for _, p, _ in verifier.results if not p)
-    total = len(verifier.results)
-
-    for name, success, _ in verifier.results:
-        if success:
-            print(f"  {colored('[PASS]', Colors.GREEN)} {name}")
-        else:
-            print(f"  {colored('[FAIL]', Colors.RED)} {name}")
-
-    print()
-    if failed == 0:
-        print(colored(f"All {total} checks passed!", Colors.GREEN + Colors.BOLD))
-        return True
-    else:
-        print(colored(f"{failed}/{total} checks failed", Colors.RED + Colors.BOLD))
-        return False
+    return verifier.print_summary()
 
 
 def run_build(
@@ -992,6 +1174,7 @@ def run_build(
     keep: bool = False,
     source_dir: Path = None,
     toolchain_file: Path = None,
+    use_ccache: bool = True,
 ) -> bool:
     """
     Build and install trueform from a clean clone.
@@ -1022,6 +1205,7 @@ def run_build(
         source_dir=source_dir,
         branch=branch,
         toolchain_file=toolchain_file,
+        use_ccache=use_ccache,
     )
 
     try:
@@ -1039,7 +1223,7 @@ def run_build(
     if not keep and work_dir.exists():
         print(f"\nCleaning up {work_dir}...")
         try:
-            robust_rmtree(work_dir)
+            robust_rmtree(move_aside(work_dir))
         except Exception as e:
             print(colored(f"Warning: Could not clean up: {e}", Colors.YELLOW))
 
@@ -1096,6 +1280,11 @@ def main() -> int:
         default=None,
         help="CMake toolchain file (e.g., vcpkg.cmake)",
     )
+    parser.add_argument(
+        "--no-ccache",
+        action="store_true",
+        help="Do not wrap compilers with ccache/sccache",
+    )
 
     args = parser.parse_args()
 
@@ -1108,6 +1297,7 @@ def main() -> int:
         branch=args.branch,
         keep=args.keep,
         toolchain_file=args.toolchain_file,
+        use_ccache=not args.no_ccache,
     )
 
     return 0 if success else 1
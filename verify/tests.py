@@ -15,16 +15,54 @@ Examples:
     python -m verify.tests --work-dir ./my-build     # Use specific work directory
     python -m verify.tests --skip-cpp                # Only Python tests
     python -m verify.tests --skip-python             # Only C++ tests
+    python -m verify.tests --incremental             # Re-run last failures only
+
+Set TRUEFORM_VERIFY_INPROCESS=1 to run pytest inside this interpreter instead
+of a fresh one. This only applies when the script itself runs from the test
+venv, and it skips the separate interpreter start and plugin discovery.
 """
 
 import argparse
-import multiprocessing
+import functools
+import importlib.util
+import io
+import os
+import re
+import shutil
 import subprocess
 import sys
+import threading
+import xml.etree.ElementTree as ET
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
+from typing import Optional
 
 from .build import get_default_work_dir, Colors, colored
-from .venv_utils import VenvInfo, get_venv_info
+from .venv_utils import VenvInfo, available_cpus, get_venv_info
+
+
+# Status markers, rendered once
+_ARROW = colored("==>", Colors.BLUE)
+_PASS_TAG = colored("[PASS]", Colors.GREEN)
+_FAIL_TAG = colored("[FAIL]", Colors.RED)
+_SKIP_TAG = colored("[SKIP]", Colors.YELLOW)
+
+
+# Per-thread report buffer, set while a test phase runs concurrently
+_report = threading.local()
+
+
+def _out():
+    return getattr(_report, "buffer", None) or sys.stdout
+
+
+def _buffered(fn, *args, **kwargs) -> tuple:
+    """Run fn, collecting its report lines. Returns (result, report text)."""
+    _report.buffer = io.StringIO()
+    try:
+        return fn(*args, **kwargs), _report.buffer.getvalue()
+    finally:
+        _report.buffer = None
 
 
 def print_header(name: str) -> None:
@@ -36,30 +74,30 @@ def print_header(name: str) -> None:
 
 
 def print_step(name: str) -> None:
-    print(f"\n{colored('==>', Colors.BLUE)} {colored(name, Colors.BOLD)}")
+    print(f"\n{_ARROW} {colored(name, Colors.BOLD)}", file=_out())
 
 
 def print_pass(name: str) -> None:
-    print(f"  {colored('[PASS]', Colors.GREEN)} {name}")
+    print(f"  {_PASS_TAG} {name}", file=_out())
 
 
 def print_fail(name: str, error: str = "") -> None:
-    print(f"  {colored('[FAIL]', Colors.RED)} {name}")
+    print(f"  {_FAIL_TAG} {name}", file=_out())
     if error:
         for line in error.strip().split("\n")[:10]:
-            print(f"         {line}")
+            print(f"         {line}", file=_out())
 
 
 def print_skip(name: str, reason: str = "") -> None:
-    msg = f"  {colored('[SKIP]', Colors.YELLOW)} {name}"
+    msg = f"  {_SKIP_TAG} {name}"
     if reason:
         msg += f" ({reason})"
-    print(msg)
+    print(msg, file=_out())
 
 
-def run_cmd(cmd: list, cwd: Path = None, capture: bool = False):
+def run_cmd(cmd: list, cwd: Path = None, capture: bool = False, check: bool = True):
     """Run command."""
-    kwargs = {"cwd": cwd, "check": True}
+    kwargs = {"cwd": cwd, "check": check}
     if capture:
         kwargs["stdout"] = subprocess.PIPE
         kwargs["stderr"] = subprocess.STDOUT
@@ -67,76 +105,229 @@ def run_cmd(cmd: list, cwd: Path = None, capture: bool = False):
     return subprocess.run(cmd, **kwargs)
 
 
-def run_cpp_tests(build_dir: Path) -> bool:
-    """Run C++ tests via ctest."""
-    print_step("C++ Tests")
+# ctest is run twice per test run (version probe, then the tests); look it
+# up on PATH once
+_CTEST = shutil.which("ctest") or "ctest"
+
+# "100% tests passed, 0 tests failed out of 1013"
+_CTEST_SUMMARY_RE = re.compile(
+    rb'(\d+)%\s+tests\s+passed.*?(\d+)\s+tests?\s+failed\s+out\s+of\s+(\d+)', re.IGNORECASE
+)
+# "  123 - core::test_name (Failed)"
+_CTEST_FAILED_RE = re.compile(rb'^\s*\d+\s+-\s+(.+?)\s+\(')
+# pytest summary counts: "X passed", "Y failed", "Z errors"
+_PYTEST_PASSED_RE = re.compile(r'(\d+)\s+passed')
+_PYTEST_FAILED_RE = re.compile(r'(\d+)\s+failed')
+_PYTEST_ERROR_RE = re.compile(r'(\d+)\s+errors?')
 
-    num_jobs = max(1, multiprocessing.cpu_count())
 
+@functools.lru_cache(maxsize=None)
+def _ctest_supports_junit() -> bool:
+    """Whether ctest has --output-junit (CMake >= 3.21)."""
     try:
-        result = run_cmd(
-            [
-                "ctest",
-                "--test-dir", str(build_dir / "tests"),
-                "--output-on-failure",
-                "-j", str(num_jobs),
-            ],
+        result = run_cmd([_CTEST, "--version"], capture=True)
+    except (OSError, subprocess.CalledProcessError):
+        return False
+    match = re.search(r"version\s+(\d+)\.(\d+)", result.stdout)
+    return bool(match) and tuple(map(int, match.groups())) >= (3, 21)
+
+
+def _read_junit(path: Path) -> Optional[list]:
+    """Read a JUnit XML report as [(test name, passed)], or None if unreadable.
+
+    ctest writes "Not Run" tests (e.g. a missing executable) with <skipped>.
+    They count as failed, as in ctest's console summary, except for tests
+    skipped on purpose (SKIP_RETURN_CODE, SKIP_REGULAR_EXPRESSION), which
+    the summary counts as passed. Disabled tests are left out.
+    """
+    try:
+        root = ET.parse(path).getroot()
+    except (OSError, ET.ParseError):
+        return None
+    cases = []
+    for case in root.iter("testcase"):
+        if case.get("status") == "disabled":
+            continue
+        skipped = case.find("skipped")
+        if skipped is not None:
+            passed = skipped.get("message", "").startswith("SKIP_")
+        else:
+            passed = case.find("failure") is None and case.find("error") is None
+        cases.append((case.get("name", ""), passed))
+    return cases
+
+
+def _last_failed_log(build_dir: Path) -> Path:
+    """ctest's record of the tests that failed in its previous run."""
+    return build_dir / "tests" / "Testing" / "Temporary" / "LastTestsFailed.log"
+
+
+def run_cpp_tests(build_dir: Path, jobs: Optional[int] = None, rerun_failed: bool = False) -> bool:
+    """Run C++ tests via ctest, on jobs parallel tests (default: all CPUs).
+
+    With rerun_failed, only the tests that failed in the previous run are
+    run again; if none did, the whole suite runs.
+
+    Results are read from ctest's JUnit report where supported, and the
+    console output is discarded. Older ctest falls back to scanning the
+    output line by line as it is written, for the summary line and the
+    list of failed tests. Those lines stay bytes; only the matched fields
+    are decoded.
+    """
+    print_step("C++ Tests")
+
+    num_jobs = jobs or available_cpus()
+    cmd = [
+        _CTEST,
+        "--test-dir", str(build_dir / "tests"),
+        "--output-on-failure",
+        "-j", str(num_jobs),
+    ]
+    log = _last_failed_log(build_dir)
+    if rerun_failed and log.is_file() and log.stat().st_size > 0:
+        cmd.append("--rerun-failed")
+
+    if _ctest_supports_junit():
+        junit = build_dir / "ctest-results.xml"
+        junit.unlink(missing_ok=True)
+        returncode = subprocess.run(
+            cmd + ["--output-junit", str(junit)],
             cwd=build_dir,
-            capture=True,
-        )
-        # Parse ctest output for summary
-        output = result.stdout
-        # Look for line like "100% tests passed, 0 tests failed out of 1013"
-        import re
-        for line in output.split("\n"):
-            match = re.search(r'(\d+)%\s+tests\s+passed.*?(\d+)\s+tests?\s+failed\s+out\s+of\s+(\d+)', line, re.IGNORECASE)
-            if match:
-                pct, failed, total = match.groups()
-                passed = int(total) - int(failed)
+            stdout=subprocess.DEVNULL,
+            stderr=subprocess.DEVNULL,
+        ).returncode
+        cases = _read_junit(junit)
+        if cases is not None:
+            failed_tests = [name for name, passed in cases if not passed]
+            total = len(cases)
+            passed = total - len(failed_tests)
+            if returncode == 0 and not failed_tests:
                 print_pass(f"ctest ({passed}/{total} passed)")
                 return True
-        print_pass("ctest")
-        return True
-    except subprocess.CalledProcessError as e:
-        output = getattr(e, 'stdout', '') or str(e)
-        # Try to extract failure info
-        fail_info = ""
-        failed_tests = []
-        import re
-
-        # Look for "The following tests FAILED:" section
-        in_failed_section = False
-        for line in output.split("\n"):
-            if "The following tests FAILED:" in line:
+            fail_info = f"{passed}/{total} passed, {len(failed_tests)} failed"
+            if failed_tests:
+                fail_info = f"{fail_info}\n         Failed: {', '.join(failed_tests)}"
+            print_fail("ctest", fail_info)
+            return False
+
+    summary = None
+    failed_tests = []
+    in_failed_section = False
+    with subprocess.Popen(
+        cmd,
+        cwd=build_dir,
+        stdout=subprocess.PIPE,
+        stderr=subprocess.STDOUT,
+        bufsize=65536,
+    ) as proc:
+        for line in proc.stdout:
+            if b"The following tests FAILED:" in line:
                 in_failed_section = True
                 continue
             if in_failed_section:
-                # Lines look like: "  123 - core::test_name (Failed)"
-                test_match = re.search(r'^\s*\d+\s+-\s+(.+?)\s+\(', line)
+                test_match = _CTEST_FAILED_RE.search(line)
                 if test_match:
-                    failed_tests.append(test_match.group(1))
-                elif line.strip() and not line.startswith(" "):
+                    failed_tests.append(test_match.group(1).decode(errors="replace"))
+                elif line.strip() and not line.startswith(b" "):
                     in_failed_section = False
 
-            # Look for summary line
-            match = re.search(r'(\d+)%\s+tests\s+passed.*?(\d+)\s+tests?\s+failed\s+out\s+of\s+(\d+)', line, re.IGNORECASE)
+            match = _CTEST_SUMMARY_RE.search(line)
             if match:
-                pct, failed, total = match.groups()
-                passed = int(total) - int(failed)
-                fail_info = f"{passed}/{total} passed, {failed} failed"
+                summary = [int(group) for group in match.groups()]
+
+    if proc.returncode == 0:
+        if summary:
+            pct, failed, total = summary
+            passed = total - failed
+            print_pass(f"ctest ({passed}/{total} passed)")
+        else:
+            print_pass("ctest")
+        return True
+
+    fail_info = ""
+    if summary:
+        pct, failed, total = summary
+        passed = total - failed
+        fail_info = f"{passed}/{total} passed, {failed} failed"
+    if failed_tests:
+        fail_info = f"{fail_info}\n         Failed: {', '.join(failed_tests)}"
+
+    print_fail("ctest", fail_info if fail_info else "Tests failed")
+    return False
+
 
-        # Build error message
-        if failed_tests:
-            fail_info = f"{fail_info}\n         Failed: {', '.join(failed_tests)}"
+def _inprocess_requested(venv_info: VenvInfo = None) -> bool:
+    """Check whether pytest may run inside this interpreter.
 
-        print_fail("ctest", fail_info if fail_info else "Tests failed")
+    Opt-in via TRUEFORM_VERIFY_INPROCESS=1, and only when this interpreter
+    is the one the tests target (the venv's, if there is one). Otherwise the
+    tests would import whatever trueform this interpreter happens to see.
+    """
+    if os.environ.get("TRUEFORM_VERIFY_INPROCESS") != "1":
+        return False
+    if importlib.util.find_spec("pytest") is None:
         return False
+    if venv_info is None:
+        return True
+    return Path(sys.prefix).resolve() == Path(venv_info.venv_dir).resolve()
 
 
-def run_python_tests(source_dir: Path, venv_info: VenvInfo = None) -> bool:
-    """Run Python tests via pytest."""
-    import re
+def _pytest_args(test_dir: Path, jobs: Optional[int], xdist: bool, last_failed: bool = False) -> list:
+    """Build pytest arguments, spreading tests over jobs xdist workers.
 
+    jobs=None uses every available CPU; jobs=0 (or no xdist) runs serially.
+    Tests that share state are pinned to one worker via xdist_group marks,
+    which --dist=loadgroup honors. last_failed restricts the run to the
+    previous run's failures, or everything if there were none.
+    """
+    args = [str(test_dir), "-v"]
+    if last_failed:
+        args.append("--last-failed")
+    if jobs is None:
+        jobs = available_cpus()
+    if xdist and jobs > 0:
+        args.extend(["-n", str(jobs), "--dist=loadgroup"])
+    return args
+
+
+def _run_pytest_inprocess(
+    test_dir: Path, source_dir: Path, jobs: Optional[int] = None, last_failed: bool = False
+) -> tuple:
+    """Run pytest via pytest.main and return (success, passed, failed, errors)."""
+    import pytest
+
+    class _Counts:
+        def __init__(self):
+            self.passed = self.failed = self.errors = 0
+
+        def pytest_terminal_summary(self, terminalreporter):
+            stats = terminalreporter.stats
+            self.passed = len(stats.get("passed", []))
+            self.failed = len(stats.get("failed", []))
+            self.errors = len(stats.get("error", []))
+
+    counts = _Counts()
+    # This may run on a worker thread next to ctest, so the working directory
+    # is left alone; --rootdir puts pytest's cache where a subprocess run in
+    # source_dir would
+    xdist = importlib.util.find_spec("xdist") is not None
+    args = _pytest_args(test_dir.resolve(), jobs, xdist, last_failed)
+    args.append(f"--rootdir={source_dir.resolve()}")
+    code = pytest.main(args, plugins=[counts])
+    return code == 0, counts.passed, counts.failed, counts.errors
+
+
+def run_python_tests(
+    source_dir: Path,
+    venv_info: VenvInfo = None,
+    jobs: Optional[int] = None,
+    last_failed: bool = False,
+) -> bool:
+    """Run Python tests via pytest, in parallel when pytest-xdist is available.
+
+    With last_failed, only the previous run's failures are run again, using
+    pytest's own cache.
+    """
     print_step("Python Tests")
 
     test_dir = source_dir / "python" / "tests"
@@ -144,39 +335,76 @@ def run_python_tests(source_dir: Path, venv_info: VenvInfo = None) -> bool:
         print_fail("Python tests", f"Test directory not found: {test_dir}")
         return False
 
-    output = ""
-    success = False
+    if _inprocess_requested(venv_info):
+        success, passed, failed, errors = _run_pytest_inprocess(test_dir, source_dir, jobs, last_failed)
+        return _report_pytest(success, passed, failed, errors)
+
+    junit = source_dir / "pytest-results.xml"
+    junit.unlink(missing_ok=True)
+    junit_arg = f"--junitxml={junit}"
 
     if venv_info:
         try:
-            venv_info.run_pip(["install", "pytest"])
+            venv_info.install_testing_deps()
             print_pass("Install pytest")
         except subprocess.CalledProcessError as e:
             print_fail("Install pytest", getattr(e, 'stdout', str(e)))
             return False
 
-        try:
-            result = venv_info.run_python(["-m", "pytest", str(test_dir), "-v"], cwd=source_dir)
-            output = result.stdout
-            success = True
-        except subprocess.CalledProcessError as e:
-            output = getattr(e, 'stdout', str(e))
+        result = venv_info.run_python(
+            ["-m", "pytest", *_pytest_args(test_dir, jobs, True, last_failed), junit_arg],
+            cwd=source_dir,
+            check=False,
+        )
     else:
-        try:
-            result = run_cmd([sys.executable, "-m", "pytest", str(test_dir), "-v"], cwd=source_dir, capture=True)
-            output = result.stdout
-            success = True
-        except subprocess.CalledProcessError as e:
-            output = getattr(e, 'stdout', str(e))
-
-    # Parse pytest summary line: "X passed" or "X passed, Y failed" or "X errors"
-    match = re.search(r'(\d+)\s+passed', output)
-    failed_match = re.search(r'(\d+)\s+failed', output)
-    error_match = re.search(r'(\d+)\s+errors?', output)
+        xdist = importlib.util.find_spec("xdist") is not None
+        result = run_cmd(
+            [sys.executable, "-m", "pytest", *_pytest_args(test_dir, jobs, xdist, last_failed), junit_arg],
+            cwd=source_dir,
+            capture=True,
+            check=False,
+        )
+    # Failing tests are an expected outcome here, not an error
+    output = result.stdout
+    success = result.returncode == 0
+
+    suites = _read_junit_suites(junit)
+    if suites is not None:
+        return _report_pytest(success, *suites)
+
+    # No report (pytest died early): parse the summary line instead,
+    # "X passed" or "X passed, Y failed" or "X errors".
+    # It is the last line of the output; search everything only if it is not.
+    summary = output.rstrip().rpartition("\n")[2]
+    if not any(r.search(summary) for r in (_PYTEST_PASSED_RE, _PYTEST_FAILED_RE, _PYTEST_ERROR_RE)):
+        summary = output
+    match = _PYTEST_PASSED_RE.search(summary)
+    failed_match = _PYTEST_FAILED_RE.search(summary)
+    error_match = _PYTEST_ERROR_RE.search(summary)
 
     passed = int(match.group(1)) if match else 0
     failed = int(failed_match.group(1)) if failed_match else 0
     errors = int(error_match.group(1)) if error_match else 0
+    return _report_pytest(success, passed, failed, errors)
+
+
+def _read_junit_suites(path: Path) -> Optional[tuple]:
+    """Sum pytest's JUnit testsuite counts as (passed, failed, errors)."""
+    try:
+        root = ET.parse(path).getroot()
+    except (OSError, ET.ParseError):
+        return None
+    tests = failures = errors = skipped = 0
+    for suite in root.iter("testsuite"):
+        tests += int(suite.get("tests", 0))
+        failures += int(suite.get("failures", 0))
+        errors += int(suite.get("errors", 0))
+        skipped += int(suite.get("skipped", 0))
+    return tests - failures - errors - skipped, failures, errors
+
+
+def _report_pytest(success: bool, passed: int, failed: int, errors: int) -> bool:
+    """Print the pytest result line and return whether the run passed."""
     total = passed + failed
 
     if errors > 0:
@@ -204,6 +432,8 @@ def run_tests(
     skip_cpp: bool = False,
     skip_python: bool = False,
     source_dir: Path = None,
+    pytest_jobs: Optional[int] = None,
+    incremental: bool = False,
 ) -> bool:
     """
     Run trueform C++ and Python tests.
@@ -213,6 +443,9 @@ def run_tests(
         skip_cpp: Skip C++ tests
         skip_python: Skip Python tests
         source_dir: Source directory (defaults to parent of verify/)
+        pytest_jobs: pytest-xdist workers (default: all CPUs, 0 = serial)
+        incremental: Only re-run the tests that failed in the previous run,
+            or all of them if none did
 
     Returns True if all tests passed, False otherwise.
     """
@@ -235,26 +468,52 @@ def run_tests(
 
     cpp_passed = True
     python_passed = True
+    run_cpp = not skip_cpp and build_dir.exists()
+    run_python = not skip_python and venv_info is not None
+
+    # ctest and pytest use disjoint artifacts, so when both run they run
+    # side by side with the CPUs split between them. Each phase's report is
+    # buffered and printed in the usual order afterwards.
+    cpp_jobs = None
+    if run_cpp and run_python:
+        cpp_jobs = max(1, available_cpus() // 2)
+        if pytest_jobs is None:
+            pytest_jobs = cpp_jobs
+
+    with ThreadPoolExecutor(max_workers=2) as pool:
+        cpp_future = (
+            pool.submit(_buffered, run_cpp_tests, build_dir, cpp_jobs, incremental)
+            if run_cpp else None
+        )
+        python_future = (
+            pool.submit(
+                _buffered, run_python_tests, clone_dir, venv_info,
+                jobs=pytest_jobs, last_failed=incremental,
+            )
+            if run_python else None
+        )
 
-    # C++ tests
-    if skip_cpp:
-        print_step("C++ Tests")
-        print_skip("ctest", "skipped by user")
-    elif not build_dir.exists():
-        print_step("C++ Tests")
-        print_skip("ctest", "no build found")
-    else:
-        cpp_passed = run_cpp_tests(build_dir)
-
-    # Python tests
-    if skip_python:
-        print_step("Python Tests")
-        print_skip("pytest", "skipped by user")
-    elif not venv_info:
-        print_step("Python Tests")
-        print_skip("pytest", "no venv found")
-    else:
-        python_passed = run_python_tests(clone_dir, venv_info)
+        # C++ tests
+        if skip_cpp:
+            print_step("C++ Tests")
+            print_skip("ctest", "skipped by user")
+        elif not run_cpp:
+            print_step("C++ Tests")
+            print_skip("ctest", "no build found")
+        else:
+            cpp_passed, report = cpp_future.result()
+            print(report, end="")
+
+        # Python tests
+        if skip_python:
+            print_step("Python Tests")
+            print_skip("pytest", "skipped by user")
+        elif not run_python:
+            print_step("Python Tests")
+            print_skip("pytest", "no venv found")
+        else:
+            python_passed, report = python_future.result()
+            print(report, end="")
 
     print_step("Summary")
 
@@ -262,15 +521,15 @@ def run_tests(
 
     if not skip_cpp:
         if cpp_passed:
-            print(f"  {colored('[PASS]', Colors.GREEN)} C++ Tests")
+            print(f"  {_PASS_TAG} C++ Tests")
         else:
-            print(f"  {colored('[FAIL]', Colors.RED)} C++ Tests")
+            print(f"  {_FAIL_TAG} C++ Tests")
 
     if not skip_python:
         if python_passed:
-            print(f"  {colored('[PASS]', Colors.GREEN)} Python Tests")
+            print(f"  {_PASS_TAG} Python Tests")
         else:
-            print(f"  {colored('[FAIL]', Colors.RED)} Python Tests")
+            print(f"  {_FAIL_TAG} Python Tests")
 
     print()
     if all_passed:
@@ -302,12 +561,25 @@ def main() -> int:
         action="store_true",
         help="Skip Python tests",
     )
+    parser.add_argument(
+        "--pytest-jobs",
+        type=int,
+        default=None,
+        help="pytest-xdist workers (default: all CPUs, 0 = serial)",
+    )
+    parser.add_argument(
+        "--incremental",
+        action="store_true",
+        help="Only re-run the tests that failed last time (all if none did)",
+    )
     args = parser.parse_args()
 
     success = run_tests(
         work_dir=args.work_dir,
         skip_cpp=args.skip_cpp,
         skip_python=args.skip_python,
+        pytest_jobs=args.pytest_jobs,
+        incremental=args.incremental,
     )
 
     return 0 if success else 1